@@ -1,6 +1,8 @@
 from logging.config import fileConfig
 import sys
 import os
+import importlib
+import pkgutil
 
 from sqlalchemy import engine_from_config
 from sqlalchemy import pool
@@ -19,15 +21,12 @@ sys.path.insert(0, BASE_DIR)
 from app.config import settings
 from app.db import Base
 
-from app.models.user import User
-from app.models.wallet import Wallet
-from app.models.paper_order import PaperOrder
-from app.models.paper_position import PaperPosition
-from app.models.tournament import Tournament
-from app.models.tournament_participant import TournamentParticipant
-from app.models.tournament_ranking import TournamentRanking
-from app.models.prize_distribution import PrizeDistribution
-from app.models.user_settings import UserSettings
+import app.models
+
+# Import every model module so all tables are registered on Base.metadata,
+# including ones added later without touching this file
+for module_info in pkgutil.walk_packages(app.models.__path__, prefix="app.models."):
+    importlib.import_module(module_info.name)
 
 # Override database URL
 config.set_main_option("sqlalchemy.url", settings.DATABASE_URL)
@@ -52,22 +51,42 @@ def run_migrations_offline() -> None:
         context.run_migrations()
 
 
+def do_run_migrations(connection) -> None:
+    context.configure(
+        connection=connection,
+        target_metadata=target_metadata,
+    )
+
+    with context.begin_transaction():
+        context.run_migrations()
+
+
 def run_migrations_online() -> None:
+    # Programmatic callers can hand in an existing connection
+    # (config.attributes["connection"]) to skip connecting altogether
+    connection = config.attributes.get("connection")
+    if connection is not None:
+        do_run_migrations(connection)
+        return
+
+    # A single warm pooled connection is reused for the whole run
     connectable = engine_from_config(
         config.get_section(config.config_ini_section, {}),
         prefix="sqlalchemy.",
-        poolclass=pool.NullPool,
+        poolclass=pool.QueuePool,
+        pool_size=1,
+        max_overflow=0,
+        pool_pre_ping=True,
+        executemany_mode="values_plus_batch",
+        insertmanyvalues_page_size=1000,
+        executemany_batch_page_size=500,
     )
 
-    with connectable.connect() as connection:
-        context.configure(
-            connection=connection,
-            target_metadata=target_metadata,
-        )
-
-        with context.begin_transaction():
-            context.run_migrations()
-
+    try:
+        with connectable.connect() as connection:
+            do_run_migrations(connection)
+    finally:
+        connectable.dispose()
 
 if context.is_offline_mode():
     run_migrations_offline()
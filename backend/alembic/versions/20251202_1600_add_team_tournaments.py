@@ -18,7 +18,10 @@ depends_on = None
 
 def upgrade() -> None:
     # Add tournament_type and team_size to tournaments table
-    op.add_column('tournaments', sa.Column('tournament_type', sa.Enum('SOLO', 'TEAM', name='tournamenttype'), nullable=False, server_default='SOLO'))
+    # Enum-like columns are stored as VARCHAR + CHECK rather than native PG enums,
+    # so new values only need a constraint swap and no pg_enum catalog lookups.
+    op.add_column('tournaments', sa.Column('tournament_type', sa.String(length=16), nullable=False, server_default='SOLO'))
+    op.create_check_constraint('ck_tournament_type', 'tournaments', "tournament_type IN ('SOLO', 'TEAM')")
     op.add_column('tournaments', sa.Column('team_size', sa.Integer(), nullable=True))
     op.create_index(op.f('ix_tournaments_tournament_type'), 'tournaments', ['tournament_type'], unique=False)
     
@@ -48,13 +51,14 @@ def upgrade() -> None:
         sa.Column('id', sa.Integer(), nullable=False),
         sa.Column('team_id', sa.Integer(), nullable=False),
         sa.Column('user_id', sa.Integer(), nullable=False),
-        sa.Column('role', sa.Enum('CAPTAIN', 'MEMBER', name='memberrole'), nullable=False, server_default='MEMBER'),
+        sa.Column('role', sa.String(length=16), nullable=False, server_default='MEMBER'),
         sa.Column('is_active', sa.Boolean(), nullable=False, server_default='true'),
         sa.Column('joined_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
         sa.ForeignKeyConstraint(['team_id'], ['teams.id'], ondelete='CASCADE'),
         sa.ForeignKeyConstraint(['user_id'], ['users.id'], ondelete='CASCADE'),
         sa.PrimaryKeyConstraint('id'),
-        sa.UniqueConstraint('team_id', 'user_id', name='unique_team_user')
+        sa.UniqueConstraint('team_id', 'user_id', name='unique_team_user'),
+        sa.CheckConstraint("role IN ('CAPTAIN', 'MEMBER')", name='ck_member_role')
     )
     op.create_index(op.f('ix_team_members_id'), 'team_members', ['id'], unique=False)
     op.create_index(op.f('ix_team_members_team_id'), 'team_members', ['team_id'], unique=False)
@@ -90,8 +94,5 @@ def downgrade() -> None:
     # Remove tournament_type and team_size from tournaments
     op.drop_index(op.f('ix_tournaments_tournament_type'), table_name='tournaments')
     op.drop_column('tournaments', 'team_size')
+    op.drop_constraint('ck_tournament_type', 'tournaments', type_='check')
     op.drop_column('tournaments', 'tournament_type')
-    
-    # Drop enums
-    op.execute('DROP TYPE IF EXISTS memberrole')
-    op.execute('DROP TYPE IF EXISTS tournamenttype')
@@ -25,13 +25,24 @@ def upgrade():
         ['tournament_id'], ['id'],
         ondelete='CASCADE'
     )
-    op.create_index('ix_paper_orders_tournament_id', 'paper_orders', ['tournament_id'])
+    # Composite index matching per-user-in-tournament lookups (also serves tournament_id alone)
+    op.create_index('ix_paper_orders_tournament_user', 'paper_orders', ['tournament_id', 'user_id'])
     
     # Add additional tracking fields to paper_orders
     op.add_column('paper_orders', sa.Column('average_price', sa.Float(), nullable=True))
     op.add_column('paper_orders', sa.Column('filled_quantity', sa.Integer(), server_default='0', nullable=False))
     op.add_column('paper_orders', sa.Column('realized_pnl', sa.Float(), server_default='0.0', nullable=True))
     
+    # Covering partial index so executed-order P&L sums are index-only scans.
+    # Built inline: the table is already locked by the ALTERs above.
+    op.create_index(
+        'ix_paper_orders_tournament_user_executed',
+        'paper_orders',
+        ['tournament_id', 'user_id'],
+        postgresql_include=['realized_pnl'],
+        postgresql_where=sa.text("status = 'EXECUTED'")
+    )
+    
     # Add tournament_id to paper_positions
     op.add_column('paper_positions', sa.Column('tournament_id', sa.Integer(), nullable=True))
     op.create_foreign_key(
@@ -40,21 +51,22 @@ def upgrade():
         ['tournament_id'], ['id'],
         ondelete='CASCADE'
     )
-    op.create_index('ix_paper_positions_tournament_id', 'paper_positions', ['tournament_id'])
+    op.create_index('ix_paper_positions_tournament_user', 'paper_positions', ['tournament_id', 'user_id'])
 
 
 def downgrade():
     # Remove from paper_positions
-    op.drop_index('ix_paper_positions_tournament_id', 'paper_positions')
+    op.drop_index('ix_paper_positions_tournament_user', 'paper_positions')
     op.drop_constraint('fk_paper_positions_tournament_id', 'paper_positions', type_='foreignkey')
     op.drop_column('paper_positions', 'tournament_id')
     
     # Remove additional fields from paper_orders
+    op.drop_index('ix_paper_orders_tournament_user_executed', 'paper_orders')
     op.drop_column('paper_orders', 'realized_pnl')
     op.drop_column('paper_orders', 'filled_quantity')
     op.drop_column('paper_orders', 'average_price')
     
     # Remove from paper_orders
-    op.drop_index('ix_paper_orders_tournament_id', 'paper_orders')
+    op.drop_index('ix_paper_orders_tournament_user', 'paper_orders')
     op.drop_constraint('fk_paper_orders_tournament_id', 'paper_orders', type_='foreignkey')
     op.drop_column('paper_orders', 'tournament_id')
@@ -17,18 +17,20 @@ depends_on = None
 
 
 def upgrade():
-    # Add new fields to tournament_participants
-    op.add_column('tournament_participants', sa.Column('initial_balance', sa.Float(), nullable=True))
+    # Add new fields to tournament_participants.
+    # initial_balance is added NOT NULL with a constant default, which is a
+    # metadata-only change on PostgreSQL 11+, so the table is not rewritten
+    # and no separate ALTER ... SET NOT NULL scan is needed afterwards.
+    op.add_column('tournament_participants', sa.Column('initial_balance', sa.Float(), server_default='0', nullable=False))
     op.add_column('tournament_participants', sa.Column('pnl', sa.Float(), server_default='0.0', nullable=False))
     op.add_column('tournament_participants', sa.Column('rank', sa.Integer(), nullable=True))
     op.add_column('tournament_participants', sa.Column('is_active', sa.Boolean(), server_default='true', nullable=False))
     
     # Populate initial_balance from starting_balance for existing records
-    op.execute('UPDATE tournament_participants SET initial_balance = starting_balance WHERE initial_balance IS NULL')
+    op.execute('UPDATE tournament_participants SET initial_balance = starting_balance')
     
-    # Make initial_balance non-nullable after populating
-    op.alter_column('tournament_participants', 'initial_balance', nullable=False)
-
+    # The ORM always supplies initial_balance, so drop the placeholder default (catalog-only)
+    op.alter_column('tournament_participants', 'initial_balance', server_default=None)
 
 def downgrade():
     # Remove added fields
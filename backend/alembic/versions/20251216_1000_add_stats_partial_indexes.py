@@ -0,0 +1,41 @@
+"""add partial indexes for platform stats counts
+
+Revision ID: add_stats_partial_indexes
+Revises: add_participant_fields
+Create Date: 2025-12-16 10:00:00
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = 'add_stats_partial_indexes'
+down_revision = 'add_participant_fields'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Partial indexes matching the /stats and dashboard filters so counts
+    # can be answered with index-only scans. CONCURRENTLY cannot run inside
+    # a transaction block, hence the autocommit block.
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_users_active "
+            "ON users (id) WHERE is_active"
+        )
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_tournaments_open_active "
+            "ON tournaments (id) WHERE status IN ('REGISTRATION_OPEN', 'ACTIVE')"
+        )
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_paper_orders_executed "
+            "ON paper_orders (id) WHERE status = 'EXECUTED'"
+        )
+
+
+def downgrade():
+    with op.get_context().autocommit_block():
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_paper_orders_executed")
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_tournaments_open_active")
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_users_active")
@@ -0,0 +1,37 @@
+"""add generated is_live column to tournaments
+
+Revision ID: add_tournament_is_live
+Revises: add_stats_partial_indexes
+Create Date: 2025-12-16 10:30:00
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = 'add_tournament_is_live'
+down_revision = 'add_stats_partial_indexes'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Stored boolean derived from status so "open or active" counts compare a
+    # single byte instead of evaluating an IN list over the status column
+    op.execute(
+        "ALTER TABLE tournaments ADD COLUMN is_live boolean "
+        "GENERATED ALWAYS AS (status IN ('REGISTRATION_OPEN', 'ACTIVE')) STORED"
+    )
+    op.execute("CREATE INDEX ix_tournaments_is_live ON tournaments (is_live) WHERE is_live")
+    
+    # Superseded by ix_tournaments_is_live
+    op.execute("DROP INDEX IF EXISTS ix_tournaments_open_active")
+
+
+def downgrade():
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS ix_tournaments_open_active "
+        "ON tournaments (id) WHERE status IN ('REGISTRATION_OPEN', 'ACTIVE')"
+    )
+    op.execute("DROP INDEX IF EXISTS ix_tournaments_is_live")
+    op.drop_column('tournaments', 'is_live')
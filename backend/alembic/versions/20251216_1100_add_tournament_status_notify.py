@@ -0,0 +1,43 @@
+"""notify tournament status changes
+
+Revision ID: add_tournament_status_notify
+Revises: add_tournament_is_live
+Create Date: 2025-12-16 11:00:00
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = 'add_tournament_status_notify'
+down_revision = 'add_tournament_is_live'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Publish "<id>:<status>" on the tournament_status channel so app
+    # processes can keep their live-tournament cache in sync. op.execute
+    # binds ":name" parameters, so the literal colon is escaped.
+    op.execute(r"""
+        CREATE OR REPLACE FUNCTION notify_tournament_status() RETURNS trigger AS $$
+        BEGIN
+            IF TG_OP = 'DELETE' THEN
+                PERFORM pg_notify('tournament_status', OLD.id::text || '\:DELETED');
+                RETURN OLD;
+            END IF;
+            PERFORM pg_notify('tournament_status', NEW.id::text || ':' || NEW.status::text);
+            RETURN NEW;
+        END;
+        $$ LANGUAGE plpgsql
+    """)
+    op.execute("""
+        CREATE TRIGGER tournaments_status_notify
+        AFTER INSERT OR DELETE OR UPDATE OF status ON tournaments
+        FOR EACH ROW EXECUTE FUNCTION notify_tournament_status()
+    """)
+
+
+def downgrade():
+    op.execute("DROP TRIGGER IF EXISTS tournaments_status_notify ON tournaments")
+    op.execute("DROP FUNCTION IF EXISTS notify_tournament_status()")
@@ -0,0 +1,48 @@
+"""add user performance materialized view
+
+Revision ID: add_mv_user_performance
+Revises: add_tournament_status_notify
+Create Date: 2025-12-16 11:30:00
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = 'add_mv_user_performance'
+down_revision = 'add_tournament_status_notify'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Per-user tournament performance, refreshed when tournaments end
+    op.execute("""
+        CREATE MATERIALIZED VIEW mv_user_performance AS
+        SELECT
+            tp.user_id,
+            u.username,
+            u.email,
+            SUM(tp.total_pnl) AS pnl,
+            AVG(CASE WHEN tp.total_trades > 0
+                     THEN tp.winning_trades * 100.0 / tp.total_trades
+                     ELSE 0 END) AS win_rate,
+            AVG(CASE WHEN tp.starting_balance <> 0
+                     THEN tp.total_pnl * 100.0 / tp.starting_balance
+                     ELSE 0 END) AS roi,
+            SUM(tp.total_trades) AS trades,
+            COUNT(tp.id) AS tournaments_joined
+        FROM tournament_participants tp
+        JOIN users u ON u.id = tp.user_id
+        GROUP BY tp.user_id, u.username, u.email
+    """)
+    # Unique index is required for REFRESH ... CONCURRENTLY
+    op.execute("CREATE UNIQUE INDEX ix_mv_user_performance_user_id ON mv_user_performance (user_id)")
+    op.execute("CREATE INDEX ix_mv_user_performance_pnl ON mv_user_performance (pnl DESC)")
+    op.execute("CREATE INDEX ix_mv_user_performance_win_rate ON mv_user_performance (win_rate DESC)")
+    op.execute("CREATE INDEX ix_mv_user_performance_roi ON mv_user_performance (roi DESC)")
+    op.execute("CREATE INDEX ix_mv_user_performance_trades ON mv_user_performance (trades DESC)")
+
+
+def downgrade():
+    op.execute("DROP MATERIALIZED VIEW IF EXISTS mv_user_performance")
@@ -0,0 +1,32 @@
+"""add team_size check constraint
+
+Revision ID: add_team_size_check
+Revises: add_mv_user_performance
+Create Date: 2025-12-16 12:00:00
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = 'add_team_size_check'
+down_revision = 'add_mv_user_performance'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # SOLO tournaments never use team_size; clear any stray values first
+    op.execute("UPDATE tournaments SET team_size = NULL WHERE tournament_type = 'SOLO' AND team_size IS NOT NULL")
+    
+    # Same bounds as TournamentCreate.team_size
+    op.create_check_constraint(
+        'ck_tournaments_team_size',
+        'tournaments',
+        "(tournament_type = 'SOLO' AND team_size IS NULL) OR "
+        "(tournament_type = 'TEAM' AND team_size BETWEEN 2 AND 10)"
+    )
+
+
+def downgrade():
+    op.drop_constraint('ck_tournaments_team_size', 'tournaments', type_='check')
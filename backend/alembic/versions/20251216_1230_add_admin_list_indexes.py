@@ -0,0 +1,56 @@
+"""add indexes for admin list filters and search
+
+Revision ID: add_admin_list_indexes
+Revises: add_team_size_check
+Create Date: 2025-12-16 12:30:00
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = 'add_admin_list_indexes'
+down_revision = 'add_team_size_check'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Trigram GIN indexes let the admin user search (ILIKE '%term%') use
+    # an index instead of scanning every row
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    
+    with op.get_context().autocommit_block():
+        # Admin tournament list: status filter, date range filters and
+        # newest-first ordering
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_tournaments_status_start_end "
+            "ON tournaments (status, start_date, end_date)"
+        )
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_tournaments_created_at_desc "
+            "ON tournaments (created_at DESC)"
+        )
+        
+        # Admin user list: is_active / is_admin filters, newest-first by id
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_users_active_admin_id "
+            "ON users (is_active, is_admin, id DESC)"
+        )
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_users_email_trgm "
+            "ON users USING gin (email gin_trgm_ops)"
+        )
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_users_username_trgm "
+            "ON users USING gin (username gin_trgm_ops)"
+        )
+
+
+def downgrade():
+    with op.get_context().autocommit_block():
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_users_username_trgm")
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_users_email_trgm")
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_users_active_admin_id")
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_tournaments_created_at_desc")
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_tournaments_status_start_end")
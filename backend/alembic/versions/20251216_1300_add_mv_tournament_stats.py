@@ -0,0 +1,63 @@
+"""add tournament stats materialized view
+
+Revision ID: add_mv_tournament_stats
+Revises: add_admin_list_indexes
+Create Date: 2025-12-16 13:00:00
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = 'add_mv_tournament_stats'
+down_revision = 'add_admin_list_indexes'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Per-tournament participation and performance aggregates behind the
+    # admin tournament analytics view, refreshed every minute by the app
+    op.execute("""
+        CREATE MATERIALIZED VIEW mv_tournament_stats AS
+        SELECT
+            t.id AS tournament_id,
+            COALESCE(p.total_participants, 0) AS total_participants,
+            COALESCE(p.active_participants, 0) AS active_participants,
+            COALESCE(p.total_trades, 0) AS total_trades,
+            COALESCE(o.total_volume, 0) AS total_volume,
+            COALESCE(p.total_pnl, 0) AS total_pnl,
+            COALESCE(p.top_pnl, 0) AS top_pnl,
+            COALESCE(p.worst_pnl, 0) AS worst_pnl,
+            COALESCE(p.profitable_participants, 0) AS profitable_participants,
+            COALESCE(p.losing_participants, 0) AS losing_participants,
+            COALESCE(p.break_even_participants, 0) AS break_even_participants
+        FROM tournaments t
+        LEFT JOIN (
+            SELECT
+                tournament_id,
+                COUNT(*) AS total_participants,
+                COUNT(*) FILTER (WHERE total_trades > 0) AS active_participants,
+                SUM(total_trades) AS total_trades,
+                SUM(total_pnl) AS total_pnl,
+                MAX(total_pnl) AS top_pnl,
+                MIN(total_pnl) AS worst_pnl,
+                COUNT(*) FILTER (WHERE total_pnl > 0) AS profitable_participants,
+                COUNT(*) FILTER (WHERE total_pnl < 0) AS losing_participants,
+                COUNT(*) FILTER (WHERE total_pnl = 0) AS break_even_participants
+            FROM tournament_participants
+            GROUP BY tournament_id
+        ) p ON p.tournament_id = t.id
+        LEFT JOIN (
+            SELECT tournament_id, SUM(quantity * price) AS total_volume
+            FROM paper_orders
+            WHERE status = 'EXECUTED' AND tournament_id IS NOT NULL
+            GROUP BY tournament_id
+        ) o ON o.tournament_id = t.id
+    """)
+    # Unique index is required for REFRESH ... CONCURRENTLY
+    op.execute("CREATE UNIQUE INDEX ix_mv_tournament_stats_tournament_id ON mv_tournament_stats (tournament_id)")
+
+
+def downgrade():
+    op.execute("DROP MATERIALIZED VIEW IF EXISTS mv_tournament_stats")
@@ -0,0 +1,25 @@
+"""add hash chain column to admin actions
+
+Revision ID: add_admin_action_chain_hash
+Revises: add_mv_tournament_stats
+Create Date: 2025-12-16 13:30:00
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'add_admin_action_chain_hash'
+down_revision = 'add_mv_tournament_stats'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Existing rows stay unchained; the chain starts with the next entry
+    op.add_column('admin_actions', sa.Column('chain_hash', sa.LargeBinary(length=32), nullable=True))
+
+
+def downgrade():
+    op.drop_column('admin_actions', 'chain_hash')
@@ -0,0 +1,29 @@
+"""add keyset pagination index on admin actions
+
+Revision ID: add_admin_actions_keyset_index
+Revises: add_admin_action_chain_hash
+Create Date: 2025-12-16 14:00:00
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = 'add_admin_actions_keyset_index'
+down_revision = 'add_admin_action_chain_hash'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Matches the audit log sort so (created_at, id) < cursor is an index seek
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_admin_actions_created_at_id "
+            "ON admin_actions (created_at DESC, id DESC)"
+        )
+
+
+def downgrade():
+    with op.get_context().autocommit_block():
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_admin_actions_created_at_id")
@@ -0,0 +1,30 @@
+"""add order history index on paper orders
+
+Revision ID: add_paper_orders_user_created
+Revises: add_admin_actions_keyset_index
+Create Date: 2025-12-16 14:30:00
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = 'add_paper_orders_user_created'
+down_revision = 'add_admin_actions_keyset_index'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # A user's latest orders are read straight off the index instead of
+    # sorting all of their orders
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_paper_orders_user_created "
+            "ON paper_orders (user_id, created_at DESC)"
+        )
+
+
+def downgrade():
+    with op.get_context().autocommit_block():
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_paper_orders_user_created")
@@ -0,0 +1,33 @@
+"""add journal entry id to admin actions
+
+Revision ID: add_admin_actions_journal_id
+Revises: add_paper_orders_user_created
+Create Date: 2025-12-16 15:00:00
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'add_admin_actions_journal_id'
+down_revision = 'add_paper_orders_user_created'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Replaying the audit journal skips entries already written under the
+    # same stream ID; existing rows have none
+    op.add_column('admin_actions', sa.Column('journal_id', sa.String(length=64), nullable=True))
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE UNIQUE INDEX CONCURRENTLY IF NOT EXISTS ux_admin_actions_journal_id "
+            "ON admin_actions (journal_id)"
+        )
+
+
+def downgrade():
+    with op.get_context().autocommit_block():
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ux_admin_actions_journal_id")
+    op.drop_column('admin_actions', 'journal_id')
@@ -2,12 +2,23 @@
 Admin API routes for tournament and user management.
 """
 
-from fastapi import APIRouter, Depends, HTTPException, status, Query, Request
-from sqlalchemy.orm import Session
-from sqlalchemy import func
-from typing import List, Optional
+import asyncio
+import base64
+import time
+from datetime import datetime, timezone
 
-from app.db import get_db
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Request
+from fastapi.concurrency import run_in_threadpool
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import Response, StreamingResponse
+from pydantic import TypeAdapter
+from sqlalchemy.orm import Session, raiseload
+from sqlalchemy.orm.attributes import set_committed_value
+from sqlalchemy import func, select, true, update, delete, tuple_
+from sqlalchemy.exc import SQLAlchemyError
+from typing import List, Optional, Tuple
+
+from app.db import get_db, SessionLocal
 from app.schemas.tournament import TournamentCreate, TournamentUpdate, TournamentResponse
 from app.schemas.user import UserResponse
 from app.schemas.admin import (
@@ -25,6 +36,7 @@ from app.schemas.admin import (
     BulkNotificationResponse,
     ExportDataRequest,
     ExportDataResponse,
+    AdminActionResponse,
     AdminActionListResponse,
     UserDetailResponse,
     UserListResponse,
@@ -34,18 +46,61 @@ from app.schemas.admin import (
     AddParticipantRequest,
     AddParticipantResponse
 )
-from app.services.tournament_service import TournamentService
+from app.services.tournament_service import TournamentService, TournamentBusyError, TOURNAMENT_LIST_GENERATION
 from app.services.admin_service import AdminService
+from app.services.auth_service import AuthService
 from app.services.analytics_service import AnalyticsService
 from app.api.dependencies import get_current_admin_user
 from app.models.user import User
 from app.models.tournament import Tournament, TournamentStatus
+from app.models.tournament_participant import TournamentParticipant
+from app.models.paper_order import PaperOrder, OrderStatus
+from app.models.wallet import Wallet
 from app.models.admin_action import AdminAction
+from app.utils.cache import (
+    cache_get,
+    cache_set,
+    cache_response,
+    cache_swr,
+    invalidate,
+    get_generation,
+    bump_generation
+)
 from app.utils.logger import setup_logger
 
 logger = setup_logger(__name__)
 router = APIRouter()
 
+# Redis key for the legacy /stats payload; dropped on mutations that change it
+PLATFORM_STATS_CACHE_KEY = "admin:platform_stats"
+
+# Admin tournament list pages, keyed on TOURNAMENT_LIST_GENERATION; the TTL
+# bounds staleness of the time-based status
+TOURNAMENT_LIST_CACHE_TTL = 10
+# Last good page per filter, served if the database query fails
+TOURNAMENT_LIST_STALE_TTL = 300
+
+# Short-lived cache for the dashboard overview, shared by all admins
+DASHBOARD_OVERVIEW_TTL = 5.0
+_overview_cache = {"t": 0.0, "v": None}
+_overview_lock = asyncio.Lock()
+
+# Prebuilt serializers for the user list endpoints
+_user_adapter = TypeAdapter(UserResponse)
+_user_list_adapter = TypeAdapter(UserListResponse)
+
+
+def _drop_tournament_caches():
+    """Invalidate cached platform stats and tournament list pages."""
+    invalidate(PLATFORM_STATS_CACHE_KEY)
+    bump_generation(TOURNAMENT_LIST_GENERATION)
+
+
+def _drop_user_caches(user_id: int):
+    """Invalidate a user's cached row and the cached platform stats."""
+    AuthService.forget_user(user_id)
+    invalidate(PLATFORM_STATS_CACHE_KEY)
+
 
 # ============================================================================
 # Dashboard Endpoints
@@ -63,7 +118,15 @@ async def get_dashboard_overview(
     revenue, and other key metrics.
     """
     service = AdminService(db)
-    overview = service.get_dashboard_overview()
+    overview = _overview_cache["v"]
+    
+    if overview is None or time.monotonic() - _overview_cache["t"] >= DASHBOARD_OVERVIEW_TTL:
+        async with _overview_lock:
+            # Another request may have refreshed it while we waited
+            if _overview_cache["v"] is None or time.monotonic() - _overview_cache["t"] >= DASHBOARD_OVERVIEW_TTL:
+                _overview_cache["v"] = service.get_dashboard_overview()
+                _overview_cache["t"] = time.monotonic()
+            overview = _overview_cache["v"]
     
     # Log admin action
     service.log_admin_action(
@@ -80,16 +143,18 @@ async def get_dashboard_overview(
 async def get_recent_activity(
     limit: int = Query(50, ge=1, le=200),
     offset: int = Query(0, ge=0),
+    before_id: Optional[int] = Query(None, description="Keyset cursor from next_cursor"),
     current_user: User = Depends(get_current_admin_user),
     db: Session = Depends(get_db)
 ):
     """
     Get recent platform activity.
     
-    Returns recent admin actions and platform events.
+    Returns recent admin actions and platform events. Prefer ``before_id``
+    over ``offset`` for paging; it seeks on the primary key.
     """
     service = AdminService(db)
-    activity = service.get_recent_activity(limit=limit, offset=offset)
+    activity = service.get_recent_activity(limit=limit, offset=offset, before_id=before_id)
     return activity
 
 
@@ -135,6 +200,7 @@ async def create_tournament(
     admin_service = AdminService(db)
     
     tournament = service.create_tournament(tournament_data, current_user.id)
+    await run_in_threadpool(_drop_tournament_caches)
     
     # Log admin action
     admin_service.log_admin_action(
@@ -151,7 +217,7 @@ async def create_tournament(
 
 
 @router.get("/tournaments", response_model=List[TournamentResponse])
-async def get_all_tournaments(
+def get_all_tournaments(
     status_filter: Optional[str] = Query(None),
     limit: int = Query(100, ge=1, le=500),
     offset: int = Query(0, ge=0),
@@ -160,25 +226,40 @@ async def get_all_tournaments(
 ):
     """
     Get all tournaments with optional filters (uses real-time status calculation).
+    
+    Pages are cached for a few seconds, since admin UIs poll this list. If
+    the database query fails, the last page served for the same filters is
+    returned instead, for up to TOURNAMENT_LIST_STALE_TTL seconds.
     """
-    from datetime import datetime, timezone
+    generation = get_generation(TOURNAMENT_LIST_GENERATION)
+    cache_key = stale_key = None
+    if generation is not None:
+        page_key = f"{status_filter}:{limit}:{offset}"
+        cache_key = f"admin:{TOURNAMENT_LIST_GENERATION}:{generation}:{page_key}"
+        stale_key = f"admin:{TOURNAMENT_LIST_GENERATION}:stale:{page_key}"
+        cached = cache_get(cache_key)
+        if cached is not None:
+            return cached
     
     now = datetime.now(timezone.utc)
-    query = db.query(Tournament)
+    # 2.0-style select: every value below (now, status, limit, offset) is a
+    # bound parameter, so each filter shape compiles once and is then
+    # served from the engine's compiled cache
+    stmt = select(Tournament, Tournament.effective_status(now).label("effective_status"))
     
     # Apply time-based filtering like the public API
     if status_filter:
         if status_filter == 'UPCOMING':
-            query = query.filter(Tournament.start_date > now)
+            stmt = stmt.where(Tournament.start_date > now)
         elif status_filter == 'ACTIVE':
-            query = query.filter(
+            stmt = stmt.where(
                 Tournament.start_date <= now,
                 Tournament.end_date > now
             )
         elif status_filter == 'COMPLETED':
-            query = query.filter(Tournament.end_date <= now)
+            stmt = stmt.where(Tournament.end_date <= now)
         elif status_filter == 'REGISTRATION_OPEN':
-            query = query.filter(
+            stmt = stmt.where(
                 Tournament.registration_deadline > now,
                 Tournament.start_date > now
             )
@@ -186,26 +267,32 @@ async def get_all_tournaments(
             # For other statuses, use the database status field
             try:
                 status_enum = TournamentStatus(status_filter)
-                query = query.filter(Tournament.status == status_enum)
+                stmt = stmt.where(Tournament.status == status_enum)
             except ValueError:
                 raise HTTPException(
                     status_code=status.HTTP_400_BAD_REQUEST,
                     detail=f"Invalid status: {status_filter}"
                 )
     
-    tournaments = query.order_by(Tournament.created_at.desc()).limit(limit).offset(offset).all()
-    
-    # Update status for each tournament based on current time
-    for tournament in tournaments:
-        if now >= tournament.end_date:
-            tournament.status = TournamentStatus.COMPLETED
-        elif now >= tournament.start_date and now < tournament.end_date:
-            tournament.status = TournamentStatus.ACTIVE
-        elif now < tournament.registration_deadline:
-            tournament.status = TournamentStatus.REGISTRATION_OPEN
-        else:
-            tournament.status = TournamentStatus.UPCOMING
-    
+    try:
+        rows = db.execute(stmt.order_by(Tournament.created_at.desc()).limit(limit).offset(offset)).all()
+    except SQLAlchemyError as e:
+        stale = cache_get(stale_key) if stale_key is not None else None
+        if stale is None:
+            raise
+        logger.warning(f"Serving stale admin tournament list after database error: {e}")
+        return stale
+    
+    # Status is computed by the database; load it as committed state so the
+    # instances are not marked dirty
+    tournaments = []
+    for tournament, effective_status in rows:
+        set_committed_value(tournament, "status", TournamentStatus(effective_status))
+        tournaments.append(TournamentResponse.model_validate(tournament).model_dump(mode="json"))
+    
+    if cache_key is not None:
+        cache_set(cache_key, tournaments, TOURNAMENT_LIST_CACHE_TTL)
+        cache_set(stale_key, tournaments, TOURNAMENT_LIST_STALE_TTL)
     return tournaments
 
 
@@ -218,7 +305,9 @@ async def get_tournament_details(
     """
     Get detailed tournament information.
     """
-    tournament = db.query(Tournament).filter(Tournament.id == tournament_id).first()
+    # TournamentResponse has no nested relations; raiseload keeps it to
+    # this one SELECT by failing loudly if serialization ever lazy-loads
+    tournament = db.get(Tournament, tournament_id, options=[raiseload("*")])
     
     if not tournament:
         raise HTTPException(
@@ -250,6 +339,7 @@ async def update_tournament(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Tournament not found"
         )
+    await run_in_threadpool(bump_generation, TOURNAMENT_LIST_GENERATION)
     
     # Log admin action
     admin_service.log_admin_action(
@@ -258,7 +348,7 @@ async def update_tournament(
         target_type="TOURNAMENT",
         target_id=tournament_id,
         description=f"Updated tournament '{tournament.name}'",
-        action_metadata={"tournament_id": tournament_id, "updates": update_data.dict(exclude_unset=True)},
+        action_metadata={"tournament_id": tournament_id, "updates": update_data.model_dump(mode="json", exclude_unset=True)},
         ip_address=request.client.host if request.client else None
     )
     
@@ -278,13 +368,20 @@ async def start_tournament(
     service = TournamentService(db)
     admin_service = AdminService(db)
     
-    success = service.start_tournament(tournament_id)
+    try:
+        success = service.start_tournament(tournament_id)
+    except TournamentBusyError as e:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=str(e)
+        )
     
     if not success:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Tournament not found"
         )
+    await run_in_threadpool(_drop_tournament_caches)
     
     # Log admin action
     admin_service.log_admin_action(
@@ -312,13 +409,20 @@ async def end_tournament(
     service = TournamentService(db)
     admin_service = AdminService(db)
     
-    success = service.end_tournament(tournament_id)
+    try:
+        success = service.end_tournament(tournament_id)
+    except TournamentBusyError as e:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=str(e)
+        )
     
     if not success:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Tournament not found"
         )
+    await run_in_threadpool(_drop_tournament_caches)
     
     # Log admin action
     admin_service.log_admin_action(
@@ -344,17 +448,24 @@ async def delete_tournament(
     Delete a tournament (Admin only).
     """
     admin_service = AdminService(db)
-    tournament = db.query(Tournament).filter(Tournament.id == tournament_id).first()
     
-    if not tournament:
+    # Child rows are removed by ON DELETE CASCADE, so no ORM load is needed
+    deleted = db.execute(
+        delete(Tournament)
+        .where(Tournament.id == tournament_id)
+        .returning(Tournament.name)
+        .execution_options(synchronize_session=False)
+    ).first()
+    
+    if not deleted:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Tournament not found"
         )
     
-    tournament_name = tournament.name
-    db.delete(tournament)
     db.commit()
+    await run_in_threadpool(_drop_tournament_caches)
+    tournament_name = deleted.name
     
     # Log admin action
     admin_service.log_admin_action(
@@ -456,14 +567,14 @@ async def add_participant(
     """
     service = AdminService(db)
     
-    participant = service.add_participant_to_tournament(
+    participant_id = service.add_participant_to_tournament(
         tournament_id=tournament_id,
         user_id=add_data.user_id,
         admin_user_id=current_user.id,
         starting_balance=add_data.starting_balance
     )
     
-    if not participant:
+    if participant_id is None:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Failed to add participant. Tournament or user not found, or user already participating."
@@ -472,7 +583,7 @@ async def add_participant(
     return AddParticipantResponse(
         success=True,
         message=f"Participant {add_data.user_id} added to tournament {tournament_id}",
-        participant_id=participant.id
+        participant_id=participant_id
     )
 
 
@@ -480,21 +591,13 @@ async def add_participant(
 # User Management Endpoints
 # ============================================================================
 
-@router.get("/users", response_model=UserListResponse)
-async def get_all_users(
-    limit: int = Query(100, ge=1, le=500),
-    offset: int = Query(0, ge=0),
-    is_active: Optional[bool] = Query(None),
-    is_admin: Optional[bool] = Query(None),
-    search: Optional[str] = Query(None),
-    current_user: User = Depends(get_current_admin_user),
-    db: Session = Depends(get_db)
+def _filter_users(
+    query,
+    is_active: Optional[bool] = None,
+    is_admin: Optional[bool] = None,
+    search: Optional[str] = None
 ):
-    """
-    Get all users with optional filters.
-    """
-    query = db.query(User)
-    
+    """Apply the admin user list filters to a User query."""
     if is_active is not None:
         query = query.filter(User.is_active == is_active)
     
@@ -507,45 +610,139 @@ async def get_all_users(
             (User.email.ilike(search_pattern)) | (User.username.ilike(search_pattern))
         )
     
-    total_count = query.count()
-    users = query.order_by(User.created_at.desc()).limit(limit).offset(offset).all()
+    return query
+
+
+def _update_user(db: Session, user_id: int, **values):
+    """
+    Update a user in one UPDATE ... RETURNING statement.
     
-    # Get additional stats for each user
-    user_details = []
-    for user in users:
-        from app.models.wallet import Wallet
-        from app.models.tournament_participant import TournamentParticipant
-        from app.models.paper_order import PaperOrder
-        
-        wallet = db.query(Wallet).filter(Wallet.user_id == user.id).first()
-        tournaments_joined = db.query(TournamentParticipant).filter(
-            TournamentParticipant.user_id == user.id
-        ).count()
-        total_trades = db.query(PaperOrder).filter(PaperOrder.user_id == user.id).count()
-        total_pnl = db.query(func.sum(TournamentParticipant.total_pnl)).filter(
-            TournamentParticipant.user_id == user.id
-        ).scalar() or 0.0
-        
-        user_details.append(UserDetailResponse(
-            id=user.id,
-            email=user.email,
-            username=user.username,
-            is_active=user.is_active,
-            is_admin=user.is_admin,
-            created_at=user.created_at,
-            updated_at=user.updated_at,
-            current_balance=wallet.balance if wallet else 0.0,
-            tournaments_joined=tournaments_joined,
-            total_trades=total_trades,
-            total_pnl=total_pnl
-        ))
-    
-    return UserListResponse(
+    Returns:
+        Row with id and username, or None if the user does not exist
+    """
+    return db.execute(
+        update(User)
+        .where(User.id == user_id)
+        .values(**values)
+        .returning(User.id, User.username)
+        .execution_options(synchronize_session=False)
+    ).first()
+
+
+@router.get("/users", response_model=UserListResponse)
+def get_all_users(
+    limit: int = Query(100, ge=1, le=500),
+    offset: int = Query(0, ge=0),
+    before_id: Optional[int] = Query(None, description="Keyset cursor: return users with id below this"),
+    is_active: Optional[bool] = Query(None),
+    is_admin: Optional[bool] = Query(None),
+    search: Optional[str] = Query(None),
+    current_user: User = Depends(get_current_admin_user),
+    db: Session = Depends(get_db)
+):
+    """
+    Get all users with optional filters.
+    
+    Newest users first. Pass ``next_cursor`` (the last returned id) as
+    ``before_id`` to page with an index seek instead of ``offset``.
+    """
+    # Page of user ids plus the filtered total, in the same statement
+    if before_id is not None:
+        # The cursor filter would hide earlier rows from a window count
+        total = _filter_users(
+            select(func.count(User.id)), is_active, is_admin, search
+        ).correlate(None).scalar_subquery()
+        page = _filter_users(db.query(User.id.label("id"), total.label("total_count")), is_active, is_admin, search)
+        page = page.filter(User.id < before_id).order_by(User.id.desc()).limit(limit)
+    else:
+        page = _filter_users(
+            db.query(User.id.label("id"), func.count().over().label("total_count")),
+            is_active, is_admin, search
+        ).order_by(User.id.desc()).limit(limit).offset(offset)
+    page = page.subquery()
+    
+    # Per-user stats as correlated subqueries, evaluated only for the page rows
+    balance = select(Wallet.balance).where(Wallet.user_id == User.id).limit(1).scalar_subquery()
+    tournaments_joined = select(func.count(TournamentParticipant.id)).where(
+        TournamentParticipant.user_id == User.id
+    ).scalar_subquery()
+    total_trades = select(func.count(PaperOrder.id)).where(PaperOrder.user_id == User.id).scalar_subquery()
+    total_pnl = select(func.coalesce(func.sum(TournamentParticipant.total_pnl), 0.0)).where(
+        TournamentParticipant.user_id == User.id
+    ).scalar_subquery()
+    
+    rows = db.query(
+        User,
+        page.c.total_count,
+        balance.label("current_balance"),
+        tournaments_joined.label("tournaments_joined"),
+        total_trades.label("total_trades"),
+        total_pnl.label("total_pnl")
+    ).join(page, page.c.id == User.id).order_by(User.id.desc()).all()
+    
+    if rows:
+        total_count = rows[0].total_count
+    elif offset or before_id is not None:
+        # Past the last page; the total has no row to ride on
+        total_count = _filter_users(db.query(User), is_active, is_admin, search).count()
+    else:
+        total_count = 0
+    
+    user_details = [
+        UserDetailResponse(
+            id=row.User.id,
+            email=row.User.email,
+            username=row.User.username,
+            is_active=row.User.is_active,
+            is_admin=row.User.is_admin,
+            created_at=row.User.created_at,
+            updated_at=row.User.updated_at,
+            current_balance=row.current_balance or 0.0,
+            tournaments_joined=row.tournaments_joined,
+            total_trades=row.total_trades,
+            total_pnl=row.total_pnl or 0.0
+        )
+        for row in rows
+    ]
+    
+    # Serialize directly; response_model is kept for the OpenAPI schema only
+    user_list = UserListResponse(
         users=user_details,
         total_count=total_count,
         page=offset // limit + 1 if limit > 0 else 1,
-        page_size=limit
+        page_size=limit,
+        next_cursor=rows[-1].User.id if len(rows) == limit else None
     )
+    return Response(content=_user_list_adapter.dump_json(user_list), media_type="application/json")
+
+
+@router.get("/users/stream")
+async def stream_users(
+    limit: int = Query(100, ge=1, le=1000),
+    after_id: Optional[int] = Query(None, description="Keyset cursor: return users with id above this"),
+    is_active: Optional[bool] = Query(None),
+    is_admin: Optional[bool] = Query(None),
+    search: Optional[str] = Query(None),
+    current_user: User = Depends(get_current_admin_user),
+    db: Session = Depends(get_db)
+):
+    """
+    Stream users as newline-delimited JSON (Admin only).
+    
+    Rows are fetched in chunks and written one per line, so memory stays
+    flat regardless of page size. Pass the last returned id as ``after_id``
+    to fetch the next page.
+    """
+    query = _filter_users(db.query(User), is_active, is_admin, search)
+    if after_id is not None:
+        query = query.filter(User.id > after_id)
+    query = query.order_by(User.id).limit(limit).yield_per(500)
+    
+    def generate():
+        for user in query:
+            yield _user_adapter.dump_json(_user_adapter.validate_python(user, from_attributes=True)) + b"\n"
+    
+    return StreamingResponse(generate(), media_type="application/x-ndjson")
 
 
 @router.get("/users/{user_id}", response_model=UserAnalyticsResponse)
@@ -594,7 +791,7 @@ async def activate_user(
     Activate a user account (Admin only).
     """
     admin_service = AdminService(db)
-    user = db.query(User).filter(User.id == user_id).first()
+    user = _update_user(db, user_id, is_active=True)
     
     if not user:
         raise HTTPException(
@@ -602,8 +799,8 @@ async def activate_user(
             detail="User not found"
         )
     
-    user.is_active = True
     db.commit()
+    await run_in_threadpool(_drop_user_caches, user_id)
     
     # Log admin action
     admin_service.log_admin_action(
@@ -629,22 +826,23 @@ async def deactivate_user(
     Deactivate a user account (Admin only).
     """
     admin_service = AdminService(db)
-    user = db.query(User).filter(User.id == user_id).first()
     
-    if not user:
+    if user_id == current_user.id:
         raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="User not found"
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Cannot deactivate your own account"
         )
     
-    if user.id == current_user.id:
+    user = _update_user(db, user_id, is_active=False)
+    
+    if not user:
         raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Cannot deactivate your own account"
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="User not found"
         )
     
-    user.is_active = False
     db.commit()
+    await run_in_threadpool(_drop_user_caches, user_id)
     
     # Log admin action
     admin_service.log_admin_action(
@@ -670,7 +868,7 @@ async def make_admin(
     Grant admin privileges to a user.
     """
     admin_service = AdminService(db)
-    user = db.query(User).filter(User.id == user_id).first()
+    user = _update_user(db, user_id, is_admin=True)
     
     if not user:
         raise HTTPException(
@@ -678,8 +876,8 @@ async def make_admin(
             detail="User not found"
         )
     
-    user.is_admin = True
     db.commit()
+    await run_in_threadpool(AuthService.forget_user, user_id)
     
     # Log admin action
     admin_service.log_admin_action(
@@ -713,22 +911,23 @@ async def revoke_admin(
     Revoke admin privileges from a user.
     """
     admin_service = AdminService(db)
-    user = db.query(User).filter(User.id == user_id).first()
     
-    if not user:
+    if user_id == current_user.id:
         raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="User not found"
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Cannot revoke your own admin privileges"
         )
     
-    if user.id == current_user.id:
+    user = _update_user(db, user_id, is_admin=False)
+    
+    if not user:
         raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Cannot revoke your own admin privileges"
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="User not found"
         )
     
-    user.is_admin = False
     db.commit()
+    await run_in_threadpool(AuthService.forget_user, user_id)
     
     # Log admin action
     admin_service.log_admin_action(
@@ -754,25 +953,30 @@ async def delete_user(
     Delete a user account (Admin only).
     """
     admin_service = AdminService(db)
-    user = db.query(User).filter(User.id == user_id).first()
-    
-    if not user:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="User not found"
-        )
     
-    if user.id == current_user.id:
+    if user_id == current_user.id:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Cannot delete your own account"
         )
     
-    username = user.username
-    email = user.email
+    # Child rows are removed by the ON DELETE CASCADE foreign keys
+    deleted = db.execute(
+        delete(User)
+        .where(User.id == user_id)
+        .returning(User.username, User.email)
+        .execution_options(synchronize_session=False)
+    ).first()
     
-    db.delete(user)
+    if not deleted:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="User not found"
+        )
+    
+    username, email = deleted
     db.commit()
+    await run_in_threadpool(_drop_user_caches, user_id)
     
     # Log admin action
     admin_service.log_admin_action(
@@ -792,69 +996,128 @@ async def delete_user(
 # Analytics Endpoints
 # ============================================================================
 
+# Platform-wide aggregates: served from Redis, recomputed in the background
+# once older than ANALYTICS_FRESH_TTL
+ANALYTICS_FRESH_TTL = 60
+ANALYTICS_STALE_TTL = 600
+
+
+def _run_analytics(method):
+    """
+    Run an AnalyticsService method on its own session.
+    
+    Args:
+        method: Unbound AnalyticsService method
+        
+    Returns:
+        JSON-serializable result
+    """
+    db = SessionLocal()
+    try:
+        return jsonable_encoder(method(AnalyticsService(db)))
+    finally:
+        db.close()
+
+
+@cache_swr("admin:analytics:revenue", fresh=ANALYTICS_FRESH_TTL, stale=ANALYTICS_STALE_TTL)
+def _revenue_analytics():
+    return _run_analytics(AnalyticsService.calculate_revenue_metrics)
+
+
+@cache_swr("admin:analytics:user_growth", fresh=ANALYTICS_FRESH_TTL, stale=ANALYTICS_STALE_TTL)
+def _user_growth():
+    return _run_analytics(AnalyticsService.calculate_user_growth)
+
+
+@cache_swr("admin:analytics:tournament_performance", fresh=ANALYTICS_FRESH_TTL, stale=ANALYTICS_STALE_TTL)
+def _tournament_performance():
+    return _run_analytics(AnalyticsService.calculate_tournament_performance)
+
+
+@cache_swr("admin:analytics:trading_volume", fresh=ANALYTICS_FRESH_TTL, stale=ANALYTICS_STALE_TTL)
+def _trading_volume():
+    return _run_analytics(AnalyticsService.get_trading_volume_stats)
+
+
+@cache_swr("admin:analytics:user_engagement", fresh=ANALYTICS_FRESH_TTL, stale=ANALYTICS_STALE_TTL)
+def _user_engagement():
+    return _run_analytics(AnalyticsService.get_user_engagement_metrics)
+
+
 @router.get("/analytics/revenue", response_model=RevenueAnalyticsResponse)
-async def get_revenue_analytics(
-    current_user: User = Depends(get_current_admin_user),
-    db: Session = Depends(get_db)
+def get_revenue_analytics(
+    current_user: User = Depends(get_current_admin_user)
 ):
     """
     Get revenue analytics.
     """
-    service = AnalyticsService(db)
-    analytics = service.calculate_revenue_metrics()
-    return analytics
+    return _revenue_analytics()
 
 
 @router.get("/analytics/user-growth", response_model=UserGrowthMetrics)
-async def get_user_growth(
-    current_user: User = Depends(get_current_admin_user),
-    db: Session = Depends(get_db)
+def get_user_growth(
+    current_user: User = Depends(get_current_admin_user)
 ):
     """
     Get user growth metrics.
     """
-    service = AnalyticsService(db)
-    metrics = service.calculate_user_growth()
-    return metrics
+    return _user_growth()
 
 
 @router.get("/analytics/tournament-performance", response_model=TournamentPerformanceMetrics)
-async def get_tournament_performance(
-    current_user: User = Depends(get_current_admin_user),
-    db: Session = Depends(get_db)
+def get_tournament_performance(
+    current_user: User = Depends(get_current_admin_user)
 ):
     """
     Get tournament performance metrics.
     """
-    service = AnalyticsService(db)
-    metrics = service.calculate_tournament_performance()
-    return metrics
+    return _tournament_performance()
 
 
 @router.get("/analytics/trading-volume")
-async def get_trading_volume(
-    current_user: User = Depends(get_current_admin_user),
-    db: Session = Depends(get_db)
+def get_trading_volume(
+    current_user: User = Depends(get_current_admin_user)
 ):
     """
     Get trading volume statistics.
     """
-    service = AnalyticsService(db)
-    stats = service.get_trading_volume_stats()
-    return stats
+    return _trading_volume()
 
 
 @router.get("/analytics/user-engagement")
-async def get_user_engagement(
-    current_user: User = Depends(get_current_admin_user),
-    db: Session = Depends(get_db)
+def get_user_engagement(
+    current_user: User = Depends(get_current_admin_user)
 ):
     """
     Get user engagement metrics.
     """
-    service = AnalyticsService(db)
-    metrics = service.get_user_engagement_metrics()
-    return metrics
+    return _user_engagement()
+
+
+@router.get("/analytics/dashboard")
+async def get_analytics_dashboard(
+    current_user: User = Depends(get_current_admin_user)
+):
+    """
+    Get all analytics sections in one response.
+    
+    The sections are independent, so they are fetched concurrently, each
+    on its own session and through its own cache entry.
+    """
+    revenue, user_growth, tournament_performance, trading_volume, user_engagement = await asyncio.gather(
+        asyncio.to_thread(_revenue_analytics),
+        asyncio.to_thread(_user_growth),
+        asyncio.to_thread(_tournament_performance),
+        asyncio.to_thread(_trading_volume),
+        asyncio.to_thread(_user_engagement),
+    )
+    return {
+        "revenue": revenue,
+        "user_growth": user_growth,
+        "tournament_performance": tournament_performance,
+        "trading_volume": trading_volume,
+        "user_engagement": user_engagement
+    }
 
 
 # ============================================================================
@@ -898,10 +1161,34 @@ async def send_bulk_notification(
 # Admin Action Audit Log
 # ============================================================================
 
+def _encode_audit_cursor(action: AdminAction) -> str:
+    """Opaque keyset cursor for the audit log sort key (created_at, id)."""
+    raw = f"{action.created_at.isoformat()}|{action.id}"
+    return base64.urlsafe_b64encode(raw.encode()).decode()
+
+
+def _decode_audit_cursor(cursor: str) -> Tuple[datetime, int]:
+    """
+    Decode an audit log cursor.
+    
+    Raises:
+        HTTPException: If the cursor is malformed
+    """
+    try:
+        created_at, action_id = base64.urlsafe_b64decode(cursor.encode()).decode().rsplit("|", 1)
+        return datetime.fromisoformat(created_at), int(action_id)
+    except ValueError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid cursor"
+        )
+
+
 @router.get("/audit-log", response_model=AdminActionListResponse)
-async def get_audit_log(
+def get_audit_log(
     limit: int = Query(100, ge=1, le=500),
     offset: int = Query(0, ge=0),
+    cursor: Optional[str] = Query(None, description="Keyset cursor from next_cursor (overrides offset)"),
     action_type: Optional[str] = Query(None),
     admin_user_id: Optional[int] = Query(None),
     current_user: User = Depends(get_current_admin_user),
@@ -909,40 +1196,69 @@ async def get_audit_log(
 ):
     """
     Get admin action audit log.
-    """
-    query = db.query(AdminAction)
     
+    Newest first. Pass ``next_cursor`` back as ``cursor`` to page by index
+    seek instead of OFFSET, which stays fast however deep the page.
+    """
+    filters = []
     if action_type:
-        query = query.filter(AdminAction.action_type == action_type)
+        filters.append(AdminAction.action_type == action_type)
     
     if admin_user_id:
-        query = query.filter(AdminAction.admin_user_id == admin_user_id)
-    
-    total_count = query.count()
-    actions = query.order_by(AdminAction.created_at.desc()).limit(limit).offset(offset).all()
-    
-    # Add admin username to each action
-    action_responses = []
-    for action in actions:
-        admin_user = db.query(User).filter(User.id == action.admin_user_id).first()
-        action_responses.append({
-            "id": action.id,
-            "admin_user_id": action.admin_user_id,
-            "admin_username": admin_user.username if admin_user else "Unknown",
-            "action_type": action.action_type,
-            "target_type": action.target_type,
-            "target_id": action.target_id,
-            "description": action.description,
-            "metadata": action.action_metadata,
-            "ip_address": action.ip_address,
-            "created_at": action.created_at
-        })
+        filters.append(AdminAction.admin_user_id == admin_user_id)
+    
+    # Admin username and filtered total come back with each row
+    if cursor is not None:
+        before_created_at, before_id = _decode_audit_cursor(cursor)
+        total = select(func.count(AdminAction.id)).where(*filters).scalar_subquery()
+        query = db.query(AdminAction, User.username, total.label("total_count")).filter(
+            *filters,
+            tuple_(AdminAction.created_at, AdminAction.id) < tuple_(before_created_at, before_id)
+        )
+    else:
+        query = db.query(
+            AdminAction,
+            User.username,
+            func.count().over().label("total_count")
+        ).filter(*filters)
+    
+    query = query.outerjoin(
+        User, User.id == AdminAction.admin_user_id
+    ).order_by(AdminAction.created_at.desc(), AdminAction.id.desc()).limit(limit)
+    if cursor is None:
+        query = query.offset(offset)
+    rows = query.all()
+    
+    if rows:
+        total_count = rows[0].total_count
+    elif offset or cursor is not None:
+        # Past the last page; the total has no row to ride on
+        total_count = db.query(func.count(AdminAction.id)).filter(*filters).scalar()
+    else:
+        total_count = 0
+    
+    action_responses = [
+        AdminActionResponse(
+            id=action.id,
+            admin_user_id=action.admin_user_id,
+            admin_username=admin_username or "Unknown",
+            action_type=action.action_type,
+            target_type=action.target_type,
+            target_id=action.target_id,
+            description=action.description,
+            metadata=action.action_metadata,
+            ip_address=action.ip_address,
+            created_at=action.created_at
+        )
+        for action, admin_username, _ in rows
+    ]
     
     return AdminActionListResponse(
         actions=action_responses,
         total_count=total_count,
         page=offset // limit + 1 if limit > 0 else 1,
-        page_size=limit
+        page_size=limit,
+        next_cursor=_encode_audit_cursor(rows[-1].AdminAction) if len(rows) == limit else None
     )
 
 
@@ -951,7 +1267,8 @@ async def get_audit_log(
 # ============================================================================
 
 @router.get("/stats")
-async def get_platform_stats(
+@cache_response(PLATFORM_STATS_CACHE_KEY, ttl=15)
+def get_platform_stats(
     current_user: User = Depends(get_current_admin_user),
     db: Session = Depends(get_db)
 ):
@@ -960,19 +1277,39 @@ async def get_platform_stats(
     
     Legacy endpoint - use /dashboard/overview for more comprehensive data.
     """
-    from app.models.paper_order import PaperOrder, OrderStatus
-    from app.models.tournament import Tournament
-    
-    total_users = db.query(User).count()
-    active_users = db.query(User).filter(User.is_active == True).count()
-    total_tournaments = db.query(Tournament).count()
-    active_tournaments = db.query(Tournament).filter(
-        Tournament.status.in_(['REGISTRATION_OPEN', 'ACTIVE'])
-    ).count()
-    total_orders = db.query(PaperOrder).count()
-    executed_orders = db.query(PaperOrder).filter(
-        PaperOrder.status == OrderStatus.EXECUTED
-    ).count()
+    # One round-trip: each table is scanned once with FILTER aggregates
+    user_stats = select(
+        func.count().label("total"),
+        func.count().filter(User.is_active == True).label("active")
+    ).select_from(User).subquery()
+    tournament_stats = select(
+        func.count().label("total"),
+        func.count().filter(Tournament.is_live == True).label("active")
+    ).select_from(Tournament).subquery()
+    order_stats = select(
+        func.count().label("total"),
+        func.count().filter(PaperOrder.status == OrderStatus.EXECUTED).label("executed")
+    ).select_from(PaperOrder).subquery()
+    
+    row = db.execute(
+        select(
+            user_stats.c.total.label("total_users"),
+            user_stats.c.active.label("active_users"),
+            tournament_stats.c.total.label("total_tournaments"),
+            tournament_stats.c.active.label("active_tournaments"),
+            order_stats.c.total.label("total_orders"),
+            order_stats.c.executed.label("executed_orders")
+        ).select_from(
+            user_stats.join(tournament_stats, true()).join(order_stats, true())
+        )
+    ).one()
+    
+    total_users = row.total_users
+    active_users = row.active_users
+    total_tournaments = row.total_tournaments
+    active_tournaments = row.active_tournaments
+    total_orders = row.total_orders
+    executed_orders = row.executed_orders
     
     return {
         "total_users": total_users,
@@ -2,7 +2,7 @@
 Authentication API routes.
 """
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Request, status
 from sqlalchemy.orm import Session
 
 from app.db import get_db
@@ -28,7 +28,7 @@ async def signup(
     - Default user settings
     """
     try:
-        user = AuthService.create_user(db, user_data)
+        user = await AuthService.create_user_async(db, user_data)
         return user
     except ValueError as e:
         raise HTTPException(
@@ -40,6 +40,7 @@ async def signup(
 @router.post("/login", response_model=Token)
 async def login(
     login_data: UserLogin,
+    request: Request,
     db: Session = Depends(get_db)
 ):
     """
@@ -48,7 +49,9 @@ async def login(
     Returns:
         JWT access token for authenticated requests
     """
-    user = AuthService.authenticate_user(db, login_data)
+    user = await AuthService.authenticate_user_async(
+        db, login_data, request.client.host if request.client else None
+    )
     
     if not user:
         raise HTTPException(
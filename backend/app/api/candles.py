@@ -2,16 +2,344 @@
 Market data API routes for candles and options chain.
 """
 
-from fastapi import APIRouter, Depends, HTTPException, Query, Path
-from datetime import datetime, timedelta
-from typing import List, Dict, Any
-from collections import defaultdict
+import asyncio
 
-from app.services.market_data_service import get_market_data_service
+from fastapi import APIRouter, Depends, HTTPException, Query, Path, Request
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import ORJSONResponse, Response, StreamingResponse
+from datetime import date, datetime, timedelta
+from typing import List, Dict, Any, Tuple, Iterator, Optional
+from operator import itemgetter
+from types import MappingProxyType
+
+import numpy as np
+import orjson
+
+from app.services.market_data_service import get_market_data_service, MarketDataUnavailable
+from app.services.candle_cache import get_candle_cache, MARKET_OPEN, MARKET_CLOSE
+from app.utils.cache import cache_get_raw, cache_set_raw
+from app.utils.logger import setup_logger
 from app.api.dependencies import get_current_user
 from app.models.user import User
 
-router = APIRouter()
+logger = setup_logger(__name__)
+router = APIRouter(default_response_class=ORJSONResponse)
+
+CANDLE_FIELDS = ("timestamp", "open", "high", "low", "close", "volume")
+
+# Keys of the columnar (?format=columns) candle payload, in CANDLE_FIELDS order
+CANDLE_COLUMN_KEYS = ("t", "o", "h", "l", "c", "v")
+CANDLE_FORMATS = frozenset({"rows", "columns"})
+
+# C-level field accessors for pulling candle columns out of dicts
+_get_date = itemgetter('date')
+_get_ohlc = itemgetter('open', 'high', 'low', 'close')
+_get_volume = itemgetter('volume')
+
+# Frontend candles as columns: ms timestamps, (n, 4) OHLC, volumes
+CandleColumns = Tuple[np.ndarray, np.ndarray, np.ndarray]
+
+# Candles encoded per chunk of a streamed response
+STREAM_CHUNK_SIZE = 200
+
+# Map timeframe to API interval
+# Zerodha API officially supports: minute, 3minute, 5minute, 10minute, 15minute, 30minute, 60minute, day
+# Reference: https://kite.trade/docs/connect/v3/historical/
+TIMEFRAME_MAP = MappingProxyType({
+    # Intraday - Minute based
+    "1m": "minute",
+    "minute": "minute",
+    "3m": "3minute",
+    "3minute": "3minute",
+    "5m": "5minute",
+    "5minute": "5minute",
+    "10m": "10minute",
+    "10minute": "10minute",
+    "15m": "15minute",
+    "15minute": "15minute",
+    "30m": "30minute",
+    "30minute": "30minute",
+    # Hourly
+    "1h": "60minute",
+    "60minute": "60minute",
+    # Daily, Weekly, Monthly
+    # Note: Zerodha API does NOT have direct week/month intervals
+    # Weekly and monthly charts use 'day' data and are aggregated in the frontend/charting library
+    "1D": "day",
+    "1d": "day",
+    "day": "day",
+    "1w": "day",  # Frontend aggregates daily data to weekly
+    "week": "day",
+    "1M": "day",  # Frontend aggregates daily data to monthly
+    "month": "day"
+})
+
+# Candles per trading day (6h 15min session) for each intraday interval
+CANDLES_PER_DAY = MappingProxyType({
+    "minute": 375,
+    "3minute": 125,
+    "5minute": 75,
+    "10minute": 37.5,
+    "15minute": 25,
+    "30minute": 12.5,
+    "60minute": 6,
+})
+
+# Calendar days covered by one candle of each day-based timeframe; weekly
+# and monthly candles are aggregated from daily data
+WEEKLY_TIMEFRAMES = frozenset({"1w", "week"})
+MONTHLY_TIMEFRAMES = frozenset({"1M", "month"})
+DAYS_PER_CANDLE = MappingProxyType({
+    **dict.fromkeys(WEEKLY_TIMEFRAMES, 7),
+    **dict.fromkeys(MONTHLY_TIMEFRAMES, 30),
+})
+
+# Spacing between generated mock candles, in milliseconds
+INTERVAL_STEP_MS = MappingProxyType({
+    interval: step // timedelta(milliseconds=1)
+    for interval, step in {
+        "minute": timedelta(minutes=1),
+        "3minute": timedelta(minutes=3),
+        "5minute": timedelta(minutes=5),
+        "10minute": timedelta(minutes=10),
+        "15minute": timedelta(minutes=15),
+        "30minute": timedelta(minutes=30),
+        "60minute": timedelta(hours=1),
+        "day": timedelta(days=1),
+    }.items()
+})
+
+# Instruments served by /instruments
+OPTION_TYPES = frozenset({'CE', 'PE'})
+OPTION_UNDERLYINGS = frozenset({'NIFTY', 'NIFTY BANK', 'BANKNIFTY'})
+INSTRUMENTS_CACHE_TTL = 86400
+
+# Latest encoded instruments payload per exchange, as (cache key, body);
+# the key embeds the date, so a new day misses and replaces the entry
+_instruments_local: Dict[str, Tuple[str, bytes]] = {}
+
+# Instrument columns sent to the frontend (search and token lookup)
+INSTRUMENT_FIELDS = (
+    'instrument_token', 'tradingsymbol', 'name', 'exchange',
+    'segment', 'instrument_type', 'strike', 'expiry',
+)
+
+
+def _serialize_instrument(inst: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Project an instrument onto the fields the frontend reads.
+    
+    NIFTY BANK is normalized to BANKNIFTY for frontend consistency. Expiry
+    dates are ``date`` objects, which orjson already encodes as YYYY-MM-DD.
+    """
+    slim = {field: inst[field] for field in INSTRUMENT_FIELDS}
+    if slim['name'] == 'NIFTY BANK':
+        slim['name'] = 'BANKNIFTY'
+    return slim
+
+
+def to_candle_columns(candles: List[Dict[str, Any]]) -> CandleColumns:
+    """
+    Convert candles to frontend columns.
+    
+    OHLC rounding and the millisecond timestamp conversion are done
+    column-wise in numpy rather than per candle.
+    
+    Args:
+        candles: Candle dictionaries with 'date', 'open', 'high', 'low', 'close', 'volume'
+    
+    Returns:
+        Millisecond timestamps, (n, 4) OHLC rounded to 2 places, and volumes
+    """
+    count = len(candles)
+    # Kite dates are tz-aware, which datetime64 cannot represent; an aware
+    # timestamp() is plain arithmetic and cheaper than stripping tzinfo
+    epoch_seconds = np.fromiter(map(datetime.timestamp, map(_get_date, candles)), dtype=np.float64, count=count)
+    timestamps = (epoch_seconds * 1000).astype(np.int64)
+    ohlc = np.array(list(map(_get_ohlc, candles)), dtype=np.float64).reshape(count, 4)
+    volumes = np.fromiter(map(_get_volume, candles), dtype=np.int64, count=count)
+    
+    # One rounding pass over the whole block; no per-value round() calls
+    np.round(ohlc, 2, out=ohlc)
+    return timestamps, ohlc, volumes
+
+
+def _pack_candles(timestamps: np.ndarray, ohlc: np.ndarray, volumes: np.ndarray) -> List[Dict[str, Any]]:
+    """
+    Build frontend candle dicts from column arrays.
+    
+    Args:
+        timestamps: Millisecond timestamps (int64)
+        ohlc: Open, high, low, close columns as an (n, 4) array
+        volumes: Volumes (int64)
+    
+    Returns:
+        List of candle dicts
+    """
+    return [
+        dict(zip(CANDLE_FIELDS, (t, o, h, lo, c, v)))
+        for t, (o, h, lo, c), v in zip(timestamps.tolist(), ohlc.tolist(), volumes.tolist())
+    ]
+
+
+def etag_matches(request: Request, etag: str) -> bool:
+    """
+    Whether the client already holds the representation tagged ``etag``.
+    
+    Args:
+        request: Incoming request
+        etag: Quoted entity tag of the current representation
+    
+    Returns:
+        True if If-None-Match lists ``etag`` (weak comparison) or ``*``
+    """
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    tags = {tag.strip().removeprefix("W/") for tag in header.split(",")}
+    return etag in tags or "*" in tags
+
+
+def not_modified(etag: str) -> Response:
+    """Build a 304 response for ``etag``."""
+    return Response(status_code=304, headers={"ETag": etag})
+
+
+def stream_candles(columns: CandleColumns, headers: Optional[Dict[str, str]] = None) -> StreamingResponse:
+    """
+    Stream candles as a JSON array, encoded a chunk at a time.
+    
+    The body is the same array a plain JSON response would carry, but only
+    one chunk of candle dicts and its encoding exist at a time, and the
+    first bytes go out as soon as the first chunk is encoded.
+    
+    Args:
+        columns: Candle columns from ``to_candle_columns``
+        headers: Extra response headers (e.g. ETag)
+    
+    Returns:
+        Streaming JSON response
+    """
+    timestamps, ohlc, volumes = columns
+    
+    def encode() -> Iterator[bytes]:
+        yield b"["
+        for start in range(0, len(timestamps), STREAM_CHUNK_SIZE):
+            end = start + STREAM_CHUNK_SIZE
+            candles = _pack_candles(timestamps[start:end], ohlc[start:end], volumes[start:end])
+            # Strip the brackets orjson puts around each slice
+            chunk = orjson.dumps(candles)[1:-1]
+            yield chunk if start == 0 else b"," + chunk
+        yield b"]"
+    
+    return StreamingResponse(encode(), media_type="application/json", headers=headers)
+
+
+def candles_response(columns: CandleColumns, fmt: str, headers: Optional[Dict[str, str]] = None) -> Response:
+    """
+    Build the candles response in the requested format.
+    
+    ``rows`` streams the list of candle dicts the frontend reads today.
+    ``columns`` returns one array per field (``t``, ``o``, ``h``, ``l``,
+    ``c``, ``v``), the shape charting libraries consume directly; it is
+    about half the size and needs no per-candle dicts.
+    
+    Args:
+        columns: Candle columns from ``to_candle_columns``
+        fmt: ``rows`` or ``columns``
+        headers: Extra response headers (e.g. ETag)
+    
+    Returns:
+        JSON response
+    """
+    if fmt == "rows":
+        return stream_candles(columns, headers)
+    
+    timestamps, ohlc, volumes = columns
+    values = (timestamps.tolist(), *ohlc.T.tolist(), volumes.tolist())
+    return ORJSONResponse(dict(zip(CANDLE_COLUMN_KEYS, values)), headers=headers)
+
+
+# Seeded from OS entropy once; only used from the event loop thread
+_mock_rng = np.random.default_rng()
+
+
+def generate_mock_ohlcv(base_price: float, count: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Generate a random-walk OHLCV series.
+    
+    Each candle opens within ±100 of the previous close and closes within
+    ±50 of its open; wicks extend up to 30 beyond the body. Closes are a
+    cumulative sum, so the series walks like a sequential loop would.
+    
+    Args:
+        base_price: Price the walk starts from
+        count: Number of candles
+    
+    Returns:
+        Tuple of (ohlc as an (n, 4) float array, volumes as int64)
+    """
+    rng = _mock_rng
+    gaps = rng.uniform(-100, 100, size=count)
+    bodies = rng.uniform(-50, 50, size=count)
+    
+    closes = base_price + np.cumsum(gaps + bodies)
+    opens = closes - bodies
+    highs = np.maximum(opens, closes) + rng.uniform(0, 30, size=count)
+    lows = np.minimum(opens, closes) - rng.uniform(0, 30, size=count)
+    volumes = rng.integers(1000, 10000, size=count, endpoint=True)
+    
+    return np.column_stack((opens, highs, lows, closes)), volumes
+
+
+def _aggregate(daily_candles: List[Dict[str, Any]], keys: np.ndarray) -> List[Dict[str, Any]]:
+    """
+    Reduce daily candles into one candle per period.
+    
+    ``daily_candles`` is expected in ascending date order, as Kite
+    historical data and the mock generator both return it. If the period
+    keys are out of order, the candles are regrouped with one stable sort.
+    
+    Args:
+        daily_candles: Daily candle dictionaries in time order
+        keys: Period key per candle (int64), non-decreasing with time
+    
+    Returns:
+        One candle per period, in time order
+    """
+    if np.any(np.diff(keys) < 0):
+        logger.warning("Daily candles out of order, sorting before aggregation")
+        order = np.argsort(keys, kind="stable")
+        keys = keys[order]
+        daily_candles = [daily_candles[i] for i in order.tolist()]
+    
+    count = len(daily_candles)
+    ohlc = np.array(list(map(_get_ohlc, daily_candles)), dtype=np.float64)
+    volumes = np.fromiter(map(_get_volume, daily_candles), dtype=np.int64, count=count)
+    
+    # Periods are contiguous runs of equal keys
+    starts = np.concatenate(([0], np.flatnonzero(np.diff(keys)) + 1))
+    ends = np.append(starts[1:], count) - 1
+    
+    opens = ohlc[starts, 0]
+    highs = np.maximum.reduceat(ohlc[:, 1], starts)
+    lows = np.minimum.reduceat(ohlc[:, 2], starts)
+    closes = ohlc[ends, 3]
+    period_volumes = np.add.reduceat(volumes, starts)
+    
+    return [
+        {
+            'date': daily_candles[i]['date'],  # First day of the period
+            'open': o,
+            'high': h,
+            'low': lo,
+            'close': c,
+            'volume': v
+        }
+        for i, o, h, lo, c, v in zip(
+            starts.tolist(), opens.tolist(), highs.tolist(), lows.tolist(), closes.tolist(), period_volumes.tolist()
+        )
+    ]
 
 
 def aggregate_to_weekly(daily_candles: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
@@ -20,7 +348,8 @@ def aggregate_to_weekly(daily_candles: List[Dict[str, Any]]) -> List[Dict[str, A
     Week starts on Monday (ISO week).
     
     Args:
-        daily_candles: List of daily candle dictionaries with 'date', 'open', 'high', 'low', 'close', 'volume'
+        daily_candles: Daily candle dictionaries with 'date', 'open', 'high', 'low', 'close', 'volume',
+            sorted ascending by date
     
     Returns:
         List of weekly candle dictionaries
@@ -28,36 +357,11 @@ def aggregate_to_weekly(daily_candles: List[Dict[str, Any]]) -> List[Dict[str, A
     if not daily_candles:
         return []
     
-    # Group candles by ISO week (year, week_number)
-    weekly_groups = defaultdict(list)
-    
-    for candle in daily_candles:
-        date = candle['date']
-        # Get ISO week: (year, week_number, weekday)
-        iso_calendar = date.isocalendar()
-        week_key = (iso_calendar[0], iso_calendar[1])  # (year, week_number)
-        weekly_groups[week_key].append(candle)
-    
-    # Aggregate each week
-    weekly_candles = []
-    for week_key in sorted(weekly_groups.keys()):
-        week_candles = weekly_groups[week_key]
-        
-        # Sort by date to ensure correct order
-        week_candles.sort(key=lambda x: x['date'])
-        
-        # Calculate weekly OHLCV
-        weekly_candle = {
-            'date': week_candles[0]['date'],  # Use first day of the week
-            'open': week_candles[0]['open'],  # Open from first candle
-            'high': max(c['high'] for c in week_candles),  # Highest high
-            'low': min(c['low'] for c in week_candles),  # Lowest low
-            'close': week_candles[-1]['close'],  # Close from last candle
-            'volume': sum(c['volume'] for c in week_candles)  # Total volume
-        }
-        weekly_candles.append(weekly_candle)
-    
-    return weekly_candles
+    # Proleptic ordinal 1 (0001-01-01) is a Monday, so (ordinal - 1) // 7
+    # numbers Monday-based weeks. Ordinals use the candle's own local date,
+    # unlike datetime64 which would shift IST midnights into the prior day.
+    ordinals = np.fromiter((c['date'].toordinal() for c in daily_candles), dtype=np.int64, count=len(daily_candles))
+    return _aggregate(daily_candles, (ordinals - 1) // 7)
 
 
 def aggregate_to_monthly(daily_candles: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
@@ -65,7 +369,8 @@ def aggregate_to_monthly(daily_candles: List[Dict[str, Any]]) -> List[Dict[str,
     Aggregate daily candles into monthly candles.
     
     Args:
-        daily_candles: List of daily candle dictionaries with 'date', 'open', 'high', 'low', 'close', 'volume'
+        daily_candles: Daily candle dictionaries with 'date', 'open', 'high', 'low', 'close', 'volume',
+            sorted ascending by date
     
     Returns:
         List of monthly candle dictionaries
@@ -73,42 +378,142 @@ def aggregate_to_monthly(daily_candles: List[Dict[str, Any]]) -> List[Dict[str,
     if not daily_candles:
         return []
     
-    # Group candles by month (year, month)
-    monthly_groups = defaultdict(list)
+    months = np.fromiter(
+        (c['date'].year * 12 + c['date'].month for c in daily_candles), dtype=np.int64, count=len(daily_candles)
+    )
+    return _aggregate(daily_candles, months)
+
+
+def _last_weekday(dt: datetime) -> datetime:
+    """Move a Saturday or Sunday back to the preceding Friday."""
+    wd = dt.weekday()  # 5=Saturday, 6=Sunday
+    if wd >= 5:
+        dt -= timedelta(days=wd - 4)
+    return dt
+
+
+def get_market_end_time(dt: datetime) -> datetime:
+    """
+    Get the appropriate end time for fetching candles based on market status.
     
-    for candle in daily_candles:
-        date = candle['date']
-        month_key = (date.year, date.month)
-        monthly_groups[month_key].append(candle)
+    Indian market hours: 9:15 AM to 3:30 PM, Monday to Friday.
     
-    # Aggregate each month
-    monthly_candles = []
-    for month_key in sorted(monthly_groups.keys()):
-        month_candles = monthly_groups[month_key]
+    Args:
+        dt: Current time
         
-        # Sort by date to ensure correct order
-        month_candles.sort(key=lambda x: x['date'])
+    Returns:
+        ``dt`` while the market is open, otherwise the last market close
+    """
+    # If it's a weekend, go back to Friday (after its close)
+    if dt.weekday() >= 5:
+        dt = _last_weekday(dt)
+    else:
+        # Compare clock times so no datetimes are built on the common path
+        now = dt.time()
         
-        # Calculate monthly OHLCV
-        monthly_candle = {
-            'date': month_candles[0]['date'],  # Use first day of the month
-            'open': month_candles[0]['open'],  # Open from first candle
-            'high': max(c['high'] for c in month_candles),  # Highest high
-            'low': min(c['low'] for c in month_candles),  # Lowest low
-            'close': month_candles[-1]['close'],  # Close from last candle
-            'volume': sum(c['volume'] for c in month_candles)  # Total volume
-        }
-        monthly_candles.append(monthly_candle)
+        # If market is currently open, return current time to fetch live candles
+        if MARKET_OPEN <= now <= MARKET_CLOSE:
+            return dt
+        
+        # Before market open, use the previous weekday's close; after the
+        # close, today's
+        if now < MARKET_OPEN:
+            dt = _last_weekday(dt - timedelta(days=1))
+    
+    return dt.replace(hour=MARKET_CLOSE.hour, minute=MARKET_CLOSE.minute, second=0, microsecond=0)
+
+
+def get_market_start_time(dt: datetime) -> datetime:
+    """
+    Get market open time for the given date (Friday's for weekends).
+    
+    Args:
+        dt: Any time on the date
+        
+    Returns:
+        9:15 AM on that date or the preceding Friday
+    """
+    return _last_weekday(dt).replace(hour=MARKET_OPEN.hour, minute=MARKET_OPEN.minute, second=0, microsecond=0)
+
+
+def _mock_candles(symbol: str, timeframe: str, interval: str, limit: int) -> CandleColumns:
+    """
+    Generate random-walk candles when real market data is unavailable.
+    
+    Args:
+        symbol: Trading symbol (NIFTY symbols start near 24500)
+        timeframe: Requested timeframe (weekly/monthly are aggregated from daily)
+        interval: Market data interval, used for the candle spacing
+        limit: Number of candles
+    
+    Returns:
+        Candle columns
+    """
+    base_price = 24500 if "NIFTY" in symbol.upper() else 100
+    current_time = datetime.now()
+    
+    # For weekly/monthly, generate daily mock data first, then aggregate
+    if timeframe in DAYS_PER_CANDLE:
+        logger.info("⚠️ [get_candles] Generating daily mock data for aggregation")
+        # Generate more daily candles to have enough data for aggregation
+        daily_count = limit * DAYS_PER_CANDLE[timeframe]
+        ohlc, volumes = generate_mock_ohlcv(base_price, daily_count)
+    
+        # One datetime per day, stepped back from now in a single numpy pass
+        dates = (
+            np.datetime64(current_time, 'us') - np.arange(daily_count, 0, -1) * np.timedelta64(1, 'D')
+        ).tolist()
+        
+        mock_daily_candles = [
+            {
+                'date': d,
+                'open': o,
+                'high': h,
+                'low': lo,
+                'close': c,
+                'volume': v
+            }
+            for d, (o, h, lo, c), v in zip(dates, ohlc.tolist(), volumes.tolist())
+        ]
+    
+        # Aggregate to weekly or monthly
+        if timeframe in WEEKLY_TIMEFRAMES:
+            logger.info("🔄 [get_candles] Aggregating mock daily candles to weekly")
+            aggregated_candles = aggregate_to_weekly(mock_daily_candles)
+        else:
+            logger.info("🔄 [get_candles] Aggregating mock daily candles to monthly")
+            aggregated_candles = aggregate_to_monthly(mock_daily_candles)
+    
+        # Keep the newest candles; only copy when there are more than asked
+        if len(aggregated_candles) > limit:
+            aggregated_candles = aggregated_candles[-limit:]
+        
+        # Transform to frontend format
+        columns = to_candle_columns(aggregated_candles)
+    else:
+        # For other timeframes, generate mock data directly
+        logger.info("⚠️ [get_candles] Generating %s mock candles", limit)
+    
+        # Timestamps step back from now by the interval
+        step_ms = INTERVAL_STEP_MS.get(interval, INTERVAL_STEP_MS["5minute"])
+        now_ms = int(current_time.timestamp() * 1000)
+        timestamps = now_ms - np.arange(limit, 0, -1, dtype=np.int64) * step_ms
+    
+        ohlc, volumes = generate_mock_ohlcv(base_price, limit)
+        columns = (timestamps, np.round(ohlc, 2), volumes)
     
-    return monthly_candles
+    logger.info("✅ [get_candles] Returning %s mock candles to frontend", len(columns[0]))
+    return columns
 
 
 @router.get("/")
 async def get_candles(
+    request: Request,
     symbol: str = Query(..., description="Trading symbol or instrument token"),
     instrument_token: int = Query(None, description="Market data instrument token (required for real data)"),
     timeframe: str = Query("5minute", description="Timeframe (minute, 5minute, 15minute, 30minute, 60minute, day)"),
     limit: int = Query(200, ge=1, le=1000, description="Number of candles to return"),
+    format: str = Query("rows", description="Response shape: rows (list of candles) or columns (array per field)"),
     current_user: User = Depends(get_current_user)
 ):
     """
@@ -119,18 +524,19 @@ async def get_candles(
         instrument_token: Market data instrument token (required for real data)
         timeframe: Candle timeframe
         limit: Number of candles (default 200)
+        format: Response shape, ``rows`` (default) or ``columns``
         
     Returns:
-        List of candles with OHLCV data
+        List of candles with OHLCV data, or one array per OHLCV field
     """
-    from app.utils.logger import setup_logger
-    logger = setup_logger(__name__)
-    
-    logger.info(f"🔵 [get_candles] START - Symbol: {symbol}, Timeframe: {timeframe}, Limit: {limit}")
-    logger.info(f"🔵 [get_candles] Instrument token: {instrument_token}")
+    logger.info("🔵 [get_candles] START - Symbol: %s, Timeframe: %s, Limit: %s", symbol, timeframe, limit)
+    logger.info("🔵 [get_candles] Instrument token: %s", instrument_token)
     
     market_data = get_market_data_service()
     
+    if format not in CANDLE_FORMATS:
+        raise HTTPException(status_code=400, detail="format must be 'rows' or 'columns'")
+    
     # If instrument_token is not provided, return error
     if not instrument_token:
         logger.error("❌ [get_candles] No instrument token provided")
@@ -139,121 +545,26 @@ async def get_candles(
             detail="instrument_token is required to fetch real candle data"
         )
     
-    # Map timeframe to API interval
-    # Zerodha API officially supports: minute, 3minute, 5minute, 10minute, 15minute, 30minute, 60minute, day
-    # Reference: https://kite.trade/docs/connect/v3/historical/
-    timeframe_map = {
-        # Intraday - Minute based
-        "1m": "minute",
-        "minute": "minute",
-        "3m": "3minute",
-        "3minute": "3minute",
-        "5m": "5minute",
-        "5minute": "5minute",
-        "10m": "10minute",
-        "10minute": "10minute",
-        "15m": "15minute",
-        "15minute": "15minute",
-        "30m": "30minute",
-        "30minute": "30minute",
-        # Hourly
-        "1h": "60minute",
-        "60minute": "60minute",
-        # Daily, Weekly, Monthly
-        # Note: Zerodha API does NOT have direct week/month intervals
-        # Weekly and monthly charts use 'day' data and are aggregated in the frontend/charting library
-        "1D": "day",
-        "1d": "day",
-        "day": "day",
-        "1w": "day",  # Frontend aggregates daily data to weekly
-        "week": "day",
-        "1M": "day",  # Frontend aggregates daily data to monthly
-        "month": "day"
-    }
-    
-    interval = timeframe_map.get(timeframe, timeframe)
-    logger.info(f"🔄 [get_candles] Timeframe mapping: {timeframe} → {interval}")
+    interval = TIMEFRAME_MAP.get(timeframe, timeframe)
+    logger.info("🔄 [get_candles] Timeframe mapping: %s → %s", timeframe, interval)
     
     # Calculate date range based on timeframe and limit
     # Indian market hours: 9:15 AM to 3:30 PM, Monday to Friday
     to_date = datetime.now()
     
-    # Helper function to adjust to market hours
-    def get_market_end_time(dt: datetime) -> datetime:
-        """Get the appropriate end time for fetching candles based on current market status"""
-        # If it's a weekend, go back to Friday's close
-        while dt.weekday() >= 5:  # 5=Saturday, 6=Sunday
-            dt = dt - timedelta(days=1)
-        
-        # Market hours: 9:15 AM to 3:30 PM
-        market_open = dt.replace(hour=9, minute=15, second=0, microsecond=0)
-        market_close = dt.replace(hour=15, minute=30, second=0, microsecond=0)
-        
-        # If market is currently open (between 9:15 AM and 3:30 PM on a weekday)
-        if market_open <= dt <= market_close and dt.weekday() < 5:
-            # Return current time to fetch live candles including today
-            return dt
-        
-        # If current time is after market close today, use today's close
-        if dt > market_close and dt.weekday() < 5:
-            return market_close
-        
-        # If current time is before market open today, use previous day's close
-        if dt < market_open:
-            dt = dt - timedelta(days=1)
-            # Check if previous day is weekend
-            while dt.weekday() >= 5:
-                dt = dt - timedelta(days=1)
-            market_close = dt.replace(hour=15, minute=30, second=0, microsecond=0)
-        
-        return market_close
-    
-    def get_market_start_time(dt: datetime) -> datetime:
-        """Get market open time for the given date"""
-        # Ensure it's a weekday
-        while dt.weekday() >= 5:
-            dt = dt - timedelta(days=1)
-        return dt.replace(hour=9, minute=15, second=0, microsecond=0)
-    
-    # Adjust to_date to last market close
-    to_date = get_market_end_time(to_date)
+    # Adjust to_date to last market close; while the market is open, drop
+    # the seconds so requests within the same minute share a cache key
+    to_date = get_market_end_time(to_date).replace(second=0, microsecond=0)
     
     # Calculate from_date based on interval and limit
     # We need to account for market hours (6h 15min per day) and weekends
-    if interval == "minute":
-        # ~375 minutes per trading day (6h 15min)
-        trading_days_needed = (limit / 375) + 1
+    if interval in CANDLES_PER_DAY:
+        trading_days_needed = (limit / CANDLES_PER_DAY[interval]) + 1
         from_date = to_date - timedelta(days=int(trading_days_needed * 1.5))  # Add buffer for weekends
-    elif interval == "3minute":
-        trading_days_needed = (limit * 3 / 375) + 1
-        from_date = to_date - timedelta(days=int(trading_days_needed * 1.5))
-    elif interval == "5minute":
-        trading_days_needed = (limit * 5 / 375) + 1
-        from_date = to_date - timedelta(days=int(trading_days_needed * 1.5))
-    elif interval == "10minute":
-        trading_days_needed = (limit * 10 / 375) + 1
-        from_date = to_date - timedelta(days=int(trading_days_needed * 1.5))
-    elif interval == "15minute":
-        trading_days_needed = (limit * 15 / 375) + 1
-        from_date = to_date - timedelta(days=int(trading_days_needed * 1.5))
-    elif interval == "30minute":
-        trading_days_needed = (limit * 30 / 375) + 1
-        from_date = to_date - timedelta(days=int(trading_days_needed * 1.5))
-    elif interval == "60minute":
-        # ~6 candles per day (1-hour intervals)
-        trading_days_needed = (limit / 6) + 1
-        from_date = to_date - timedelta(days=int(trading_days_needed * 1.5))
     elif interval == "day":
-        # Account for weekends (5 trading days per week)
-        if timeframe in ["1w", "week"]:
-            # For weekly charts, need ~5 trading days per candle
-            calendar_days_needed = int(limit * 7 * 1.5)  # 7 days per week + buffer
-        elif timeframe in ["1M", "month"]:
-            # For monthly charts, need ~20-22 trading days per candle
-            calendar_days_needed = int(limit * 30 * 1.5)  # 30 days per month + buffer
-        else:
-            # Daily charts
-            calendar_days_needed = int(limit * 1.5)
+        # Calendar days per candle (7 weekly, 30 monthly, 1 daily) with a
+        # buffer for weekends and holidays
+        calendar_days_needed = int(limit * DAYS_PER_CANDLE.get(timeframe, 1) * 1.5)
         from_date = to_date - timedelta(days=calendar_days_needed)
     else:
         from_date = to_date - timedelta(days=30)
@@ -261,149 +572,63 @@ async def get_candles(
     # Adjust from_date to market start
     from_date = get_market_start_time(from_date)
     
-    logger.info(f"🔵 [get_candles] Date range: {from_date} to {to_date}")
-    logger.info(f"🔵 [get_candles] Market hours adjusted: {from_date.strftime('%Y-%m-%d %H:%M')} to {to_date.strftime('%Y-%m-%d %H:%M')}")
+    logger.info("🔵 [get_candles] Date range: %s to %s", from_date, to_date)
+    
+    # A window that closed before today's open never changes, so its cache
+    # key identifies the response; clients revalidate without a refetch
+    candle_cache = get_candle_cache()
+    etag = None
+    if to_date < candle_cache.session_open(to_date):
+        etag = f'"{candle_cache.key(instrument_token, interval, from_date, to_date)}:{timeframe}:{limit}:{format}"'
+        if etag_matches(request, etag):
+            logger.info("✅ [get_candles] Not modified")
+            return not_modified(etag)
     
     try:
-        # Fetch historical data from market data API
-        logger.info(f"🔵 [get_candles] Fetching from market data API...")
-        candles_data = market_data.get_historical_data(
-            instrument_token=instrument_token,
-            from_date=from_date,
-            to_date=to_date,
-            interval=interval
+        # KiteConnect is a blocking HTTP client; keep it off the event loop
+        logger.info("🔵 [get_candles] Fetching candles (cache first)...")
+        candles_data = await run_in_threadpool(
+            candle_cache.fetch_window,
+            market_data.get_historical_data,
+            instrument_token,
+            interval,
+            from_date,
+            to_date
         )
-        
-        logger.info(f"✅ [get_candles] Received {len(candles_data)} candles from market data API")
-        
-        # If no data from API, use mock data
-        if len(candles_data) == 0:
-            logger.warning(f"⚠️ [get_candles] Market data API returned 0 candles - falling back to mock data")
-            raise Exception("No candles from market data API - using mock data")
-        
-        # Aggregate daily candles to weekly or monthly if needed
-        if timeframe in ["1w", "week"] and interval == "day":
-            logger.info(f"🔄 [get_candles] Aggregating daily candles to weekly")
-            candles_data = aggregate_to_weekly(candles_data)
-            logger.info(f"✅ [get_candles] Aggregated to {len(candles_data)} weekly candles")
-        elif timeframe in ["1M", "month"] and interval == "day":
-            logger.info(f"🔄 [get_candles] Aggregating daily candles to monthly")
-            candles_data = aggregate_to_monthly(candles_data)
-            logger.info(f"✅ [get_candles] Aggregated to {len(candles_data)} monthly candles")
-        
-        # Transform to frontend format
-        candles = []
-        for candle in candles_data[-limit:]:
-            candles.append({
-                "timestamp": int(candle['date'].timestamp() * 1000),
-                "open": round(candle['open'], 2),
-                "high": round(candle['high'], 2),
-                "low": round(candle['low'], 2),
-                "close": round(candle['close'], 2),
-                "volume": candle['volume']
-            })
-        
-        logger.info(f"✅ [get_candles] Returning {len(candles)} candles to frontend")
-        return candles
-        
-    except Exception as e:
+    except MarketDataUnavailable as e:
         # Log the error and return mock data as fallback
-        import random
-        logger.error(f"❌ [get_candles] Error fetching from market data API: {str(e)}")
-        logger.error(f"❌ [get_candles] Error type: {type(e).__name__}")
-        logger.warning(f"⚠️ [get_candles] Returning mock data as fallback")
-        
-        # Fallback to mock data
-        base_price = 24500 if "NIFTY" in symbol.upper() else 100
-        current_time = datetime.now()
-        
-        # For weekly/monthly, generate daily mock data first, then aggregate
-        if timeframe in ["1w", "week", "1M", "month"]:
-            logger.info(f"⚠️ [get_candles] Generating daily mock data for aggregation")
-            # Generate more daily candles to have enough data for aggregation
-            daily_count = limit * 30 if timeframe in ["1M", "month"] else limit * 7
-            mock_daily_candles = []
-            
-            for i in range(daily_count):
-                candle_date = current_time - timedelta(days=(daily_count - i))
-                open_price = base_price + random.uniform(-100, 100)
-                close_price = open_price + random.uniform(-50, 50)
-                high_price = max(open_price, close_price) + random.uniform(0, 30)
-                low_price = min(open_price, close_price) - random.uniform(0, 30)
-                
-                mock_daily_candles.append({
-                    'date': candle_date,
-                    'open': open_price,
-                    'high': high_price,
-                    'low': low_price,
-                    'close': close_price,
-                    'volume': random.randint(1000, 10000)
-                })
-                base_price = close_price
-            
-            # Aggregate to weekly or monthly
-            if timeframe in ["1w", "week"]:
-                logger.info(f"🔄 [get_candles] Aggregating mock daily candles to weekly")
-                aggregated_candles = aggregate_to_weekly(mock_daily_candles)
-            else:
-                logger.info(f"🔄 [get_candles] Aggregating mock daily candles to monthly")
-                aggregated_candles = aggregate_to_monthly(mock_daily_candles)
-            
-            # Transform to frontend format
-            candles = []
-            for candle in aggregated_candles[-limit:]:
-                candles.append({
-                    "timestamp": int(candle['date'].timestamp() * 1000),
-                    "open": round(candle['open'], 2),
-                    "high": round(candle['high'], 2),
-                    "low": round(candle['low'], 2),
-                    "close": round(candle['close'], 2),
-                    "volume": candle['volume']
-                })
-        else:
-            # For other timeframes, generate mock data directly
-            logger.info(f"⚠️ [get_candles] Generating {limit} mock candles")
-            candles = []
-            
-            for i in range(limit):
-                # Calculate timestamp based on interval
-                if interval == "minute":
-                    timestamp = int((current_time - timedelta(minutes=(limit - i))).timestamp() * 1000)
-                elif interval == "3minute":
-                    timestamp = int((current_time - timedelta(minutes=3 * (limit - i))).timestamp() * 1000)
-                elif interval == "5minute":
-                    timestamp = int((current_time - timedelta(minutes=5 * (limit - i))).timestamp() * 1000)
-                elif interval == "10minute":
-                    timestamp = int((current_time - timedelta(minutes=10 * (limit - i))).timestamp() * 1000)
-                elif interval == "15minute":
-                    timestamp = int((current_time - timedelta(minutes=15 * (limit - i))).timestamp() * 1000)
-                elif interval == "30minute":
-                    timestamp = int((current_time - timedelta(minutes=30 * (limit - i))).timestamp() * 1000)
-                elif interval == "60minute":
-                    timestamp = int((current_time - timedelta(hours=(limit - i))).timestamp() * 1000)
-                elif interval == "day":
-                    timestamp = int((current_time - timedelta(days=(limit - i))).timestamp() * 1000)
-                else:
-                    timestamp = int((current_time - timedelta(minutes=5 * (limit - i))).timestamp() * 1000)
-                
-                open_price = base_price + random.uniform(-100, 100)
-                close_price = open_price + random.uniform(-50, 50)
-                high_price = max(open_price, close_price) + random.uniform(0, 30)
-                low_price = min(open_price, close_price) - random.uniform(0, 30)
-                
-                candles.append({
-                    "timestamp": timestamp,
-                    "open": round(open_price, 2),
-                    "high": round(high_price, 2),
-                    "low": round(low_price, 2),
-                    "close": round(close_price, 2),
-                    "volume": random.randint(1000, 10000)
-                })
-                
-                base_price = close_price
-        
-        logger.info(f"✅ [get_candles] Returning {len(candles)} mock candles to frontend")
-        return candles
+        logger.error("❌ [get_candles] Error fetching from market data API: %s", e)
+        logger.error("❌ [get_candles] Error type: %s", type(e.__cause__ or e).__name__)
+        logger.warning("⚠️ [get_candles] Returning mock data as fallback")
+        return candles_response(_mock_candles(symbol, timeframe, interval, limit), format)
+    
+    logger.info("✅ [get_candles] Got %s candles", len(candles_data))
+    
+    # If no data from API, use mock data
+    if not candles_data:
+        logger.warning("⚠️ [get_candles] Market data API returned 0 candles - falling back to mock data")
+        return candles_response(_mock_candles(symbol, timeframe, interval, limit), format)
+    
+    # Aggregate daily candles to weekly or monthly if needed
+    if timeframe in WEEKLY_TIMEFRAMES and interval == "day":
+        logger.info("🔄 [get_candles] Aggregating daily candles to weekly")
+        candles_data = aggregate_to_weekly(candles_data)
+        logger.info("✅ [get_candles] Aggregated to %s weekly candles", len(candles_data))
+    elif timeframe in MONTHLY_TIMEFRAMES and interval == "day":
+        logger.info("🔄 [get_candles] Aggregating daily candles to monthly")
+        candles_data = aggregate_to_monthly(candles_data)
+        logger.info("✅ [get_candles] Aggregated to %s monthly candles", len(candles_data))
+    
+    # Keep the newest candles; only copy when there are more than asked
+    if len(candles_data) > limit:
+        candles_data = candles_data[-limit:]
+    
+    # Transform to frontend format
+    columns = to_candle_columns(candles_data)
+    
+    logger.info("✅ [get_candles] Returning %s candles to frontend", len(columns[0]))
+    # Plain lists of primitives: skip jsonable_encoder and encode with orjson
+    return candles_response(columns, format, headers={"ETag": etag} if etag else None)
 
 
 @router.get("/options-chain/{symbol}")
@@ -424,24 +649,27 @@ async def get_options_chain(
     """
     market_data = get_market_data_service()
     
+    # Get spot price using correct symbol
+    # BANKNIFTY spot is listed as "NIFTY BANK" in NSE
+    if symbol == "NIFTY":
+        spot_symbol = "NSE:NIFTY 50"
+    elif symbol == "BANKNIFTY":
+        spot_symbol = "NSE:NIFTY BANK"
+    else:
+        spot_symbol = f"NSE:{symbol}"
+    
     try:
-        print(f"🔵 [get_options_chain] Requested symbol: {symbol}, expiry: {expiry_date}")
-        options_chain = market_data.get_options_chain(symbol, expiry_date)
+        logger.info("🔵 [get_options_chain] Requested symbol: %s, expiry: %s", symbol, expiry_date)
         
-        print(f"🔵 [get_options_chain] Retrieved CE: {len(options_chain['CE'])}, PE: {len(options_chain['PE'])}")
-        
-        # Get spot price using correct symbol
-        # BANKNIFTY spot is listed as "NIFTY BANK" in NSE
-        if symbol == "NIFTY":
-            spot_symbol = "NSE:NIFTY 50"
-        elif symbol == "BANKNIFTY":
-            spot_symbol = "NSE:NIFTY BANK"
-        else:
-            spot_symbol = f"NSE:{symbol}"
-            
-        spot_price = market_data.get_current_price(spot_symbol) or 0
+        # Independent upstream calls: fetch them concurrently
+        options_chain, spot_price = await asyncio.gather(
+            run_in_threadpool(market_data.get_options_chain, symbol, expiry_date),
+            run_in_threadpool(market_data.get_current_price, spot_symbol)
+        )
+        spot_price = spot_price or 0
         
-        print(f"🔵 [get_options_chain] Spot price for {spot_symbol}: {spot_price}")
+        logger.info("🔵 [get_options_chain] Retrieved CE: %s, PE: %s", len(options_chain['CE']), len(options_chain['PE']))
+        logger.info("🔵 [get_options_chain] Spot price for %s: %s", spot_symbol, spot_price)
 
         return {
             "symbol": symbol,
@@ -459,6 +687,7 @@ async def get_options_chain(
 
 @router.get("/instruments")
 async def get_instruments(
+    request: Request,
     exchange: str = Query("NFO", regex="^(NSE|NFO|BSE|BFO|MCX)$"),
     current_user: User = Depends(get_current_user)
 ):
@@ -469,61 +698,56 @@ async def get_instruments(
         exchange: Exchange name (NSE, NFO, BSE, BFO, MCX)
         
     Returns:
-        List of instruments with properly formatted dates
+        List of instruments with YYYY-MM-DD expiry dates
     """
+    # The instrument dump changes once a day; serve the filtered,
+    # already-encoded payload from process memory, then Redis
+    cache_key = f"instruments:slim:{exchange}:{date.today().isoformat()}"
+    # The key names a single daily payload, so it doubles as the ETag
+    etag = f'"{cache_key}"'
+    if etag_matches(request, etag):
+        return not_modified(etag)
+    
+    local = _instruments_local.get(exchange)
+    if local is not None and local[0] == cache_key:
+        return Response(content=local[1], media_type="application/json", headers={"ETag": etag})
+    
+    cached = await run_in_threadpool(cache_get_raw, cache_key)
+    if cached is not None:
+        _instruments_local[exchange] = (cache_key, cached)
+        return Response(content=cached, media_type="application/json", headers={"ETag": etag})
+    
     market_data = get_market_data_service()
     
     try:
-        instruments = market_data.get_instruments(exchange)
+        instruments = await run_in_threadpool(market_data.get_instruments, exchange)
         
-        # Filter for NIFTY and BANKNIFTY options only
-        filtered_instruments = []
-        for inst in instruments:
-            # Only include CE and PE options
-            if inst.get('instrument_type') not in ['CE', 'PE']:
-                continue
-            
-            # Only include NIFTY and BANKNIFTY
-            # Note: Zerodha CSV has "NIFTY BANK" for BANKNIFTY
-            name = inst.get('name', '').upper()
-            if name not in ['NIFTY', 'NIFTY BANK', 'BANKNIFTY']:
-                continue
-            
-            # Normalize NIFTY BANK to BANKNIFTY for frontend consistency
-            if name == 'NIFTY BANK':
-                inst = dict(inst)  # Create a copy
-                inst['name'] = 'BANKNIFTY'
-            
-            filtered_instruments.append(inst)
+        # Filter for NIFTY and BANKNIFTY options only (Zerodha CSV has
+        # "NIFTY BANK" for BANKNIFTY) and serialize in the same pass. Every
+        # row of the dump carries these keys and names are upper case.
+        serialized_instruments = [
+            _serialize_instrument(inst)
+            for inst in instruments
+            if inst['instrument_type'] in OPTION_TYPES
+            and inst['name'] in OPTION_UNDERLYINGS
+        ]
         
-        print(f"📊 Filtered {len(filtered_instruments)} instruments (NIFTY & BANKNIFTY options)")
+        logger.info("📊 Filtered %s instruments (NIFTY & BANKNIFTY options)", len(serialized_instruments))
         
-        # Convert datetime objects to strings for JSON serialization
-        serialized_instruments = []
-        for inst in filtered_instruments:
-            inst_copy = dict(inst)
-            
-            # Convert expiry datetime to string
-            if 'expiry' in inst_copy and inst_copy['expiry']:
-                try:
-                    inst_copy['expiry'] = inst_copy['expiry'].strftime('%Y-%m-%d')
-                except (AttributeError, ValueError):
-                    pass
-            
-            # Convert last_date datetime to string
-            if 'last_date' in inst_copy and inst_copy['last_date']:
-                try:
-                    inst_copy['last_date'] = inst_copy['last_date'].strftime('%Y-%m-%d')
-                except (AttributeError, ValueError):
-                    pass
-            
-            serialized_instruments.append(inst_copy)
-        
-        return {
+        body = orjson.dumps({
             "exchange": exchange,
             "count": len(serialized_instruments),
             "instruments": serialized_instruments
-        }
+        })
+        
+        # An empty list usually means the upstream fetch failed; don't cache
+        # or tag it
+        if not serialized_instruments:
+            return Response(content=body, media_type="application/json")
+        
+        _instruments_local[exchange] = (cache_key, body)
+        await run_in_threadpool(cache_set_raw, cache_key, body, INSTRUMENTS_CACHE_TTL)
+        return Response(content=body, media_type="application/json", headers={"ETag": etag})
     except Exception as e:
         raise HTTPException(
             status_code=500,
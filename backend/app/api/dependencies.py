@@ -2,6 +2,8 @@
 API dependencies for authentication and database sessions.
 """
 
+import os
+
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from sqlalchemy.orm import Session
@@ -11,18 +13,27 @@ from app.db import get_db
 from app.models.user import User
 from app.utils.jwt_utils import verify_token
 from app.services.auth_service import AuthService
+from app.utils.logger import setup_logger
+
+logger = setup_logger(__name__)
 
 # Security scheme
 security = HTTPBearer()
 
+# Read once; the environment does not change while the app runs
+_ADMIN_EMAIL = os.getenv('ADMIN_EMAIL', '').strip().lower()
+
 
-async def get_current_user(
+def get_current_user(
     credentials: HTTPAuthorizationCredentials = Depends(security),
     db: Session = Depends(get_db)
 ) -> User:
     """
     Get current authenticated user from JWT token.
     
+    Declared sync so FastAPI runs it in the threadpool; a user cache miss
+    is a blocking DB query that must not stall the event loop.
+    
     Args:
         credentials: HTTP Bearer credentials
         db: Database session
@@ -34,19 +45,17 @@ async def get_current_user(
         HTTPException: If authentication fails
     """
     token = credentials.credentials
-    print(f"🔑 [AUTH] Received token: {token[:50]}..." if len(token) > 50 else f"🔑 [AUTH] Received token: {token}")
     user_id = verify_token(token)
-    print(f"✅ [AUTH] Token verified, user_id: {user_id}")
     
     if user_id is None:
-        print("❌ [AUTH] Token verification failed - user_id is None")
+        logger.debug("❌ [AUTH] Token verification failed - user_id is None")
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid authentication credentials",
             headers={"WWW-Authenticate": "Bearer"},
         )
     
-    user = AuthService.get_user_by_id(db, user_id)
+    user = AuthService.get_user_by_id_cached(db, user_id)
     
     if user is None:
         raise HTTPException(
@@ -64,27 +73,9 @@ async def get_current_user(
     return user
 
 
-async def get_current_active_user(
-    current_user: User = Depends(get_current_user)
-) -> User:
-    """
-    Get current active user.
-    
-    Args:
-        current_user: Current user from get_current_user
-        
-    Returns:
-        Current User instance
-        
-    Raises:
-        HTTPException: If user is inactive
-    """
-    if not current_user.is_active:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Inactive user"
-        )
-    return current_user
+# get_current_user already rejects inactive users; kept as an alias so
+# both names resolve to one cached dependency per request
+get_current_active_user = get_current_user
 
 
 async def get_current_admin_user(
@@ -105,13 +96,10 @@ async def get_current_admin_user(
     Raises:
         HTTPException: If user is not an admin
     """
-    import os
-    
     # Check if user is admin in database OR has admin email from env
-    admin_email = os.getenv('ADMIN_EMAIL', '').strip().lower()
-    user_email = current_user.email.strip().lower()
-    
-    is_admin = current_user.is_admin or (admin_email and user_email == admin_email)
+    is_admin = current_user.is_admin or (
+        _ADMIN_EMAIL and current_user.email.strip().lower() == _ADMIN_EMAIL
+    )
     
     if not is_admin:
         raise HTTPException(
@@ -146,7 +134,7 @@ def get_optional_current_user(
         if user_id is None:
             return None
         
-        user = AuthService.get_user_by_id(db, user_id)
+        user = AuthService.get_user_by_id_cached(db, user_id)
         return user if user and user.is_active else None
     except:
         return None
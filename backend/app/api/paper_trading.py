@@ -3,6 +3,8 @@ Paper trading API routes.
 """
 
 from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi.responses import Response
+from pydantic import TypeAdapter
 from sqlalchemy.orm import Session
 from typing import List
 
@@ -14,10 +16,13 @@ from app.schemas.paper_trading import (
 from app.services.paper_trading_engine import PaperTradingEngine
 from app.api.dependencies import get_current_user
 from app.models.user import User
-from app.models.wallet import Wallet
 
 router = APIRouter()
 
+# Prebuilt serializers for the order and position lists
+_order_list_adapter = TypeAdapter(List[OrderResponse])
+_position_list_adapter = TypeAdapter(List[PositionResponse])
+
 
 @router.post("/orders", response_model=OrderResponse, status_code=status.HTTP_201_CREATED)
 async def place_order(
@@ -49,7 +54,7 @@ async def place_order(
 
 
 @router.get("/orders", response_model=List[OrderResponse])
-async def get_orders(
+def get_orders(
     limit: int = Query(100, ge=1, le=500),
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
@@ -62,7 +67,10 @@ async def get_orders(
     """
     engine = PaperTradingEngine(db)
     orders = engine.get_user_orders(current_user.id, limit)
-    return orders
+    
+    # Serialize directly; response_model is kept for the OpenAPI schema only
+    orders = _order_list_adapter.validate_python(orders, from_attributes=True)
+    return Response(content=_order_list_adapter.dump_json(orders), media_type="application/json")
 
 
 @router.delete("/orders/{order_id}")
@@ -93,7 +101,7 @@ async def cancel_order(
 
 
 @router.get("/positions", response_model=List[PositionResponse])
-async def get_positions(
+def get_positions(
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
@@ -106,14 +114,15 @@ async def get_positions(
     engine = PaperTradingEngine(db)
     
     # Update prices before returning
-    engine.update_positions_prices(current_user.id)
+    positions = engine.update_positions_prices(current_user.id)
     
-    positions = engine.get_user_positions(current_user.id)
-    return positions
+    # Serialize directly; response_model is kept for the OpenAPI schema only
+    positions = _position_list_adapter.validate_python(positions, from_attributes=True)
+    return Response(content=_position_list_adapter.dump_json(positions), media_type="application/json")
 
 
 @router.get("/wallet", response_model=WalletResponse)
-async def get_wallet(
+def get_wallet(
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
@@ -123,7 +132,8 @@ async def get_wallet(
     Returns:
         Wallet details with available balance
     """
-    wallet = db.query(Wallet).filter(Wallet.user_id == current_user.id).first()
+    engine = PaperTradingEngine(db)
+    wallet = engine.get_wallet(current_user.id)
     
     if not wallet:
         raise HTTPException(
@@ -135,7 +145,7 @@ async def get_wallet(
 
 
 @router.get("/portfolio", response_model=PortfolioSummary)
-async def get_portfolio_summary(
+def get_portfolio_summary(
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
@@ -149,6 +159,7 @@ async def get_portfolio_summary(
         - Invested amount
         - Total P&L
         - Number of positions and trades
+        - Wallet details (same as /wallet)
     """
     engine = PaperTradingEngine(db)
     summary = engine.get_portfolio_summary(current_user.id)
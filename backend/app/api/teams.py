@@ -3,8 +3,10 @@ Team API routes for team tournaments.
 """
 
 from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.responses import Response
+from pydantic import TypeAdapter
 from sqlalchemy.orm import Session
-from typing import List
+from typing import List, Dict, Any
 
 from app.db import get_db
 from app.schemas.tournament import (
@@ -15,10 +17,50 @@ from app.services.team_service import TeamService
 from app.api.dependencies import get_current_user
 from app.models.user import User
 from app.models.team_member import MemberRole
+from app.models.team import Team
 from app.models.tournament import Tournament
 
 router = APIRouter()
 
+# Prebuilt serializer for team lists with nested members
+_team_list_adapter = TypeAdapter(List[TeamResponse])
+
+
+def _serialize_team(team: Team, max_members: int) -> Dict[str, Any]:
+    """
+    Build a TeamResponse dict from a team with its members and captain loaded.
+    
+    Args:
+        team: Team instance
+        max_members: Tournament team size
+        
+    Returns:
+        Team response dictionary
+    """
+    captain = team.captain
+    return {
+        "id": team.id,
+        "tournament_id": team.tournament_id,
+        "name": team.name,
+        "description": team.description,
+        "captain_id": team.captain_id,
+        "captain_username": captain.username if captain else "Unknown",
+        "is_full": team.is_full,
+        "total_members": team.total_members,
+        "max_members": max_members,
+        "members": [
+            {
+                "id": member.id,
+                "user_id": member.user_id,
+                "username": member.user.username if member.user else "Unknown",
+                "role": member.role,
+                "joined_at": member.joined_at
+            }
+            for member in team.members
+        ],
+        "created_at": team.created_at
+    }
+
 
 @router.post("", response_model=TeamResponse)
 async def create_team(
@@ -45,34 +87,9 @@ async def create_team(
             description=team_data.description
         )
         
-        # Get tournament for max_members
-        tournament = db.query(Tournament).filter(Tournament.id == team.tournament_id).first()
-        
-        # Build response with member details
-        members = []
-        for member in team.members:
-            user = db.query(User).filter(User.id == member.user_id).first()
-            members.append({
-                "id": member.id,
-                "user_id": member.user_id,
-                "username": user.username if user else "Unknown",
-                "role": member.role,
-                "joined_at": member.joined_at
-            })
-        
-        return {
-            "id": team.id,
-            "tournament_id": team.tournament_id,
-            "name": team.name,
-            "description": team.description,
-            "captain_id": team.captain_id,
-            "captain_username": current_user.username,
-            "is_full": team.is_full,
-            "total_members": team.total_members,
-            "max_members": tournament.team_size,
-            "members": members,
-            "created_at": team.created_at
-        }
+        # Tournament and captain were loaded by create_team, so these are
+        # identity map hits
+        return _serialize_team(team, team.tournament.team_size)
     except ValueError as e:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -105,37 +122,36 @@ async def get_tournament_teams(
     
     teams = service.get_tournament_teams(tournament_id)
     
-    # Build response with member details
-    result = []
-    for team in teams:
-        captain = db.query(User).filter(User.id == team.captain_id).first()
-        
-        members = []
-        for member in team.members:
-            user = db.query(User).filter(User.id == member.user_id).first()
-            members.append({
-                "id": member.id,
-                "user_id": member.user_id,
-                "username": user.username if user else "Unknown",
-                "role": member.role,
-                "joined_at": member.joined_at
-            })
+    # Serialize directly; response_model is kept for the OpenAPI schema only
+    teams = _team_list_adapter.validate_python([_serialize_team(team, tournament.team_size) for team in teams])
+    return Response(content=_team_list_adapter.dump_json(teams), media_type="application/json")
+
+
+@router.get("/tournament/{tournament_id}/summary", response_model=List[TeamResponse])
+def get_tournament_team_summaries(
+    tournament_id: int,
+    db: Session = Depends(get_db)
+):
+    """
+    Get all teams for a tournament without their member lists.
+    
+    Args:
+        tournament_id: Tournament ID
         
-        result.append({
-            "id": team.id,
-            "tournament_id": team.tournament_id,
-            "name": team.name,
-            "description": team.description,
-            "captain_id": team.captain_id,
-            "captain_username": captain.username if captain else "Unknown",
-            "is_full": team.is_full,
-            "total_members": team.total_members,
-            "max_members": tournament.team_size,
-            "members": members,
-            "created_at": team.created_at
-        })
+    Returns:
+        List of teams with empty members
+    """
+    service = TeamService(db)
+    teams = service.get_tournament_team_summaries(tournament_id)
+    
+    # Only an empty result needs the existence check
+    if not teams and not db.query(Tournament.id).filter(Tournament.id == tournament_id).first():
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Tournament not found"
+        )
     
-    return result
+    return [team._asdict() for team in teams]
 
 
 @router.get("/{team_id}", response_model=TeamResponse)
@@ -153,7 +169,7 @@ async def get_team(
         Team details
     """
     service = TeamService(db)
-    team = service.get_team(team_id)
+    team = service.get_team(team_id, with_details=True)
     
     if not team:
         raise HTTPException(
@@ -161,33 +177,7 @@ async def get_team(
             detail="Team not found"
         )
     
-    tournament = db.query(Tournament).filter(Tournament.id == team.tournament_id).first()
-    captain = db.query(User).filter(User.id == team.captain_id).first()
-    
-    members = []
-    for member in team.members:
-        user = db.query(User).filter(User.id == member.user_id).first()
-        members.append({
-            "id": member.id,
-            "user_id": member.user_id,
-            "username": user.username if user else "Unknown",
-            "role": member.role,
-            "joined_at": member.joined_at
-        })
-    
-    return {
-        "id": team.id,
-        "tournament_id": team.tournament_id,
-        "name": team.name,
-        "description": team.description,
-        "captain_id": team.captain_id,
-        "captain_username": captain.username if captain else "Unknown",
-        "is_full": team.is_full,
-        "total_members": team.total_members,
-        "max_members": tournament.team_size,
-        "members": members,
-        "created_at": team.created_at
-    }
+    return _serialize_team(team, team.tournament.team_size)
 
 
 @router.post("/{team_id}/join")
@@ -317,30 +307,4 @@ async def get_my_team(
     if not team:
         return None
     
-    tournament = db.query(Tournament).filter(Tournament.id == team.tournament_id).first()
-    captain = db.query(User).filter(User.id == team.captain_id).first()
-    
-    members = []
-    for member in team.members:
-        user = db.query(User).filter(User.id == member.user_id).first()
-        members.append({
-            "id": member.id,
-            "user_id": member.user_id,
-            "username": user.username if user else "Unknown",
-            "role": member.role,
-            "joined_at": member.joined_at
-        })
-    
-    return {
-        "id": team.id,
-        "tournament_id": team.tournament_id,
-        "name": team.name,
-        "description": team.description,
-        "captain_id": team.captain_id,
-        "captain_username": captain.username if captain else "Unknown",
-        "is_full": team.is_full,
-        "total_members": team.total_members,
-        "max_members": tournament.team_size,
-        "members": members,
-        "created_at": team.created_at
-    }
+    return _serialize_team(team, team.tournament.team_size)
@@ -2,7 +2,9 @@
 Tournament API routes.
 """
 
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Response
+from fastapi.concurrency import run_in_threadpool
+from pydantic import TypeAdapter
 from sqlalchemy.orm import Session
 from typing import List
 
@@ -11,15 +13,24 @@ from app.schemas.tournament import (
     TournamentResponse, TournamentJoin,
     LeaderboardEntry, ParticipantStats
 )
-from app.services.tournament_service import TournamentService
+from app.services.tournament_service import TournamentService, TOURNAMENT_LIST_GENERATION
 from app.api.dependencies import get_current_user
 from app.models.user import User
+from app.utils.cache import cache_get, cache_set, get_generation, bump_generation
 
 router = APIRouter()
 
+# Public tournament lists are shared by every visitor; the TTL bounds
+# staleness of the time-based status and participant counts
+TOURNAMENT_LIST_CACHE_TTL = 10
+
+# Prebuilt serializer for leaderboards (up to 500 entries)
+_leaderboard_adapter = TypeAdapter(List[LeaderboardEntry])
+
 
 @router.get("", response_model=List[TournamentResponse])
-async def get_tournaments(
+def get_tournaments(
+    response: Response,
     status_filter: str = Query(None, regex="^(UPCOMING|REGISTRATION_OPEN|ACTIVE|COMPLETED)$"),
     db: Session = Depends(get_db)
 ):
@@ -39,48 +50,53 @@ async def get_tournaments(
     from app.models.tournament import Tournament, TournamentStatus
     from datetime import datetime, timezone
     
+    # Same list for every caller, so proxies may cache it too
+    response.headers["Cache-Control"] = f"public, max-age={TOURNAMENT_LIST_CACHE_TTL}"
+    
+    generation = get_generation(TOURNAMENT_LIST_GENERATION)
+    cache_key = None
+    if generation is not None:
+        cache_key = f"public:{TOURNAMENT_LIST_GENERATION}:{generation}:{status_filter}"
+        cached = cache_get(cache_key)
+        if cached is not None:
+            return cached
+    
     now = datetime.now(timezone.utc)
     
-    # Get all tournaments first
-    query = db.query(Tournament).order_by(Tournament.created_at.desc())
-    
-    if status_filter:
-        if status_filter == 'UPCOMING':
-            # Upcoming: tournament hasn't started yet (start_date > now)
-            tournaments = query.filter(
-                Tournament.start_date > now
-            ).all()
-        elif status_filter == 'ACTIVE':
-            # Active: tournament has started AND hasn't ended yet (start_date <= now < end_date)
-            tournaments = query.filter(
-                Tournament.start_date <= now,
-                Tournament.end_date > now
-            ).all()
-        elif status_filter == 'COMPLETED':
-            # Completed: tournament has ended (end_date <= now)
-            tournaments = query.filter(
-                Tournament.end_date <= now
-            ).all()
-        else:
-            tournaments = query.all()
+    # Time-based status filters
+    if status_filter == 'UPCOMING':
+        # Upcoming: tournament hasn't started yet (start_date > now)
+        conditions = (Tournament.start_date > now,)
+    elif status_filter == 'ACTIVE':
+        # Active: tournament has started AND hasn't ended yet (start_date <= now < end_date)
+        conditions = (Tournament.start_date <= now, Tournament.end_date > now)
+    elif status_filter == 'COMPLETED':
+        # Completed: tournament has ended (end_date <= now)
+        conditions = (Tournament.end_date <= now,)
+    elif status_filter:
+        conditions = ()
     else:
         # Return only active and upcoming tournaments when no filter (exclude completed)
-        tournaments = query.filter(
-            Tournament.end_date > now
-        ).all()
-    
-    # Calculate actual status for each tournament based on current time
-    for tournament in tournaments:
-        if now >= tournament.end_date:
-            tournament.status = TournamentStatus.COMPLETED
-        elif now >= tournament.start_date and now < tournament.end_date:
-            tournament.status = TournamentStatus.ACTIVE
-        elif now < tournament.registration_deadline:
-            tournament.status = TournamentStatus.REGISTRATION_OPEN
-        else:
-            tournament.status = TournamentStatus.UPCOMING
-    
-    return tournaments
+        conditions = (Tournament.end_date > now,)
+    
+    # One query for every filter, with the time-based status computed by
+    # the database alongside each row; ``now`` is a bound parameter, so each
+    # filter's SQL compiles once and is reused from the compiled cache
+    tournaments = db.query(
+        Tournament, Tournament.effective_status(now).label("effective_status")
+    ).filter(*conditions).order_by(Tournament.created_at.desc()).all()
+    
+    # Derived status goes on the response copy, never on the managed instance
+    result = [
+        TournamentResponse.model_validate(tournament).model_copy(
+            update={"status": TournamentStatus(effective_status)}
+        ).model_dump(mode="json")
+        for tournament, effective_status in tournaments
+    ]
+    
+    if cache_key is not None:
+        cache_set(cache_key, result, TOURNAMENT_LIST_CACHE_TTL)
+    return result
 
 
 @router.get("/{tournament_id}", response_model=TournamentResponse)
@@ -128,6 +144,7 @@ async def join_tournament(
     
     try:
         participant = service.join_tournament(tournament_id, current_user.id)
+        await run_in_threadpool(bump_generation, TOURNAMENT_LIST_GENERATION)
         return {
             "message": "Successfully joined tournament",
             "tournament_id": tournament_id,
@@ -170,14 +187,11 @@ async def get_leaderboard(
     
     # Convert to LeaderboardEntry format
     leaderboard = []
-    for ranking in rankings:
-        from app.models.user import User
-        user = db.query(User).filter(User.id == ranking.user_id).first()
-        
+    for ranking, username in rankings:
         leaderboard.append({
             "rank": ranking.rank,
             "user_id": ranking.user_id,
-            "username": user.username if user else "Unknown",
+            "username": username or "Unknown",
             "total_pnl": ranking.total_pnl,
             "roi": ranking.roi,
             "total_trades": ranking.total_trades,
@@ -186,7 +200,9 @@ async def get_leaderboard(
             "last_updated": ranking.last_updated
         })
     
-    return leaderboard
+    # Serialize directly; response_model is kept for the OpenAPI schema only
+    leaderboard = _leaderboard_adapter.validate_python(leaderboard)
+    return Response(content=_leaderboard_adapter.dump_json(leaderboard), media_type="application/json")
 
 
 @router.get("/{tournament_id}/my-rank")
@@ -15,6 +15,9 @@ class Settings(BaseSettings):
     APP_NAME: str = "Nifty Options Trading Platform"
     APP_VERSION: str = "1.0.0"
     DEBUG: bool = True
+    # Raise on lazy loads the team queries did not plan for (development
+    # aid for catching N+1 regressions; never enable in production)
+    RAISE_ON_LAZY_LOAD: bool = False
     
     # Server
     HOST: str = "0.0.0.0"
@@ -31,10 +34,15 @@ class Settings(BaseSettings):
     JWT_ALGORITHM: str = "HS256"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 1440  # 24 hours
     
+    # Login throttling: failed attempts per email and client IP within the window
+    LOGIN_MAX_FAILURES: int = 5
+    LOGIN_FAILURE_WINDOW_SECONDS: int = 300
+    
     # Market Data API (for market data only) - OPTIONAL
     MARKET_API_KEY: str = ""
     MARKET_API_SECRET: str = ""
     MARKET_ACCESS_TOKEN: str = ""  # Optional: Pre-generated access token
+    MARKET_HTTP_POOL_SIZE: int = 40  # Keep-alive connections; matches the threadpool size
     
     # Paper Trading Settings
     PAPER_TRADING_ONLY: bool = True  # Always True - this is a paper trading platform
@@ -15,6 +15,13 @@ engine = create_engine(
     pool_size=10,
     max_overflow=20,
     echo=settings.DEBUG,  # Log SQL queries in debug mode
+    # Batch executemany: multi-row INSERT ... VALUES plus execute_batch for UPDATE/DELETE
+    executemany_mode="values_plus_batch",
+    insertmanyvalues_page_size=1000,
+    executemany_batch_page_size=500,
+    # Compiled SQL cache; the admin list endpoints alone produce dozens of
+    # distinct filter shapes, so the default of 500 is raised
+    query_cache_size=1200,
 )
 
 # Create SessionLocal class
@@ -4,7 +4,8 @@ Main FastAPI application for Nifty Options Trading Platform.
 
 from fastapi import FastAPI, WebSocket, WebSocketDisconnect, Query, Depends
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import JSONResponse, ORJSONResponse
 from sqlalchemy.orm import Session
 
 from app.config import settings
@@ -24,7 +25,9 @@ app = FastAPI(
     title=settings.APP_NAME,
     version=settings.APP_VERSION,
     description="Paper Trading Platform for NIFTY Options with Real Money Tournament Prizes",
-    debug=settings.DEBUG
+    debug=settings.DEBUG,
+    # orjson renders the encoded response bodies in C
+    default_response_class=ORJSONResponse
 )
 
 # Configure CORS
@@ -37,6 +40,9 @@ app.add_middleware(
     expose_headers=["*"],
 )
 
+# Compress larger JSON responses
+app.add_middleware(GZipMiddleware, minimum_size=1024)
+
 
 # Include API routers
 app.include_router(auth.router, prefix="/api/auth", tags=["Authentication"])
@@ -64,6 +70,23 @@ async def startup_event():
     except Exception as e:
         logger.error(f"Failed to initialize database: {e}")
     
+    # Fail fast to the database if Redis is not reachable
+    from app.utils.cache import check_connection
+    if not check_connection():
+        logger.warning("Redis not reachable, response caches are bypassed")
+    
+    # Start batched admin audit logging
+    from app.services.audit_logger import get_admin_action_logger
+    get_admin_action_logger().start()
+    
+    # Keep live tournament ids cached via LISTEN/NOTIFY
+    from app.services.tournament_status_cache import get_active_tournament_cache
+    get_active_tournament_cache().start()
+    
+    # Refresh pre-aggregated analytics views every minute
+    from app.services.stats_refresher import get_stats_refresher
+    get_stats_refresher().start()
+    
     # Initialize and start KiteTicker service
     try:
         from app.services.ticker_service import get_ticker_service, start_ticker_service
@@ -106,6 +129,19 @@ async def shutdown_event():
     """
     logger.info("Shutting down application")
     
+    # Flush pending admin audit entries
+    try:
+        from app.services.audit_logger import get_admin_action_logger
+        await get_admin_action_logger().stop()
+    except Exception as e:
+        logger.error(f"Error flushing admin action log: {e}")
+    
+    from app.services.tournament_status_cache import get_active_tournament_cache
+    get_active_tournament_cache().stop()
+    
+    from app.services.stats_refresher import get_stats_refresher
+    await get_stats_refresher().stop()
+    
     # Stop KiteTicker service
     try:
         from app.services.ticker_service import stop_ticker_service
@@ -2,7 +2,7 @@
 Admin Action model for tracking administrative operations.
 """
 
-from sqlalchemy import Column, Integer, String, Text, DateTime, JSON
+from sqlalchemy import Column, Integer, String, Text, DateTime, JSON, LargeBinary, Index, text
 from sqlalchemy.sql import func
 from app.db import Base
 
@@ -25,9 +25,18 @@ class AdminAction(Base):
         ip_address: IP address of the admin
         user_agent: Browser/client user agent
         created_at: Timestamp when action was performed
+        chain_hash: SHA-256 over the previous row's chain_hash and this row,
+            so edits or deletions break the chain
+        journal_id: Redis stream entry ID the action was journaled under,
+            so a replayed entry is written only once
     """
     
     __tablename__ = "admin_actions"
+    __table_args__ = (
+        # Audit log keyset pagination: ORDER BY created_at DESC, id DESC
+        Index('ix_admin_actions_created_at_id', text('created_at DESC'), text('id DESC')),
+        Index('ux_admin_actions_journal_id', 'journal_id', unique=True),
+    )
     
     id = Column(Integer, primary_key=True, index=True)
     admin_user_id = Column(Integer, nullable=False, index=True)
@@ -48,5 +57,11 @@ class AdminAction(Base):
     # Timestamp
     created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False, index=True)
     
+    # Tamper evidence
+    chain_hash = Column(LargeBinary(32), nullable=True)
+    
+    # Audit journal entry (None for actions written without journaling)
+    journal_id = Column(String(64), nullable=True)
+    
     def __repr__(self):
         return f"<AdminAction(id={self.id}, admin={self.admin_user_id}, action={self.action_type}, target={self.target_type}:{self.target_id})>"
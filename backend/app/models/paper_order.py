@@ -2,7 +2,7 @@
 Paper Order model for simulated trading orders.
 """
 
-from sqlalchemy import Column, Integer, Float, String, DateTime, ForeignKey, Enum as SQLEnum
+from sqlalchemy import Column, Integer, Float, String, DateTime, ForeignKey, Index, text, Enum as SQLEnum
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from app.db import Base
@@ -69,10 +69,21 @@ class PaperOrder(Base):
     """
     
     __tablename__ = "paper_orders"
+    __table_args__ = (
+        Index('ix_paper_orders_executed', 'id', postgresql_where=text("status = 'EXECUTED'")),
+        Index('ix_paper_orders_tournament_user', 'tournament_id', 'user_id'),
+        Index(
+            'ix_paper_orders_tournament_user_executed', 'tournament_id', 'user_id',
+            postgresql_include=['realized_pnl'],
+            postgresql_where=text("status = 'EXECUTED'")
+        ),
+        # Order history: WHERE user_id = ? ORDER BY created_at DESC LIMIT n
+        Index('ix_paper_orders_user_created', 'user_id', text('created_at DESC')),
+    )
     
     id = Column(Integer, primary_key=True, index=True)
     user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True)
-    tournament_id = Column(Integer, ForeignKey("tournaments.id", ondelete="CASCADE"), nullable=True, index=True)
+    tournament_id = Column(Integer, ForeignKey("tournaments.id", ondelete="CASCADE"), nullable=True)
     
     # Instrument details
     symbol = Column(String, nullable=False, index=True)
@@ -2,7 +2,7 @@
 Paper Position model for tracking open positions in paper trading.
 """
 
-from sqlalchemy import Column, Integer, Float, String, DateTime, ForeignKey, Enum as SQLEnum
+from sqlalchemy import Column, Integer, Float, String, DateTime, ForeignKey, Index, Enum as SQLEnum
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from app.db import Base
@@ -16,10 +16,13 @@ class PaperPosition(Base):
     """
     
     __tablename__ = "paper_positions"
+    __table_args__ = (
+        Index('ix_paper_positions_tournament_user', 'tournament_id', 'user_id'),
+    )
     
     id = Column(Integer, primary_key=True, index=True)
     user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True)
-    tournament_id = Column(Integer, ForeignKey("tournaments.id", ondelete="CASCADE"), nullable=True, index=True)
+    tournament_id = Column(Integer, ForeignKey("tournaments.id", ondelete="CASCADE"), nullable=True)
     
     # Instrument details
     tradingsymbol = Column(String, nullable=False, index=True)  # Full trading symbol (e.g., NIFTY24NOV24000CE)
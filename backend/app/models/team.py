@@ -47,7 +47,7 @@ class Team(Base):
     # Relationships
     tournament = relationship("Tournament", back_populates="teams")
     captain = relationship("User", foreign_keys=[captain_id])
-    members = relationship("TeamMember", back_populates="team", cascade="all, delete-orphan")
+    members = relationship("TeamMember", back_populates="team", cascade="all, delete-orphan", passive_deletes=True)
     
     def __repr__(self):
         return f"<Team(id={self.id}, name={self.name}, tournament_id={self.tournament_id}, members={self.total_members})>"
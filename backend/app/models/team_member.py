@@ -40,7 +40,7 @@ class TeamMember(Base):
     id = Column(Integer, primary_key=True, index=True)
     team_id = Column(Integer, ForeignKey("teams.id", ondelete="CASCADE"), nullable=False, index=True)
     user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True)
-    role = Column(SQLEnum(MemberRole), default=MemberRole.MEMBER, nullable=False)
+    role = Column(SQLEnum(MemberRole, native_enum=False, length=16), default=MemberRole.MEMBER, nullable=False)
     is_active = Column(Boolean, default=True, nullable=False)
     
     # Timestamps
@@ -2,7 +2,7 @@
 Tournament model for managing trading competitions.
 """
 
-from sqlalchemy import Column, Integer, Float, String, DateTime, Boolean, Text, Enum as SQLEnum
+from sqlalchemy import Column, Integer, Float, String, DateTime, Boolean, Text, Index, Computed, CheckConstraint, case, text, Enum as SQLEnum
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from app.db import Base
@@ -34,6 +34,7 @@ class Tournament(Base):
         name: Tournament name
         description: Tournament description
         status: Current tournament status
+        is_live: Generated flag, true while registration is open or the tournament is active
         entry_fee: Entry fee (optional, 0 for free tournaments)
         prize_pool: Total prize pool in INR (REAL MONEY)
         starting_balance: Virtual balance each participant starts with
@@ -53,12 +54,23 @@ class Tournament(Base):
     """
     
     __tablename__ = "tournaments"
+    __table_args__ = (
+        Index('ix_tournaments_is_live', 'is_live', postgresql_where=text('is_live')),
+        Index('ix_tournaments_status_start_end', 'status', 'start_date', 'end_date'),
+        Index('ix_tournaments_created_at_desc', text('created_at DESC')),
+        CheckConstraint(
+            "(tournament_type = 'SOLO' AND team_size IS NULL) OR "
+            "(tournament_type = 'TEAM' AND team_size BETWEEN 2 AND 10)",
+            name='ck_tournaments_team_size'
+        ),
+    )
     
     id = Column(Integer, primary_key=True, index=True)
     name = Column(String, nullable=False, index=True)
     description = Column(Text, nullable=True)
     status = Column(SQLEnum(TournamentStatus), default=TournamentStatus.UPCOMING, nullable=False, index=True)
-    tournament_type = Column(SQLEnum(TournamentType), default=TournamentType.SOLO, nullable=False, index=True)
+    is_live = Column(Boolean, Computed("status IN ('REGISTRATION_OPEN', 'ACTIVE')", persisted=True))  # Open for registration or running
+    tournament_type = Column(SQLEnum(TournamentType, native_enum=False, length=16), default=TournamentType.SOLO, nullable=False, index=True)
     team_size = Column(Integer, nullable=True)  # Required for TEAM tournaments, null for SOLO
     
     # Financial details
@@ -84,14 +96,32 @@ class Tournament(Base):
     updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False)
     
     # Relationships
-    participants = relationship("TournamentParticipant", back_populates="tournament", cascade="all, delete-orphan")
-    rankings = relationship("TournamentRanking", back_populates="tournament", cascade="all, delete-orphan")
-    prize_distributions = relationship("PrizeDistribution", back_populates="tournament", cascade="all, delete-orphan")
-    teams = relationship("Team", back_populates="tournament", cascade="all, delete-orphan")
+    participants = relationship("TournamentParticipant", back_populates="tournament", cascade="all, delete-orphan", passive_deletes=True)
+    rankings = relationship("TournamentRanking", back_populates="tournament", cascade="all, delete-orphan", passive_deletes=True)
+    prize_distributions = relationship("PrizeDistribution", back_populates="tournament", cascade="all, delete-orphan", passive_deletes=True)
+    teams = relationship("Team", back_populates="tournament", cascade="all, delete-orphan", passive_deletes=True)
     
     def __repr__(self):
         return f"<Tournament(id={self.id}, name={self.name}, status={self.status}, prize_pool=₹{self.prize_pool})>"
     
+    @classmethod
+    def effective_status(cls, now):
+        """
+        SQL expression for the time-based status as of ``now``.
+        
+        Args:
+            now: Reference timestamp (timezone-aware)
+            
+        Returns:
+            CASE expression yielding a TournamentStatus value string
+        """
+        return case(
+            (cls.end_date <= now, TournamentStatus.COMPLETED.value),
+            (cls.start_date <= now, TournamentStatus.ACTIVE.value),
+            (cls.registration_deadline > now, TournamentStatus.REGISTRATION_OPEN.value),
+            else_=TournamentStatus.UPCOMING.value
+        )
+    
     @property
     def is_registration_open(self) -> bool:
         """Check if registration is still open."""
@@ -2,7 +2,7 @@
 User model for authentication and user management.
 """
 
-from sqlalchemy import Column, Integer, String, Boolean, DateTime
+from sqlalchemy import Column, Integer, String, Boolean, DateTime, Index, DDL, event, text
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from app.db import Base
@@ -31,6 +31,13 @@ class User(Base):
     """
     
     __tablename__ = "users"
+    __table_args__ = (
+        Index('ix_users_active', 'id', postgresql_where=text('is_active')),
+        Index('ix_users_active_admin_id', 'is_active', 'is_admin', text('id DESC')),
+        # Trigram indexes for the admin ILIKE '%search%' filter
+        Index('ix_users_email_trgm', 'email', postgresql_using='gin', postgresql_ops={'email': 'gin_trgm_ops'}),
+        Index('ix_users_username_trgm', 'username', postgresql_using='gin', postgresql_ops={'username': 'gin_trgm_ops'}),
+    )
     
     id = Column(Integer, primary_key=True, index=True)
     email = Column(String, unique=True, index=True, nullable=False)
@@ -42,13 +49,21 @@ class User(Base):
     updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False)
     
     # Relationships
-    wallet = relationship("Wallet", back_populates="user", uselist=False, cascade="all, delete-orphan")
-    paper_orders = relationship("PaperOrder", back_populates="user", cascade="all, delete-orphan")
-    paper_positions = relationship("PaperPosition", back_populates="user", cascade="all, delete-orphan")
-    tournament_participants = relationship("TournamentParticipant", back_populates="user", cascade="all, delete-orphan")
-    settings = relationship("UserSettings", back_populates="user", uselist=False, cascade="all, delete-orphan")
-    notifications = relationship("Notification", back_populates="user", cascade="all, delete-orphan")
-    team_memberships = relationship("TeamMember", back_populates="user", cascade="all, delete-orphan")
+    wallet = relationship("Wallet", back_populates="user", uselist=False, cascade="all, delete-orphan", passive_deletes=True)
+    paper_orders = relationship("PaperOrder", back_populates="user", cascade="all, delete-orphan", passive_deletes=True)
+    paper_positions = relationship("PaperPosition", back_populates="user", cascade="all, delete-orphan", passive_deletes=True)
+    tournament_participants = relationship("TournamentParticipant", back_populates="user", cascade="all, delete-orphan", passive_deletes=True)
+    settings = relationship("UserSettings", back_populates="user", uselist=False, cascade="all, delete-orphan", passive_deletes=True)
+    notifications = relationship("Notification", back_populates="user", cascade="all, delete-orphan", passive_deletes=True)
+    team_memberships = relationship("TeamMember", back_populates="user", cascade="all, delete-orphan", passive_deletes=True)
     
     def __repr__(self):
         return f"<User(id={self.id}, email={self.email}, username={self.username})>"
+
+
+# The trigram indexes need pg_trgm before the table is created
+event.listen(
+    User.__table__,
+    "before_create",
+    DDL("CREATE EXTENSION IF NOT EXISTS pg_trgm").execute_if(dialect="postgresql")
+)
@@ -49,6 +49,7 @@ class RecentActivityResponse(BaseModel):
     total_count: int
     page: int
     page_size: int
+    next_cursor: Optional[int] = None  # Pass as before_id to fetch the next page
 
 
 class TopPerformer(BaseModel):
@@ -337,6 +338,7 @@ class AdminActionListResponse(BaseModel):
     total_count: int
     page: int
     page_size: int
+    next_cursor: Optional[str] = None
 
 
 # ============================================================================
@@ -371,6 +373,7 @@ class UserListResponse(BaseModel):
     total_count: int
     page: int
     page_size: int
+    next_cursor: Optional[int] = None  # Pass as before_id to fetch the next page
 
 
 class UpdateUserRequest(BaseModel):
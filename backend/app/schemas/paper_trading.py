@@ -111,6 +111,7 @@ class PortfolioSummary(BaseModel):
     total_pnl_percentage: float
     open_positions_count: int
     total_trades: int
+    wallet: WalletResponse
 
 
 class TradeHistory(BaseModel):
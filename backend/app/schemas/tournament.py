@@ -2,7 +2,7 @@
 Tournament schemas for competitions and leaderboard.
 """
 
-from pydantic import BaseModel, Field, validator
+from pydantic import BaseModel, Field, validator, model_validator
 from typing import Optional, List
 from datetime import datetime
 from app.models.tournament import TournamentStatus, TournamentType
@@ -24,13 +24,15 @@ class TournamentCreate(BaseModel):
     registration_deadline: datetime
     rules: Optional[str] = None
     
-    @validator('team_size')
-    def validate_team_size(cls, v, values):
-        """Validate that team_size is provided for TEAM tournaments."""
-        if 'tournament_type' in values and values['tournament_type'] == TournamentType.TEAM:
-            if v is None:
+    @model_validator(mode='after')
+    def validate_team_size(self):
+        """Validate team_size against tournament_type (mirrors ck_tournaments_team_size)."""
+        if self.tournament_type == TournamentType.TEAM:
+            if self.team_size is None:
                 raise ValueError('team_size is required for TEAM tournaments')
-        return v
+        elif self.team_size is not None:
+            raise ValueError('team_size is only allowed for TEAM tournaments')
+        return self
     
     @validator('end_date')
     def validate_end_date(cls, v, values):
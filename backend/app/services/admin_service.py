@@ -3,7 +3,9 @@ Admin service for administrative operations and management.
 """
 
 from sqlalchemy.orm import Session
-from sqlalchemy import desc, func, and_, or_
+from sqlalchemy import desc, func, and_, or_, select, table, column, true, insert, literal, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.exc import IntegrityError
 from typing import List, Optional, Dict, Any
 from datetime import datetime, timedelta
 
@@ -22,10 +24,49 @@ from app.schemas.admin import (
     UserAnalyticsResponse,
     UserTournamentHistory
 )
+from app.services.audit_logger import get_admin_action_logger
+from app.services.tournament_status_cache import get_active_tournament_cache
 from app.utils.logger import setup_logger
 
 logger = setup_logger(__name__)
 
+# Materialized view maintained by the add_mv_user_performance migration
+mv_user_performance = table(
+    "mv_user_performance",
+    column("user_id"),
+    column("username"),
+    column("email"),
+    column("pnl"),
+    column("win_rate"),
+    column("roi"),
+    column("trades"),
+    column("tournaments_joined")
+)
+
+# Materialized view maintained by the add_mv_tournament_stats migration
+mv_tournament_stats = table(
+    "mv_tournament_stats",
+    column("tournament_id"),
+    column("total_participants"),
+    column("active_participants"),
+    column("total_trades"),
+    column("total_volume"),
+    column("total_pnl"),
+    column("top_pnl"),
+    column("worst_pnl"),
+    column("profitable_participants"),
+    column("losing_participants"),
+    column("break_even_participants")
+)
+
+# metric -> (view column, display name)
+TOP_PERFORMER_METRICS = {
+    "pnl": ("pnl", "Total P&L"),
+    "win_rate": ("win_rate", "Win Rate"),
+    "roi": ("roi", "ROI"),
+    "trades": ("trades", "Total Trades"),
+}
+
 
 class AdminService:
     """Service for admin operations and management."""
@@ -50,34 +91,65 @@ class AdminService:
         Returns:
             Dashboard overview with key metrics
         """
-        # User metrics
-        total_users = self.db.query(User).count()
-        active_users = self.db.query(User).filter(User.is_active == True).count()
-        
-        # Tournament metrics
-        total_tournaments = self.db.query(Tournament).count()
-        active_tournaments = self.db.query(Tournament).filter(
-            Tournament.status.in_([TournamentStatus.REGISTRATION_OPEN, TournamentStatus.ACTIVE])
-        ).count()
-        completed_tournaments = self.db.query(Tournament).filter(
-            Tournament.status == TournamentStatus.COMPLETED
-        ).count()
-        
-        # Participant metrics
-        total_participants = self.db.query(TournamentParticipant).count()
-        
-        # Order metrics
-        total_orders = self.db.query(PaperOrder).count()
-        executed_orders = self.db.query(PaperOrder).filter(
-            PaperOrder.status == OrderStatus.EXECUTED
-        ).count()
-        
-        # Revenue metrics
-        total_revenue = self.db.query(func.sum(Tournament.entry_fee * Tournament.current_participants)).scalar() or 0.0
-        
-        # Platform balance (sum of all user wallets)
         from app.models.wallet import Wallet
-        platform_balance = self.db.query(func.sum(Wallet.balance)).scalar() or 0.0
+        
+        # One round-trip: each table is aggregated once with FILTER clauses
+        user_stats = select(
+            func.count().label("total"),
+            func.count().filter(User.is_active == True).label("active")
+        ).select_from(User).subquery()
+        tournament_stats = select(
+            func.count().label("total"),
+            func.count().filter(Tournament.is_live == True).label("live"),
+            func.count().filter(Tournament.status == TournamentStatus.COMPLETED).label("completed"),
+            func.coalesce(func.sum(Tournament.entry_fee * Tournament.current_participants), 0.0).label("revenue")
+        ).select_from(Tournament).subquery()
+        participant_stats = select(
+            func.count().label("total")
+        ).select_from(TournamentParticipant).subquery()
+        order_stats = select(
+            func.count().label("total"),
+            func.count().filter(PaperOrder.status == OrderStatus.EXECUTED).label("executed")
+        ).select_from(PaperOrder).subquery()
+        wallet_stats = select(
+            func.coalesce(func.sum(Wallet.balance), 0.0).label("balance")
+        ).select_from(Wallet).subquery()
+        
+        row = self.db.execute(
+            select(
+                user_stats.c.total.label("total_users"),
+                user_stats.c.active.label("active_users"),
+                tournament_stats.c.total.label("total_tournaments"),
+                tournament_stats.c.live.label("live_tournaments"),
+                tournament_stats.c.completed.label("completed_tournaments"),
+                tournament_stats.c.revenue.label("total_revenue"),
+                participant_stats.c.total.label("total_participants"),
+                order_stats.c.total.label("total_orders"),
+                order_stats.c.executed.label("executed_orders"),
+                wallet_stats.c.balance.label("platform_balance")
+            ).select_from(
+                user_stats
+                .join(tournament_stats, true())
+                .join(participant_stats, true())
+                .join(order_stats, true())
+                .join(wallet_stats, true())
+            )
+        ).one()
+        
+        total_users = row.total_users
+        active_users = row.active_users
+        total_tournaments = row.total_tournaments
+        completed_tournaments = row.completed_tournaments
+        total_participants = row.total_participants
+        total_orders = row.total_orders
+        executed_orders = row.executed_orders
+        total_revenue = row.total_revenue
+        platform_balance = row.platform_balance
+        
+        # Prefer the LISTEN/NOTIFY-backed cache when it is in sync
+        active_tournaments = get_active_tournament_cache().count()
+        if active_tournaments is None:
+            active_tournaments = row.live_tournaments
         
         return DashboardOverviewResponse(
             total_users=total_users,
@@ -92,43 +164,69 @@ class AdminService:
             platform_balance=platform_balance
         )
     
-    def get_recent_activity(self, limit: int = 50, offset: int = 0) -> Dict[str, Any]:
+    def get_recent_activity(
+        self,
+        limit: int = 50,
+        offset: int = 0,
+        before_id: Optional[int] = None
+    ) -> Dict[str, Any]:
         """
         Get recent platform activity.
         
         Args:
             limit: Maximum number of activities
-            offset: Offset for pagination
+            offset: Offset for pagination (ignored when before_id is given)
+            before_id: Keyset cursor, return actions older than this id
             
         Returns:
             Recent activity items
         """
-        activities = []
-        
-        # Get recent admin actions
-        admin_actions = self.db.query(AdminAction).order_by(
-            desc(AdminAction.created_at)
-        ).limit(limit).offset(offset).all()
-        
-        for action in admin_actions:
-            admin_user = self.db.query(User).filter(User.id == action.admin_user_id).first()
-            activities.append(RecentActivityItem(
-                id=action.id,
-                type=action.action_type,
-                description=action.description,
-                user_id=action.admin_user_id,
-                username=admin_user.username if admin_user else "Unknown",
-                timestamp=action.created_at,
-                metadata=action.action_metadata
-            ))
-        
-        total_count = self.db.query(AdminAction).count()
+        # Get recent admin actions, newest first by primary key; the total
+        # rides along as a window count when paging by offset
+        if before_id is not None:
+            total_count_column = select(func.count(AdminAction.id)).scalar_subquery()
+        else:
+            total_count_column = func.count().over()
+        query = self.db.query(
+            AdminAction,
+            User.username,
+            total_count_column.label("total_count")
+        ).outerjoin(User, User.id == AdminAction.admin_user_id)
+        
+        if before_id is not None:
+            query = query.filter(AdminAction.id < before_id)
+        query = query.order_by(desc(AdminAction.id)).limit(limit)
+        if before_id is None:
+            query = query.offset(offset)
+        rows = query.all()
+        
+        activities = [
+            RecentActivityItem(
+                id=row.AdminAction.id,
+                type=row.AdminAction.action_type,
+                description=row.AdminAction.description,
+                user_id=row.AdminAction.admin_user_id,
+                username=row.username or "Unknown",
+                timestamp=row.AdminAction.created_at,
+                metadata=row.AdminAction.action_metadata
+            )
+            for row in rows
+        ]
+        
+        if rows:
+            total_count = rows[0].total_count
+        elif offset or before_id is not None:
+            # Past the last page; the total has no row to ride on
+            total_count = self.db.query(func.count(AdminAction.id)).scalar()
+        else:
+            total_count = 0
         
         return {
             "activities": activities,
             "total_count": total_count,
             "page": offset // limit + 1 if limit > 0 else 1,
-            "page_size": limit
+            "page_size": limit,
+            "next_cursor": rows[-1].AdminAction.id if len(rows) == limit else None
         }
     
     def get_top_performers(self, metric: str = "pnl", limit: int = 10) -> List[Dict[str, Any]]:
@@ -142,51 +240,33 @@ class AdminService:
         Returns:
             List of top performers
         """
-        # Aggregate participant stats by user
-        if metric == "pnl":
-            order_by = desc(func.sum(TournamentParticipant.total_pnl))
-            metric_name = "Total P&L"
-        elif metric == "win_rate":
-            order_by = desc(func.avg(TournamentParticipant.win_rate))
-            metric_name = "Win Rate"
-        elif metric == "roi":
-            order_by = desc(func.avg(TournamentParticipant.roi))
-            metric_name = "ROI"
-        else:  # trades
-            order_by = desc(func.sum(TournamentParticipant.total_trades))
-            metric_name = "Total Trades"
-        
-        results = self.db.query(
-            TournamentParticipant.user_id,
-            func.sum(TournamentParticipant.total_pnl).label('total_pnl'),
-            func.avg(TournamentParticipant.win_rate).label('avg_win_rate'),
-            func.avg(TournamentParticipant.roi).label('avg_roi'),
-            func.sum(TournamentParticipant.total_trades).label('total_trades'),
-            func.count(TournamentParticipant.id).label('tournaments_joined')
-        ).group_by(TournamentParticipant.user_id).order_by(order_by).limit(limit).all()
-        
-        performers = []
-        for result in results:
-            user = self.db.query(User).filter(User.id == result.user_id).first()
-            if user:
-                if metric == "pnl":
-                    metric_value = float(result.total_pnl or 0)
-                elif metric == "win_rate":
-                    metric_value = float(result.avg_win_rate or 0)
-                elif metric == "roi":
-                    metric_value = float(result.avg_roi or 0)
-                else:
-                    metric_value = float(result.total_trades or 0)
-                
-                performers.append({
-                    "user_id": user.id,
-                    "username": user.username,
-                    "email": user.email,
-                    "metric_value": metric_value,
-                    "metric_name": metric_name,
-                    "tournaments_joined": result.tournaments_joined,
-                    "total_trades": result.total_trades or 0
-                })
+        view_column, metric_name = TOP_PERFORMER_METRICS.get(metric, TOP_PERFORMER_METRICS["trades"])
+        metric_column = getattr(mv_user_performance.c, view_column)
+        
+        # Pre-aggregated view with a descending index per metric
+        results = self.db.execute(
+            select(
+                mv_user_performance.c.user_id,
+                mv_user_performance.c.username,
+                mv_user_performance.c.email,
+                metric_column.label("metric_value"),
+                mv_user_performance.c.trades,
+                mv_user_performance.c.tournaments_joined
+            ).order_by(desc(metric_column).nulls_last()).limit(limit)
+        ).all()
+        
+        performers = [
+            {
+                "user_id": result.user_id,
+                "username": result.username,
+                "email": result.email,
+                "metric_value": float(result.metric_value or 0),
+                "metric_name": metric_name,
+                "tournaments_joined": result.tournaments_joined,
+                "total_trades": result.trades or 0
+            }
+            for result in results
+        ]
         
         return performers
     
@@ -208,36 +288,20 @@ class AdminService:
         if not tournament:
             return None
         
-        # Participation metrics
-        participants = self.db.query(TournamentParticipant).filter(
-            TournamentParticipant.tournament_id == tournament_id
-        ).all()
+        # Pre-aggregated by the mv_tournament_stats view (refreshed every
+        # minute); tournaments created since the last refresh have no row yet
+        stats = self.db.execute(
+            select(mv_tournament_stats).where(mv_tournament_stats.c.tournament_id == tournament_id)
+        ).first()
         
-        total_participants = len(participants)
-        active_participants = sum(1 for p in participants if p.total_trades > 0)
+        total_participants = stats.total_participants if stats else 0
+        total_trades = stats.total_trades if stats else 0
+        total_volume = float(stats.total_volume) if stats else 0.0
+        total_pnl = float(stats.total_pnl) if stats else 0.0
         
-        # Trading metrics
-        total_trades = sum(p.total_trades for p in participants)
         avg_trades_per_participant = total_trades / total_participants if total_participants > 0 else 0
-        
-        # Get total volume from orders
-        total_volume = self.db.query(func.sum(PaperOrder.quantity * PaperOrder.price)).filter(
-            PaperOrder.user_id.in_([p.user_id for p in participants]),
-            PaperOrder.status == OrderStatus.EXECUTED
-        ).scalar() or 0.0
-        
         avg_trade_size = total_volume / total_trades if total_trades > 0 else 0
-        
-        # Performance metrics
-        total_pnl = sum(p.total_pnl for p in participants)
         avg_pnl = total_pnl / total_participants if total_participants > 0 else 0
-        top_pnl = max((p.total_pnl for p in participants), default=0)
-        worst_pnl = min((p.total_pnl for p in participants), default=0)
-        
-        # Distribution
-        profitable_participants = sum(1 for p in participants if p.total_pnl > 0)
-        losing_participants = sum(1 for p in participants if p.total_pnl < 0)
-        break_even_participants = sum(1 for p in participants if p.total_pnl == 0)
         
         # Time metrics
         now = datetime.now(tournament.start_date.tzinfo)
@@ -250,18 +314,18 @@ class AdminService:
             tournament_name=tournament.name,
             status=tournament.status,
             total_participants=total_participants,
-            active_participants=active_participants,
+            active_participants=stats.active_participants if stats else 0,
             avg_trades_per_participant=avg_trades_per_participant,
             total_trades=total_trades,
             total_volume=total_volume,
             avg_trade_size=avg_trade_size,
             total_pnl=total_pnl,
             avg_pnl=avg_pnl,
-            top_pnl=top_pnl,
-            worst_pnl=worst_pnl,
-            profitable_participants=profitable_participants,
-            losing_participants=losing_participants,
-            break_even_participants=break_even_participants,
+            top_pnl=float(stats.top_pnl) if stats else 0.0,
+            worst_pnl=float(stats.worst_pnl) if stats else 0.0,
+            profitable_participants=stats.profitable_participants if stats else 0,
+            losing_participants=stats.losing_participants if stats else 0,
+            break_even_participants=stats.break_even_participants if stats else 0,
             start_date=tournament.start_date,
             end_date=tournament.end_date,
             days_remaining=days_remaining
@@ -284,40 +348,55 @@ class AdminService:
         Returns:
             Participants list with details
         """
-        participants = self.db.query(TournamentParticipant).filter(
+        # Page, user, rank and total in one query
+        rows = self.db.query(
+            TournamentParticipant,
+            User.username,
+            User.email,
+            TournamentRanking.rank,
+            func.count().over().label("total_count")
+        ).join(
+            User, User.id == TournamentParticipant.user_id
+        ).outerjoin(
+            TournamentRanking,
+            and_(
+                TournamentRanking.tournament_id == TournamentParticipant.tournament_id,
+                TournamentRanking.user_id == TournamentParticipant.user_id
+            )
+        ).filter(
             TournamentParticipant.tournament_id == tournament_id
         ).order_by(desc(TournamentParticipant.total_pnl)).limit(limit).offset(offset).all()
         
-        participant_details = []
-        for participant in participants:
-            user = self.db.query(User).filter(User.id == participant.user_id).first()
-            ranking = self.db.query(TournamentRanking).filter(
-                TournamentRanking.tournament_id == tournament_id,
-                TournamentRanking.user_id == participant.user_id
-            ).first()
-            
-            if user:
-                participant_details.append(ParticipantDetail(
-                    id=participant.id,
-                    user_id=user.id,
-                    username=user.username,
-                    email=user.email,
-                    starting_balance=participant.starting_balance,
-                    current_balance=participant.current_balance,
-                    total_pnl=participant.total_pnl,
-                    roi=participant.roi,
-                    total_trades=participant.total_trades,
-                    winning_trades=participant.winning_trades,
-                    losing_trades=participant.losing_trades,
-                    win_rate=participant.win_rate,
-                    rank=ranking.rank if ranking else None,
-                    joined_at=participant.joined_at,
-                    last_trade_at=participant.last_trade_at
-                ))
-        
-        total_count = self.db.query(TournamentParticipant).filter(
-            TournamentParticipant.tournament_id == tournament_id
-        ).count()
+        participant_details = [
+            ParticipantDetail(
+                id=row.TournamentParticipant.id,
+                user_id=row.TournamentParticipant.user_id,
+                username=row.username,
+                email=row.email,
+                starting_balance=row.TournamentParticipant.starting_balance,
+                current_balance=row.TournamentParticipant.current_balance,
+                total_pnl=row.TournamentParticipant.total_pnl,
+                roi=row.TournamentParticipant.roi,
+                total_trades=row.TournamentParticipant.total_trades,
+                winning_trades=row.TournamentParticipant.winning_trades,
+                losing_trades=row.TournamentParticipant.losing_trades,
+                win_rate=row.TournamentParticipant.win_rate,
+                rank=row.rank,
+                joined_at=row.TournamentParticipant.joined_at,
+                last_trade_at=row.TournamentParticipant.last_trade_at
+            )
+            for row in rows
+        ]
+        
+        if rows:
+            total_count = rows[0].total_count
+        elif offset:
+            # Past the last page; the total has no row to ride on
+            total_count = self.db.query(func.count(TournamentParticipant.id)).filter(
+                TournamentParticipant.tournament_id == tournament_id
+            ).scalar()
+        else:
+            total_count = 0
         
         return {
             "tournament_id": tournament_id,
@@ -355,7 +434,7 @@ class AdminService:
             return False
         
         tournament = self.db.query(Tournament).filter(Tournament.id == tournament_id).first()
-        user = self.db.query(User).filter(User.id == user_id).first()
+        username = self.db.query(User.username).filter(User.id == user_id).scalar()
         
         # Delete participant
         self.db.delete(participant)
@@ -378,12 +457,12 @@ class AdminService:
             action_type="REMOVE_PARTICIPANT",
             target_type="TOURNAMENT_PARTICIPANT",
             target_id=participant.id,
-            description=f"Removed user {user.username if user else user_id} from tournament {tournament.name if tournament else tournament_id}",
+            description=f"Removed user {username or user_id} from tournament {tournament.name if tournament else tournament_id}",
             action_metadata={"reason": reason, "tournament_id": tournament_id, "user_id": user_id}
         )
         
         # Send notification to user
-        if user:
+        if username is not None:
             self.create_notification(
                 user_id=user_id,
                 title="Removed from Tournament",
@@ -401,7 +480,7 @@ class AdminService:
         user_id: int,
         admin_user_id: int,
         starting_balance: Optional[float] = None
-    ) -> Optional[TournamentParticipant]:
+    ) -> Optional[int]:
         """
         Manually add a participant to a tournament.
         
@@ -412,71 +491,89 @@ class AdminService:
             starting_balance: Optional custom starting balance
             
         Returns:
-            TournamentParticipant or None
+            New participant ID, or None if the tournament or user does not
+            exist or the user is already participating
         """
-        tournament = self.db.query(Tournament).filter(Tournament.id == tournament_id).first()
-        user = self.db.query(User).filter(User.id == user_id).first()
+        # Custom starting balance or the tournament default
+        balance = func.coalesce(
+            starting_balance or None,
+            select(Tournament.starting_balance).where(Tournament.id == tournament_id).scalar_subquery()
+        )
         
-        if not tournament or not user:
+        # One statement: the unique constraint replaces the "already
+        # participating" check and the foreign keys replace the existence checks
+        stmt = (
+            pg_insert(TournamentParticipant)
+            .values(
+                tournament_id=tournament_id,
+                user_id=user_id,
+                entry_fee_paid=True,
+                starting_balance=balance,
+                initial_balance=balance,
+                current_balance=balance
+            )
+            .on_conflict_do_nothing(constraint="unique_tournament_user")
+            .returning(
+                TournamentParticipant.id,
+                TournamentParticipant.starting_balance,
+                select(User.username).where(User.id == user_id).scalar_subquery().label("username")
+            )
+        )
+        try:
+            participant = self.db.execute(stmt).first()
+        except IntegrityError:
+            # Tournament or user does not exist
+            self.db.rollback()
             return None
         
-        # Check if already participating
-        existing = self.db.query(TournamentParticipant).filter(
-            TournamentParticipant.tournament_id == tournament_id,
-            TournamentParticipant.user_id == user_id
-        ).first()
-        
-        if existing:
+        if participant is None:
+            # Already participating
+            self.db.rollback()
             return None
         
-        # Use custom starting balance or tournament default
-        balance = starting_balance or tournament.starting_balance
-        
-        # Create participant
-        participant = TournamentParticipant(
-            tournament_id=tournament_id,
-            user_id=user_id,
-            entry_fee_paid=True,
-            starting_balance=balance,
-            current_balance=balance
-        )
-        self.db.add(participant)
-        
         # Update tournament count
-        tournament.current_participants += 1
+        tournament = self.db.execute(
+            update(Tournament)
+            .where(Tournament.id == tournament_id)
+            .values(current_participants=Tournament.current_participants + 1)
+            .returning(Tournament.name, Tournament.current_participants)
+            .execution_options(synchronize_session=False)
+        ).first()
         
         # Create ranking
-        ranking = TournamentRanking(
+        self.db.add(TournamentRanking(
             tournament_id=tournament_id,
             user_id=user_id,
             rank=tournament.current_participants,
-            current_balance=balance
-        )
-        self.db.add(ranking)
-        
-        # Log admin action
-        self.log_admin_action(
-            admin_user_id=admin_user_id,
-            action_type="ADD_PARTICIPANT",
-            target_type="TOURNAMENT_PARTICIPANT",
-            target_id=None,
-            description=f"Manually added user {user.username} to tournament {tournament.name}",
-            action_metadata={"tournament_id": tournament_id, "user_id": user_id, "starting_balance": balance}
-        )
+            current_balance=participant.starting_balance
+        ))
         
         # Send notification
-        self.create_notification(
+        self.db.add(Notification(
             user_id=user_id,
             title="Added to Tournament",
             message=f"You have been added to tournament '{tournament.name}' by an admin.",
             type=NotificationType.SUCCESS
-        )
+        ))
         
         self.db.commit()
-        self.db.refresh(participant)
+        
+        # Log admin action
+        self.log_admin_action(
+            admin_user_id=admin_user_id,
+            action_type="ADD_PARTICIPANT",
+            target_type="TOURNAMENT_PARTICIPANT",
+            target_id=None,
+            description=f"Manually added user {participant.username} to tournament {tournament.name}",
+            action_metadata={
+                "tournament_id": tournament_id,
+                "user_id": user_id,
+                "starting_balance": participant.starting_balance
+            }
+        )
         
         logger.info(f"Manually added participant {user_id} to tournament {tournament_id}")
-        return participant
+        return participant.id
     
     # ========================================================================
     # User Management Methods
@@ -621,10 +718,13 @@ class AdminService:
         action_metadata: Optional[Dict[str, Any]] = None,
         ip_address: Optional[str] = None,
         user_agent: Optional[str] = None
-    ) -> AdminAction:
+    ):
         """
         Log an admin action for audit trail.
         
+        The action is queued and written in batches by the background
+        admin action logger, so no commit happens on the request path.
+        
         Args:
             admin_user_id: Admin user ID
             action_type: Type of action
@@ -634,26 +734,19 @@ class AdminService:
             action_metadata: Optional additional data
             ip_address: Optional IP address
             user_agent: Optional user agent
-            
-        Returns:
-            Created AdminAction
         """
-        action = AdminAction(
-            admin_user_id=admin_user_id,
-            action_type=action_type,
-            target_type=target_type,
-            target_id=target_id,
-            description=description,
-            action_metadata=action_metadata,
-            ip_address=ip_address,
-            user_agent=user_agent
-        )
-        self.db.add(action)
-        self.db.commit()
-        self.db.refresh(action)
+        get_admin_action_logger().enqueue({
+            "admin_user_id": admin_user_id,
+            "action_type": action_type,
+            "target_type": target_type,
+            "target_id": target_id,
+            "description": description,
+            "action_metadata": action_metadata,
+            "ip_address": ip_address,
+            "user_agent": user_agent
+        })
         
         logger.info(f"Admin action logged: {action_type} by user {admin_user_id}")
-        return action
     
     def create_notification(
         self,
@@ -711,16 +804,33 @@ class AdminService:
         Returns:
             Result with success count and failed user IDs
         """
-        notifications_sent = 0
-        failed_user_ids = []
-        
-        for user_id in user_ids:
-            try:
-                self.create_notification(user_id, title, message, type, action_url)
-                notifications_sent += 1
-            except Exception as e:
-                logger.error(f"Failed to send notification to user {user_id}: {e}")
-                failed_user_ids.append(user_id)
+        # One INSERT ... SELECT for every recipient; ids without a user are
+        # skipped by the join instead of failing the foreign key
+        stmt = (
+            insert(Notification)
+            .from_select(
+                ["user_id", "title", "message", "type", "action_url"],
+                select(
+                    User.id,
+                    literal(title, Notification.title.type),
+                    literal(message, Notification.message.type),
+                    literal(type, Notification.type.type),
+                    literal(action_url, Notification.action_url.type),
+                ).where(User.id.in_(user_ids))
+            )
+            .returning(Notification.user_id)
+        )
+        try:
+            sent_user_ids = set(self.db.execute(stmt).scalars())
+            self.db.commit()
+        except Exception as e:
+            self.db.rollback()
+            logger.error(f"Failed to send bulk notification: {e}")
+            sent_user_ids = set()
+        
+        notifications_sent = len(sent_user_ids)
+        failed_user_ids = [user_id for user_id in user_ids if user_id not in sent_user_ids]
+        logger.info(f"Bulk notification sent to {notifications_sent} users: {title}")
         
         return {
             "success": True,
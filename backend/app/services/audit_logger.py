@@ -0,0 +1,341 @@
+"""
+Buffered audit logger for admin actions.
+
+Admin actions are queued in-process and written to the database in batches
+by a background task, keeping the audit INSERT + COMMIT off the request path.
+Queued actions are also journaled to a Redis stream until they are written,
+so entries lost with the process are replayed on the next startup. Rows
+record their stream entry ID, so an entry is never written twice.
+
+Rows are hash-chained: each row's ``chain_hash`` is SHA-256 over the previous
+row's ``chain_hash`` and the row's own content, so editing or deleting an
+entry is detectable with ``verify_chain``.
+"""
+
+import asyncio
+import hashlib
+import json
+from datetime import datetime, timezone
+from typing import Optional, Dict, Any, List, Set
+
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+from app.db import SessionLocal
+from app.models.admin_action import AdminAction
+from app.utils.cache import get_redis, is_available, LOCK_PREFIX
+from app.utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+JOURNAL_STREAM = "audit:admin_actions"
+
+# One worker replays the journal at a time
+REPLAY_LOCK = LOCK_PREFIX + JOURNAL_STREAM
+REPLAY_LOCK_TTL = 300
+
+# Serializes chain extension across workers
+CHAIN_LOCK_KEY = 7302
+
+# Columns covered by chain_hash
+CHAINED_FIELDS = (
+    "admin_user_id", "action_type", "target_type", "target_id",
+    "description", "action_metadata", "ip_address", "user_agent", "created_at",
+)
+
+
+def chain_hash(prev_hash: Optional[bytes], action: Dict[str, Any]) -> bytes:
+    """
+    Compute the chain hash of an admin action.
+
+    Args:
+        prev_hash: chain_hash of the preceding row (None for the first row)
+        action: AdminAction column values
+
+    Returns:
+        SHA-256 digest of prev_hash followed by the canonical row JSON
+    """
+    row = {field: action.get(field) for field in CHAINED_FIELDS}
+    created_at = row["created_at"]
+    if isinstance(created_at, datetime):
+        row["created_at"] = created_at.astimezone(timezone.utc).isoformat()
+    payload = json.dumps(row, sort_keys=True, separators=(",", ":"), default=str).encode()
+    return hashlib.sha256(bytes(prev_hash or b"") + payload).digest()
+
+
+def verify_chain(db: Session, batch_size: int = 1000) -> Optional[int]:
+    """
+    Check the admin action hash chain.
+
+    Args:
+        db: Database session
+        batch_size: Rows fetched per round trip
+
+    Returns:
+        ID of the first row whose hash does not match, or None if intact
+    """
+    prev_hash = None
+    query = db.query(AdminAction).filter(AdminAction.chain_hash.isnot(None)).order_by(AdminAction.id)
+    for action in query.yield_per(batch_size):
+        values = {field: getattr(action, field) for field in CHAINED_FIELDS}
+        expected = chain_hash(prev_hash, values)
+        if bytes(action.chain_hash) != expected:
+            return action.id
+        prev_hash = expected
+    return None
+
+
+class AdminActionLogger:
+    """Queues admin actions and flushes them to the database in batches."""
+
+    def __init__(self, maxsize: int = 1024, batch_size: int = 500, flush_interval: float = 2.0):
+        """
+        Initialize the audit logger.
+
+        Args:
+            maxsize: Maximum number of queued actions
+            batch_size: Maximum number of actions written per flush
+            flush_interval: Seconds to wait for more actions before flushing
+        """
+        self.maxsize = maxsize
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self._queue: Optional[asyncio.Queue] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._task: Optional[asyncio.Task] = None
+        self._tasks: Set[asyncio.Task] = set()
+
+    @property
+    def is_running(self) -> bool:
+        """Whether the background flush task is running."""
+        return self._task is not None and not self._task.done()
+
+    def start(self):
+        """Start the background flush task on the running event loop."""
+        if self.is_running:
+            return
+        self._replay_journal()
+        self._loop = asyncio.get_running_loop()
+        self._queue = asyncio.Queue(maxsize=self.maxsize)
+        self._task = self._loop.create_task(self._run())
+        logger.info("Admin action logger started")
+
+    async def flush(self):
+        """Write every queued action now."""
+        if self._queue is None:
+            return
+        # Queued journal writes may start spills of their own
+        while self._tasks:
+            await asyncio.gather(*self._tasks, return_exceptions=True)
+        pending = self._drain()
+        while pending:
+            await asyncio.to_thread(self._write_batch, pending)
+            pending = self._drain()
+
+    async def stop(self):
+        """Stop the background task and flush any pending actions."""
+        if not self.is_running:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+
+        await self.flush()
+
+        self._task = None
+        logger.info("Admin action logger stopped")
+
+    def enqueue(self, action: Dict[str, Any]):
+        """
+        Queue an admin action for writing.
+
+        Falls back to a synchronous write if the logger is not running,
+        and to an immediate write in a worker thread if the queue is full,
+        so no audit entries are dropped. On the event loop, the journal
+        XADD runs in a worker thread before the action is queued.
+
+        Args:
+            action: AdminAction column values
+        """
+        action.setdefault("created_at", datetime.now(timezone.utc))
+
+        if not self.is_running:
+            self._write_batch([action])
+            return
+
+        try:
+            running_loop = asyncio.get_running_loop()
+        except RuntimeError:
+            running_loop = None
+
+        if running_loop is self._loop:
+            self._track(self._loop.create_task(self._journal_and_put(action)))
+        else:
+            # Called from a worker thread; asyncio.Queue is not thread-safe
+            action["_journal_id"] = self._journal(action)
+            self._loop.call_soon_threadsafe(self._put_or_write, action)
+
+    async def _journal_and_put(self, action: Dict[str, Any]):
+        action["_journal_id"] = await asyncio.to_thread(self._journal, action)
+        self._put_or_write(action)
+
+    def _put_or_write(self, action: Dict[str, Any]):
+        try:
+            self._queue.put_nowait(action)
+        except asyncio.QueueFull:
+            logger.warning("Admin action queue full, writing immediately")
+            self._spill([action])
+
+    def _spill(self, batch: List[Dict[str, Any]]):
+        """Write a batch in a worker thread without blocking the loop."""
+        self._track(self._loop.create_task(asyncio.to_thread(self._write_batch, batch)))
+
+    def _track(self, task: asyncio.Task):
+        """Keep a task referenced until done, so flush() can wait for it."""
+        self._tasks.add(task)
+        task.add_done_callback(self._task_done)
+
+    def _task_done(self, task: asyncio.Task):
+        self._tasks.discard(task)
+        if not task.cancelled() and task.exception() is not None:
+            # Journaled entries are retried on the next start
+            logger.error(f"Failed to write admin actions: {task.exception()}")
+
+    def _drain(self) -> List[Dict[str, Any]]:
+        batch = []
+        while len(batch) < self.batch_size:
+            try:
+                batch.append(self._queue.get_nowait())
+            except asyncio.QueueEmpty:
+                break
+        return batch
+
+    async def _run(self):
+        while True:
+            batch = [await self._queue.get()]
+
+            # Give other actions a short window to accumulate
+            deadline = self._loop.time() + self.flush_interval
+            try:
+                while len(batch) < self.batch_size:
+                    timeout = deadline - self._loop.time()
+                    if timeout <= 0:
+                        break
+                    try:
+                        batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+                    except asyncio.TimeoutError:
+                        break
+            except asyncio.CancelledError:
+                # stop() waits for this in flush()
+                self._spill(batch)
+                raise
+
+            try:
+                await asyncio.to_thread(self._write_batch, batch)
+            except Exception as e:
+                logger.error(f"Failed to flush {len(batch)} admin actions: {e}")
+
+    @staticmethod
+    def _journal(action: Dict[str, Any]) -> Optional[str]:
+        if not is_available():
+            return None
+        try:
+            return get_redis().xadd(JOURNAL_STREAM, {"action": json.dumps(action, default=str)})
+        except Exception as e:
+            logger.warning(f"Could not journal admin action: {e}")
+            return None
+
+    def _replay_journal(self):
+        """Write actions left in the journal by a previous process."""
+        try:
+            # Workers starting together would otherwise replay the same entries
+            if not get_redis().set(REPLAY_LOCK, 1, nx=True, ex=REPLAY_LOCK_TTL):
+                return
+            entries = get_redis().xrange(JOURNAL_STREAM)
+        except Exception as e:
+            logger.warning(f"Could not read admin action journal: {e}")
+            return
+
+        try:
+            batch = []
+            for entry_id, fields in entries:
+                action = json.loads(fields[b"action"])
+                action["created_at"] = datetime.fromisoformat(action["created_at"])
+                action["_journal_id"] = entry_id
+                batch.append(action)
+
+            for i in range(0, len(batch), self.batch_size):
+                self._write_batch(batch[i:i + self.batch_size])
+        except Exception as e:
+            # Entries stay in the journal and are retried on the next start
+            logger.error(f"Failed to replay admin action journal: {e}")
+            return
+        finally:
+            try:
+                get_redis().delete(REPLAY_LOCK)
+            except Exception:
+                pass
+        if batch:
+            logger.info(f"Replayed {len(batch)} journaled admin actions")
+
+    @staticmethod
+    def _write_batch(batch: List[Dict[str, Any]]):
+        journal_ids = [action["_journal_id"] for action in batch if action.get("_journal_id")]
+        rows = []
+        for action in batch:
+            row = {k: v for k, v in action.items() if k != "_journal_id"}
+            journal_id = action.get("_journal_id")
+            row["journal_id"] = journal_id.decode() if isinstance(journal_id, bytes) else journal_id
+            rows.append(row)
+
+        db = SessionLocal()
+        try:
+            # Extend the chain from the last committed row; the lock keeps
+            # concurrent flushes from forking it
+            db.execute(text("SELECT pg_advisory_xact_lock(:key)"), {"key": CHAIN_LOCK_KEY})
+            
+            # The journal is at-least-once: an entry whose XDEL failed, or
+            # that is still queued in a live worker, can come back in a replay
+            entry_ids = [row["journal_id"] for row in rows if row["journal_id"]]
+            if entry_ids:
+                written = {
+                    journal_id for (journal_id,) in db.query(AdminAction.journal_id).filter(
+                        AdminAction.journal_id.in_(entry_ids)
+                    )
+                }
+                rows = [row for row in rows if row["journal_id"] not in written]
+            
+            prev_hash = db.query(AdminAction.chain_hash).filter(
+                AdminAction.chain_hash.isnot(None)
+            ).order_by(AdminAction.id.desc()).limit(1).scalar()
+            for row in rows:
+                prev_hash = row["chain_hash"] = chain_hash(prev_hash, row)
+            
+            db.bulk_insert_mappings(AdminAction, rows)
+            db.commit()
+            logger.info(f"Flushed {len(rows)} admin actions")
+        except Exception:
+            db.rollback()
+            raise
+        finally:
+            db.close()
+
+        if journal_ids:
+            try:
+                get_redis().xdel(JOURNAL_STREAM, *journal_ids)
+            except Exception as e:
+                logger.warning(f"Could not trim admin action journal: {e}")
+
+
+# Singleton instance
+_admin_action_logger: Optional[AdminActionLogger] = None
+
+
+def get_admin_action_logger() -> AdminActionLogger:
+    """Get or create the admin action logger singleton."""
+    global _admin_action_logger
+    if _admin_action_logger is None:
+        _admin_action_logger = AdminActionLogger()
+    return _admin_action_logger
@@ -2,9 +2,17 @@
 Authentication service for user management and JWT tokens.
 """
 
+import asyncio
+import os
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+import redis
 from passlib.context import CryptContext
-from sqlalchemy.orm import Session
-from typing import Optional
+from sqlalchemy.orm import Session, make_transient_to_detached
+from typing import Optional, Dict, Any, Tuple
 from datetime import timedelta
 
 from app.models.user import User
@@ -13,6 +21,7 @@ from app.models.user_settings import UserSettings
 from app.schemas.user import UserCreate, UserLogin
 from app.utils.jwt_utils import create_access_token
 from app.config import settings
+from app.utils.cache import get_redis, is_available, get_generation, bump_generation
 from app.utils.logger import setup_logger
 
 logger = setup_logger(__name__)
@@ -20,6 +29,24 @@ logger = setup_logger(__name__)
 # Password hashing context
 pwd_context = CryptContext(schemes=["argon2"], deprecated="auto")
 
+# Argon2 is deliberately CPU- and memory-hard; run it on a pool sized to the
+# CPUs so it neither blocks the event loop nor starves the shared threadpool
+_hash_executor = ThreadPoolExecutor(max_workers=os.cpu_count() or 1, thread_name_prefix="password-hash")
+
+LOGIN_FAILURE_PREFIX = "login_failures:"
+
+# Column values of recently authenticated users, so each request can attach
+# its User without a SELECT. Entries carry the user's cache generation from
+# Redis; admin changes bump it, so every worker drops its copy on the next
+# request. Without Redis the cache is bypassed.
+USER_CACHE_TTL = 30
+USER_CACHE_SIZE = 10000
+USER_GENERATION_PREFIX = "user:"
+_USER_COLUMNS = tuple(column.key for column in User.__table__.columns)
+
+_user_cache: "OrderedDict[int, Tuple[float, int, Dict[str, Any]]]" = OrderedDict()
+_user_cache_lock = threading.Lock()
+
 
 class AuthService:
     """Service for authentication and user management."""
@@ -116,6 +143,24 @@ class AuthService:
         logger.info(f"Created new user: {user.email} (ID: {user.id})")
         return user
     
+    @staticmethod
+    async def create_user_async(db: Session, user_data: UserCreate) -> User:
+        """
+        Create a new user, hashing the password off the event loop.
+        
+        Args:
+            db: Database session
+            user_data: User creation data
+            
+        Returns:
+            Created user instance
+            
+        Raises:
+            ValueError: If email or username already exists
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(_hash_executor, AuthService.create_user, db, user_data)
+    
     @staticmethod
     def authenticate_user(db: Session, login_data: UserLogin) -> Optional[User]:
         """
@@ -145,6 +190,63 @@ class AuthService:
         logger.info(f"Successful login: {user.email} (ID: {user.id})")
         return user
     
+    @staticmethod
+    async def authenticate_user_async(
+        db: Session,
+        login_data: UserLogin,
+        client_ip: Optional[str] = None
+    ) -> Optional[User]:
+        """
+        Authenticate a user off the event loop.
+        
+        A client with too many recent failures for an email is rejected
+        without hashing, so repeated guessing cannot pin the CPU. Failures
+        are counted per email and client IP, so other clients can still
+        sign in to the account.
+        
+        Args:
+            db: Database session
+            login_data: Login credentials
+            client_ip: Caller's IP address
+            
+        Returns:
+            User instance if authentication successful, None otherwise
+        """
+        key = f"{LOGIN_FAILURE_PREFIX}{login_data.email.lower()}:{client_ip or 'unknown'}"
+        
+        if await asyncio.to_thread(AuthService._failure_count, key) >= settings.LOGIN_MAX_FAILURES:
+            logger.warning(f"Login throttled for: {login_data.email} from {client_ip}")
+            return None
+        
+        loop = asyncio.get_running_loop()
+        user = await loop.run_in_executor(_hash_executor, AuthService.authenticate_user, db, login_data)
+        
+        await asyncio.to_thread(AuthService._record_login, key, user is not None)
+        return user
+    
+    @staticmethod
+    def _failure_count(key: str) -> int:
+        if not is_available():
+            return 0
+        try:
+            return int(get_redis().get(key) or 0)
+        except redis.RedisError as e:
+            logger.warning(f"Could not read login failures: {e}")
+            return 0
+    
+    @staticmethod
+    def _record_login(key: str, succeeded: bool):
+        if not is_available():
+            return
+        try:
+            if succeeded:
+                get_redis().delete(key)
+            elif get_redis().incr(key) == 1:
+                # The window starts at the first failure
+                get_redis().expire(key, settings.LOGIN_FAILURE_WINDOW_SECONDS)
+        except redis.RedisError as e:
+            logger.warning(f"Could not update login failures: {e}")
+    
     @staticmethod
     def create_token(user: User) -> str:
         """
@@ -177,6 +279,65 @@ class AuthService:
         """
         return db.query(User).filter(User.id == user_id).first()
     
+    @staticmethod
+    def get_user_by_id_cached(db: Session, user_id: int) -> Optional[User]:
+        """
+        Get user by ID, from a short-lived in-process cache when possible.
+        
+        Cache hits are attached to ``db`` with ``merge(load=False)``, so the
+        returned User behaves like a loaded one (relationships lazy load)
+        without a query. A hit is only used while the user's generation in
+        Redis matches the one it was cached under.
+        
+        Args:
+            db: Database session
+            user_id: User ID
+            
+        Returns:
+            User instance or None
+        """
+        # Read before the query, so a change committed in between leaves
+        # the new entry stale-tagged rather than trusted
+        generation = get_generation(f"{USER_GENERATION_PREFIX}{user_id}")
+        if generation is None:
+            return AuthService.get_user_by_id(db, user_id)
+        
+        now = time.monotonic()
+        with _user_cache_lock:
+            entry = _user_cache.get(user_id)
+            if entry is not None and (entry[0] <= now or entry[1] != generation):
+                del _user_cache[user_id]
+                entry = None
+            if entry is not None:
+                _user_cache.move_to_end(user_id)
+        
+        if entry is not None:
+            user = User(**entry[2])
+            make_transient_to_detached(user)
+            return db.merge(user, load=False)
+        
+        user = AuthService.get_user_by_id(db, user_id)
+        if user is not None:
+            values = {key: getattr(user, key) for key in _USER_COLUMNS}
+            with _user_cache_lock:
+                _user_cache[user_id] = (now + USER_CACHE_TTL, generation, values)
+                while len(_user_cache) > USER_CACHE_SIZE:
+                    _user_cache.popitem(last=False)
+        return user
+    
+    @staticmethod
+    def forget_user(user_id: int):
+        """
+        Invalidate a user's cached row in every worker after changing or
+        deleting it.
+        
+        Args:
+            user_id: User ID
+        """
+        with _user_cache_lock:
+            _user_cache.pop(user_id, None)
+        bump_generation(f"{USER_GENERATION_PREFIX}{user_id}")
+    
     @staticmethod
     def get_user_by_email(db: Session, email: str) -> Optional[User]:
         """
@@ -0,0 +1,240 @@
+"""
+Two-level cache for historical candles.
+
+Closed bars never change, so history before today's open is cached for days
+while the bars of the current session are refetched every minute. Entries live in a small in-process LRU (L1) in front of Redis (L2),
+which is shared by all workers.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from datetime import datetime, time as dt_time, timedelta
+from typing import Optional, List, Dict, Any, Tuple, Callable
+
+import orjson
+import redis
+
+from app.utils.cache import get_redis, is_available
+from app.utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+CANDLE_PREFIX = "candle:"
+
+MARKET_OPEN = dt_time(9, 15)
+MARKET_CLOSE = dt_time(15, 30)
+
+# Windows reaching into today's session can still gain or update bars
+LIVE_TTL = 60
+# Windows ending before today's open are final
+CLOSED_TTL = 86400 * 7
+
+
+class CandleCache:
+    """LRU + Redis cache of historical candle windows."""
+
+    def __init__(self, maxsize: int = 1000):
+        """
+        Initialize the cache.
+
+        Args:
+            maxsize: Maximum number of windows kept in process
+        """
+        self.maxsize = maxsize
+        self._local: "OrderedDict[str, Tuple[float, List[Dict[str, Any]]]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key(instrument_token: int, interval: str, from_date: datetime, to_date: datetime) -> str:
+        """
+        Build the cache key for a candle window.
+
+        Args:
+            instrument_token: Instrument token
+            interval: Candle interval
+            from_date: Window start
+            to_date: Window end
+
+        Returns:
+            Cache key
+        """
+        return f"{CANDLE_PREFIX}{instrument_token}:{interval}:{int(from_date.timestamp())}:{int(to_date.timestamp())}"
+
+    @staticmethod
+    def session_open(to_date: datetime) -> datetime:
+        """
+        Market open of the current session, in ``to_date``'s timezone.
+
+        Args:
+            to_date: Any datetime used only for its timezone
+
+        Returns:
+            Today's open
+        """
+        return datetime.combine(datetime.now(to_date.tzinfo).date(), MARKET_OPEN, tzinfo=to_date.tzinfo)
+
+    @classmethod
+    def ttl_for(cls, to_date: datetime) -> int:
+        """
+        Time to live for a window ending at ``to_date``.
+
+        Args:
+            to_date: Window end
+
+        Returns:
+            TTL in seconds
+        """
+        return CLOSED_TTL if to_date < cls.session_open(to_date) else LIVE_TTL
+
+    def get_or_fetch(
+        self,
+        fetch: Callable[..., List[Dict[str, Any]]],
+        instrument_token: int,
+        interval: str,
+        from_date: datetime,
+        to_date: datetime,
+        ttl: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Return a candle window from cache, fetching and storing it on miss.
+
+        Empty results are usually upstream errors and are not cached.
+
+        Args:
+            fetch: MarketDataService.get_historical_data or compatible
+            instrument_token: Instrument token
+            interval: Candle interval
+            from_date: Window start
+            to_date: Window end
+            ttl: Time to live in seconds (default: ``ttl_for(to_date)``)
+
+        Returns:
+            Candles
+        """
+        key = self.key(instrument_token, interval, from_date, to_date)
+        candles = self.get(key)
+        if candles is not None:
+            return candles
+
+        candles = fetch(
+            instrument_token=instrument_token,
+            from_date=from_date,
+            to_date=to_date,
+            interval=interval
+        )
+        if candles:
+            self.set(key, candles, ttl if ttl is not None else self.ttl_for(to_date))
+        return candles
+
+    def fetch_window(
+        self,
+        fetch: Callable[..., List[Dict[str, Any]]],
+        instrument_token: int,
+        interval: str,
+        from_date: datetime,
+        to_date: datetime
+    ) -> List[Dict[str, Any]]:
+        """
+        Return a candle window, caching closed history apart from today.
+
+        A window that reaches into today's session is split at today's
+        open: the bars before it are final and cached for ``CLOSED_TTL``
+        under a key that stays the same all day, and only today's bars are
+        refetched every ``LIVE_TTL``. Day candles are not split since
+        today's bar is stamped before the open.
+
+        Args:
+            fetch: MarketDataService.get_historical_data or compatible
+            instrument_token: Instrument token
+            interval: Candle interval
+            from_date: Window start
+            to_date: Window end
+
+        Returns:
+            Candles in time order
+        """
+        session_open = self.session_open(to_date)
+        if interval == "day" or to_date < session_open or from_date >= session_open:
+            return self.get_or_fetch(fetch, instrument_token, interval, from_date, to_date)
+
+        closed = self.get_or_fetch(
+            fetch, instrument_token, interval, from_date, session_open - timedelta(seconds=1), CLOSED_TTL
+        )
+        today = self.get_or_fetch(fetch, instrument_token, interval, session_open, to_date, LIVE_TTL)
+        return closed + today
+
+    def get(self, key: str) -> Optional[List[Dict[str, Any]]]:
+        """
+        Look up a candle window.
+
+        Args:
+            key: Cache key from ``key()``
+
+        Returns:
+            Candles, or None on miss
+        """
+        now = time.monotonic()
+        with self._lock:
+            entry = self._local.get(key)
+            if entry is not None:
+                expires_at, candles = entry
+                if expires_at > now:
+                    self._local.move_to_end(key)
+                    return candles
+                del self._local[key]
+
+        if not is_available():
+            return None
+        try:
+            pipe = get_redis().pipeline()
+            pipe.get(key)
+            pipe.ttl(key)
+            raw, ttl = pipe.execute()
+        except redis.RedisError as e:
+            logger.warning(f"Candle cache read failed for {key}: {e}")
+            return None
+        if raw is None:
+            return None
+
+        candles = orjson.loads(raw)
+        for candle in candles:
+            candle["date"] = datetime.fromisoformat(candle["date"])
+        self._store_local(key, candles, max(ttl, 1))
+        return candles
+
+    def set(self, key: str, candles: List[Dict[str, Any]], ttl: int):
+        """
+        Store a candle window.
+
+        Args:
+            key: Cache key from ``key()``
+            candles: Candles as returned by MarketDataService.get_historical_data
+            ttl: Time to live in seconds
+        """
+        self._store_local(key, candles, ttl)
+        if not is_available():
+            return
+        try:
+            get_redis().setex(key, ttl, orjson.dumps(candles))
+        except redis.RedisError as e:
+            logger.warning(f"Candle cache write failed for {key}: {e}")
+
+    def _store_local(self, key: str, candles: List[Dict[str, Any]], ttl: int):
+        with self._lock:
+            self._local[key] = (time.monotonic() + ttl, candles)
+            self._local.move_to_end(key)
+            while len(self._local) > self.maxsize:
+                self._local.popitem(last=False)
+
+
+# Singleton instance
+_candle_cache: Optional[CandleCache] = None
+
+
+def get_candle_cache() -> CandleCache:
+    """Get or create the candle cache singleton."""
+    global _candle_cache
+    if _candle_cache is None:
+        _candle_cache = CandleCache()
+    return _candle_cache
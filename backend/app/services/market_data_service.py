@@ -3,8 +3,12 @@ Market data service for live trading data integration.
 This service fetches MARKET DATA ONLY - NO order placement.
 """
 
+import logging
+from collections import Counter
+from operator import itemgetter
+
 from kiteconnect import KiteConnect, KiteTicker
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Protocol
 from datetime import datetime, timedelta
 import pandas as pd
 from app.config import settings
@@ -13,6 +17,30 @@ from app.utils.logger import setup_logger
 logger = setup_logger(__name__)
 
 
+class MarketDataUnavailable(Exception):
+    """Raised when the market data API cannot serve a request."""
+
+
+class MarketDataProvider(Protocol):
+    """Market data operations the API routes and trading engine depend on."""
+    
+    def get_instruments(self, exchange: str = "NFO") -> List[Dict]: ...
+    
+    def get_historical_data(
+        self,
+        instrument_token: int,
+        from_date: datetime,
+        to_date: datetime,
+        interval: str = "5minute"
+    ) -> List[Dict]: ...
+    
+    def get_current_price(self, symbol: str) -> Optional[float]: ...
+    
+    def get_ltp(self, instruments: List[str]) -> Dict[str, float]: ...
+    
+    def get_options_chain(self, symbol: str = "NIFTY", expiry_date: Optional[str] = None) -> Dict[str, List[Dict]]: ...
+
+
 class MarketDataService:
     """
     Service for Market Data API integration.
@@ -31,7 +59,16 @@ class MarketDataService:
         """
         self.api_key = api_key or settings.MARKET_API_KEY
         self.access_token = access_token or settings.MARKET_ACCESS_TOKEN or None
-        self.kite = KiteConnect(api_key=self.api_key)
+        # Calls run concurrently from the threadpool; size the keep-alive pool
+        # so each one reuses a warm TLS connection instead of handshaking
+        self.kite = KiteConnect(
+            api_key=self.api_key,
+            pool={
+                "pool_connections": 4,
+                "pool_maxsize": settings.MARKET_HTTP_POOL_SIZE,
+                "pool_block": False,
+            }
+        )
         
         if self.access_token:
             self.kite.set_access_token(self.access_token)
@@ -85,10 +122,11 @@ class MarketDataService:
             instruments = self.kite.instruments(exchange)
             logger.info(f"Fetched {len(instruments)} instruments from {exchange}")
             
-            # Debug: Check for NIFTY BANK instruments
-            nifty_bank_count = len([i for i in instruments if i.get('name') == 'NIFTY BANK'])
-            nifty_count = len([i for i in instruments if i.get('name') == 'NIFTY'])
-            logger.info(f"📊 Instruments found - NIFTY: {nifty_count}, NIFTY BANK: {nifty_bank_count}")
+            # Debug: Check for NIFTY BANK instruments (an extra pass over the
+            # whole dump, so only when debugging)
+            if logger.isEnabledFor(logging.DEBUG):
+                names = Counter(i.get('name') for i in instruments)
+                logger.debug(f"📊 Instruments found - NIFTY: {names['NIFTY']}, NIFTY BANK: {names['NIFTY BANK']}")
             
             return instruments
         except Exception as e:
@@ -193,17 +231,20 @@ class MarketDataService:
             
         Returns:
             List of candle dictionaries
+            
+        Raises:
+            MarketDataUnavailable: If not authenticated or the API call fails
         """
-        logger.info(f"🔵 [get_historical_data] Token: {instrument_token}, Interval: {interval}")
-        logger.info(f"🔵 [get_historical_data] Date range: {from_date} to {to_date}")
-        logger.info(f"🔵 [get_historical_data] Kite instance: {self.kite is not None}")
+        logger.info("🔵 [get_historical_data] Token: %s, Interval: %s", instrument_token, interval)
+        logger.info("🔵 [get_historical_data] Date range: %s to %s", from_date, to_date)
+        logger.info("🔵 [get_historical_data] Kite instance: %s", self.kite is not None)
+        
+        if not self.kite:
+            logger.error("❌ [get_historical_data] Kite instance is None - not authenticated!")
+            raise MarketDataUnavailable("Market data API is not authenticated")
         
         try:
-            if not self.kite:
-                logger.error("❌ [get_historical_data] Kite instance is None - not authenticated!")
-                return []
-            
-            logger.info(f"🔵 [get_historical_data] Calling kite.historical_data()...")
+            logger.info("🔵 [get_historical_data] Calling kite.historical_data()...")
             historical_data = self.kite.historical_data(
                 instrument_token=instrument_token,
                 from_date=from_date,
@@ -211,7 +252,7 @@ class MarketDataService:
                 interval=interval
             )
             
-            logger.info(f"✅ [get_historical_data] Received {len(historical_data)} raw candles from Kite")
+            logger.info("✅ [get_historical_data] Received %s raw candles from Kite", len(historical_data))
             
             # Convert to list of dicts
             candles = []
@@ -225,15 +266,12 @@ class MarketDataService:
                     'volume': candle['volume']
                 })
             
-            logger.info(f"✅ [get_historical_data] Fetched {len(candles)} candles for token {instrument_token}")
+            logger.info("✅ [get_historical_data] Fetched %s candles for token %s", len(candles), instrument_token)
             return candles
         except Exception as e:
-            logger.error(f"❌ [get_historical_data] Failed to fetch historical data: {str(e)}")
-            logger.error(f"❌ [get_historical_data] Error type: {type(e).__name__}")
-            logger.error(f"❌ [get_historical_data] Full error: {repr(e)}")
-            import traceback
-            logger.error(f"❌ [get_historical_data] Traceback: {traceback.format_exc()}")
-            return []
+            logger.error("❌ [get_historical_data] Failed to fetch historical data: %s", e)
+            logger.error("❌ [get_historical_data] Error type: %s", type(e).__name__)
+            raise MarketDataUnavailable(str(e)) from e
     
     def get_current_price(self, symbol: str) -> Optional[float]:
         """
@@ -390,8 +428,8 @@ class MarketDataService:
                     pe_options.append(option_data)
             
             # Sort by strike price
-            ce_options.sort(key=lambda x: x['strike'])
-            pe_options.sort(key=lambda x: x['strike'])
+            ce_options.sort(key=itemgetter('strike'))
+            pe_options.sort(key=itemgetter('strike'))
             
             logger.info(f"Fetched options chain: {len(ce_options)} CE, {len(pe_options)} PE")
             return {'CE': ce_options, 'PE': pe_options}
@@ -405,7 +443,7 @@ class MarketDataService:
 _market_data_service: Optional[MarketDataService] = None
 
 
-def get_market_data_service() -> MarketDataService:
+def get_market_data_service() -> MarketDataProvider:
     """
     Get or create market data service singleton.
     
@@ -4,8 +4,12 @@ This engine simulates order execution using live market prices.
 NO REAL ORDERS ARE PLACED - this is for practice trading only.
 """
 
+import threading
+import time
+from collections import OrderedDict
+
 from sqlalchemy.orm import Session
-from typing import Optional, List
+from typing import Optional, List, Dict, Any, Tuple, Union
 from datetime import datetime
 
 from app.models.paper_order import PaperOrder, OrderType, OrderSide, OrderStatus, InstrumentType
@@ -18,6 +22,16 @@ from app.config import settings
 
 logger = setup_logger(__name__)
 
+# Portfolio summaries (including the wallet) per user. The dashboard reads
+# /portfolio and /wallet together; this serves both from one computation.
+# Orders placed or cancelled in this process drop the entry.
+PORTFOLIO_CACHE_TTL = 1.0
+PORTFOLIO_CACHE_SIZE = 10000
+_WALLET_COLUMNS = tuple(column.key for column in Wallet.__table__.columns)
+
+_portfolio_cache: "OrderedDict[int, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+_portfolio_cache_lock = threading.Lock()
+
 
 class PaperTradingEngine:
     """
@@ -103,6 +117,7 @@ class PaperTradingEngine:
             order.status = OrderStatus.OPEN
         
         self.db.commit()
+        self.forget_portfolio(user_id)
         self.db.refresh(order)
         
         logger.info(f"Order placed: {order.id} - {order.symbol} {order.order_side} {order.quantity} @ {current_price}")
@@ -198,6 +213,21 @@ class PaperTradingEngine:
             
             logger.info(f"Updated position: {position.symbol} qty={position.quantity} avg={position.average_price:.2f}")
     
+    @staticmethod
+    def _instrument_key(symbol: str, instrument_type: InstrumentType) -> str:
+        """
+        Market data key for a symbol.
+        
+        Args:
+            symbol: Trading symbol
+            instrument_type: Type of instrument
+            
+        Returns:
+            Exchange-qualified symbol (NSE for indices, NFO for options)
+        """
+        exchange = "NSE" if instrument_type == InstrumentType.INDEX else "NFO"
+        return f"{exchange}:{symbol}"
+    
     def _get_market_price(self, symbol: str, instrument_type: InstrumentType) -> Optional[float]:
         """
         Get current market price for a symbol.
@@ -210,14 +240,7 @@ class PaperTradingEngine:
             Current market price or None
         """
         try:
-            # For INDEX, use NSE
-            if instrument_type == InstrumentType.INDEX:
-                price = self.market_data.get_current_price(f"NSE:{symbol}")
-            else:
-                # For options, use NFO
-                price = self.market_data.get_current_price(f"NFO:{symbol}")
-            
-            return price
+            return self.market_data.get_current_price(self._instrument_key(symbol, instrument_type))
         except Exception as e:
             logger.error(f"Failed to get market price for {symbol}: {e}")
             return None
@@ -262,28 +285,46 @@ class PaperTradingEngine:
         
         order.status = OrderStatus.CANCELLED
         self.db.commit()
+        self.forget_portfolio(user_id)
         
         logger.info(f"Order cancelled: {order_id}")
         return True
     
-    def update_positions_prices(self, user_id: int):
+    def update_positions_prices(self, user_id: int) -> List[PaperPosition]:
         """
         Update current prices for all user positions.
         
+        All quotes are fetched in a single LTP call rather than one call
+        per position.
+        
         Args:
             user_id: User ID
+            
+        Returns:
+            The user's positions with refreshed prices
         """
-        positions = self.db.query(PaperPosition).filter(
-            PaperPosition.user_id == user_id
-        ).all()
+        positions = self.get_user_positions(user_id)
+        if not positions:
+            return positions
         
+        keys = {position.id: self._instrument_key(position.symbol, position.instrument_type) for position in positions}
+        prices = self.market_data.get_ltp(list(set(keys.values())))
+        
+        updated = 0
         for position in positions:
-            current_price = self._get_market_price(position.symbol, position.instrument_type)
+            current_price = prices.get(keys[position.id])
             if current_price:
                 position.update_current_price(current_price)
+                updated += 1
+        
+        if not updated:
+            return positions
         
         self.db.commit()
-        logger.info(f"Updated prices for {len(positions)} positions")
+        logger.info(f"Updated prices for {updated} of {len(positions)} positions")
+        # Commit expired the instances; reload them in one query rather than
+        # one refresh per position on first access
+        return self.get_user_positions(user_id)
     
     def get_user_orders(self, user_id: int, limit: int = 100) -> List[PaperOrder]:
         """
@@ -314,28 +355,71 @@ class PaperTradingEngine:
             PaperPosition.user_id == user_id
         ).all()
     
+    @staticmethod
+    def forget_portfolio(user_id: int):
+        """
+        Drop a user's cached portfolio summary after changing their orders.
+        
+        Args:
+            user_id: User ID
+        """
+        with _portfolio_cache_lock:
+            _portfolio_cache.pop(user_id, None)
+    
+    @staticmethod
+    def _cached_portfolio(user_id: int) -> Optional[Dict[str, Any]]:
+        now = time.monotonic()
+        with _portfolio_cache_lock:
+            entry = _portfolio_cache.get(user_id)
+            if entry is None:
+                return None
+            if entry[0] <= now:
+                del _portfolio_cache[user_id]
+                return None
+            _portfolio_cache.move_to_end(user_id)
+            return entry[1]
+    
+    def get_wallet(self, user_id: int) -> Optional[Union[Wallet, Dict[str, Any]]]:
+        """
+        Get user's wallet, from the cached portfolio summary if fresh.
+        
+        Args:
+            user_id: User ID
+            
+        Returns:
+            Wallet instance or column values, or None if the user has no wallet
+        """
+        summary = self._cached_portfolio(user_id)
+        if summary is not None:
+            return summary['wallet']
+        return self.db.query(Wallet).filter(Wallet.user_id == user_id).first()
+    
     def get_portfolio_summary(self, user_id: int) -> dict:
         """
         Get user's portfolio summary.
         
+        Summaries are cached for PORTFOLIO_CACHE_TTL seconds.
+        
         Args:
             user_id: User ID
             
         Returns:
-            Portfolio summary dictionary
+            Portfolio summary dictionary, including the wallet
         """
-        wallet = self.db.query(Wallet).filter(Wallet.user_id == user_id).first()
-        positions = self.get_user_positions(user_id)
+        summary = self._cached_portfolio(user_id)
+        if summary is not None:
+            return summary
         
         # Update position prices
-        self.update_positions_prices(user_id)
+        positions = self.update_positions_prices(user_id)
+        wallet = self.db.query(Wallet).filter(Wallet.user_id == user_id).first()
         
         # Calculate metrics
         invested_amount = sum(abs(p.quantity) * p.average_price for p in positions)
         total_pnl = sum(p.total_pnl for p in positions)
         total_balance = wallet.balance + invested_amount + total_pnl
         
-        return {
+        summary = {
             'total_balance': total_balance,
             'available_balance': wallet.balance,
             'invested_amount': invested_amount,
@@ -345,5 +429,12 @@ class PaperTradingEngine:
             'total_trades': self.db.query(PaperOrder).filter(
                 PaperOrder.user_id == user_id,
                 PaperOrder.status == OrderStatus.EXECUTED
-            ).count()
+            ).count(),
+            'wallet': {key: getattr(wallet, key) for key in _WALLET_COLUMNS}
         }
+        
+        with _portfolio_cache_lock:
+            _portfolio_cache[user_id] = (time.monotonic() + PORTFOLIO_CACHE_TTL, summary)
+            while len(_portfolio_cache) > PORTFOLIO_CACHE_SIZE:
+                _portfolio_cache.popitem(last=False)
+        return summary
@@ -0,0 +1,88 @@
+"""
+Periodic refresh of pre-aggregated materialized views.
+"""
+
+import asyncio
+from typing import Optional, Sequence
+
+from sqlalchemy import text
+
+from app.db import SessionLocal
+from app.utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+# Arbitrary key shared by all workers so only one refreshes at a time
+REFRESH_LOCK_KEY = 7301
+
+
+class MaterializedViewRefresher:
+    """Refreshes materialized views on a fixed interval in the background."""
+
+    def __init__(self, views: Sequence[str], interval: float = 60.0):
+        """
+        Initialize the refresher.
+
+        Args:
+            views: Materialized view names (each needs a unique index)
+            interval: Seconds between refreshes
+        """
+        self.views = tuple(views)
+        self.interval = interval
+        self._task: Optional[asyncio.Task] = None
+
+    @property
+    def is_running(self) -> bool:
+        """Whether the background refresh task is running."""
+        return self._task is not None and not self._task.done()
+
+    def start(self):
+        """Start the background refresh task on the running event loop."""
+        if self.is_running:
+            return
+        self._task = asyncio.get_running_loop().create_task(self._run())
+        logger.info(f"Materialized view refresher started for {', '.join(self.views)}")
+
+    async def stop(self):
+        """Stop the background refresh task."""
+        if not self.is_running:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    def refresh(self):
+        """Refresh every view now, unless another worker already is."""
+        db = SessionLocal()
+        try:
+            # Transaction-scoped, so it is released on commit or rollback
+            if not db.execute(text("SELECT pg_try_advisory_xact_lock(:key)"), {"key": REFRESH_LOCK_KEY}).scalar():
+                return
+            for view in self.views:
+                db.execute(text(f"REFRESH MATERIALIZED VIEW CONCURRENTLY {view}"))
+            db.commit()
+        except Exception as e:
+            db.rollback()
+            logger.error(f"Failed to refresh materialized views: {e}")
+        finally:
+            db.close()
+
+    async def _run(self):
+        while True:
+            await asyncio.sleep(self.interval)
+            await asyncio.to_thread(self.refresh)
+
+
+# Singleton instance
+_stats_refresher: Optional[MaterializedViewRefresher] = None
+
+
+def get_stats_refresher() -> MaterializedViewRefresher:
+    """Get or create the stats view refresher singleton."""
+    global _stats_refresher
+    if _stats_refresher is None:
+        _stats_refresher = MaterializedViewRefresher(["mv_tournament_stats"])
+    return _stats_refresher
@@ -2,7 +2,8 @@
 Team service for managing team tournaments.
 """
 
-from sqlalchemy.orm import Session
+from sqlalchemy import Row
+from sqlalchemy.orm import Session, joinedload, selectinload, raiseload
 from typing import List, Optional
 from datetime import datetime, timezone
 
@@ -11,6 +12,20 @@ from app.models.team_member import TeamMember, MemberRole
 from app.models.tournament import Tournament, TournamentType, TournamentStatus
 from app.models.tournament_participant import TournamentParticipant
 from app.models.user import User
+from app.config import settings
+
+# Eager loads for team responses, which list every member's username and
+# the captain's: one SELECT for the members and their users (IN on the team
+# ids) instead of one per member. Only usernames are read, so the rest of
+# each user row (password hash, email, ...) is not fetched.
+TEAM_DETAIL_OPTIONS = (
+    selectinload(Team.members).joinedload(TeamMember.user).load_only(User.username),
+    joinedload(Team.captain).load_only(User.username),
+)
+# When enabled, touching any other relationship of these teams raises
+# instead of silently issuing a lazy SELECT per team
+if settings.RAISE_ON_LAZY_LOAD:
+    TEAM_DETAIL_OPTIONS += (raiseload("*"),)
 
 
 class TeamService:
@@ -81,23 +96,63 @@ class TeamService:
         
         return team
     
-    def get_team(self, team_id: int) -> Optional[Team]:
-        """Get team by ID."""
-        return self.db.query(Team).filter(Team.id == team_id).first()
+    def get_team(self, team_id: int, with_details: bool = False) -> Optional[Team]:
+        """
+        Get team by ID.
+        
+        Args:
+            team_id: Team ID
+            with_details: Eagerly load members, their users, the captain and the tournament
+            
+        Returns:
+            Team or None
+        """
+        query = self.db.query(Team)
+        if with_details:
+            query = query.options(*TEAM_DETAIL_OPTIONS, joinedload(Team.tournament))
+        return query.filter(Team.id == team_id).first()
     
     def get_tournament_teams(self, tournament_id: int) -> List[Team]:
-        """Get all teams for a tournament."""
-        return self.db.query(Team).filter(Team.tournament_id == tournament_id).all()
+        """Get all teams for a tournament, with members and captains loaded."""
+        return self.db.query(Team).options(*TEAM_DETAIL_OPTIONS).filter(
+            Team.tournament_id == tournament_id
+        ).all()
+    
+    def get_tournament_team_summaries(self, tournament_id: int) -> List[Row]:
+        """
+        Get team cards for a tournament without loading any members.
+        
+        Member counts and the full flag are stored on the team, so one
+        SELECT joined to the captain and tournament covers every team.
+        
+        Args:
+            tournament_id: Tournament ID
+            
+        Returns:
+            Rows with the TeamResponse fields except members
+        """
+        return self.db.query(
+            Team.id,
+            Team.tournament_id,
+            Team.name,
+            Team.description,
+            Team.captain_id,
+            User.username.label("captain_username"),
+            Team.is_full,
+            Team.total_members,
+            Tournament.team_size.label("max_members"),
+            Team.created_at
+        ).join(User, User.id == Team.captain_id).join(Tournament, Tournament.id == Team.tournament_id).filter(
+            Team.tournament_id == tournament_id
+        ).all()
     
     def get_user_team(self, tournament_id: int, user_id: int) -> Optional[Team]:
-        """Get user's team for a specific tournament."""
-        membership = self.db.query(TeamMember).join(Team).filter(
+        """Get user's team for a specific tournament, with members, captain and tournament loaded."""
+        return self.db.query(Team).join(TeamMember).options(*TEAM_DETAIL_OPTIONS, joinedload(Team.tournament)).filter(
             Team.tournament_id == tournament_id,
             TeamMember.user_id == user_id,
             TeamMember.is_active == True
         ).first()
-        
-        return membership.team if membership else None
     
     def join_team(self, team_id: int, user_id: int) -> TeamMember:
         """
@@ -282,19 +337,18 @@ class TeamService:
         if team.captain_id != current_captain_id:
             raise ValueError("Only the current captain can transfer captaincy")
         
-        # Get current and new captain members
-        current_member = self.db.query(TeamMember).filter(
-            TeamMember.team_id == team_id,
-            TeamMember.user_id == current_captain_id
-        ).first()
-        
-        new_member = self.db.query(TeamMember).filter(
-            TeamMember.team_id == team_id,
-            TeamMember.user_id == new_captain_id,
-            TeamMember.is_active == True
-        ).first()
-        
-        if not new_member:
+        # Get current and new captain members in one query
+        members = {
+            member.user_id: member
+            for member in self.db.query(TeamMember).filter(
+                TeamMember.team_id == team_id,
+                TeamMember.user_id.in_((current_captain_id, new_captain_id))
+            )
+        }
+        current_member = members.get(current_captain_id)
+        new_member = members.get(new_captain_id)
+        
+        if not new_member or not new_member.is_active:
             raise ValueError("New captain must be a member of the team")
         
         # Update roles
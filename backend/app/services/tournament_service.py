@@ -3,9 +3,8 @@ Tournament service for managing trading competitions.
 """
 
 from sqlalchemy.orm import Session
-from sqlalchemy import desc
-from typing import List, Optional
-from datetime import datetime
+from sqlalchemy import desc, text
+from typing import List, Optional, Tuple
 
 from app.models.tournament import Tournament, TournamentStatus, TournamentType
 from app.models.tournament_participant import TournamentParticipant
@@ -16,6 +15,14 @@ from app.utils.logger import setup_logger
 
 logger = setup_logger(__name__)
 
+# Cached tournament lists (admin and public) embed this cache generation;
+# every tournament mutation bumps it
+TOURNAMENT_LIST_GENERATION = "tournaments"
+
+
+class TournamentBusyError(Exception):
+    """Raised when another transaction is already changing a tournament's state."""
+
 
 class TournamentService:
     """Service for tournament management and leaderboard."""
@@ -80,7 +87,7 @@ class TournamentService:
             return None
         
         # Update fields
-        for field, value in update_data.dict(exclude_unset=True).items():
+        for field, value in update_data.model_dump(exclude_unset=True).items():
             setattr(tournament, field, value)
         
         self.db.commit()
@@ -192,40 +199,78 @@ class TournamentService:
             TournamentParticipant.tournament_id == tournament_id
         ).order_by(desc(TournamentParticipant.total_pnl)).all()
         
-        # Update rankings
+        # Load existing rankings in one query instead of one per participant
+        existing = {
+            user_id: ranking_id
+            for ranking_id, user_id in self.db.query(TournamentRanking.id, TournamentRanking.user_id).filter(
+                TournamentRanking.tournament_id == tournament_id
+            )
+        }
+        
+        updates = []
+        inserts = []
         for rank, participant in enumerate(participants, start=1):
-            ranking = self.db.query(TournamentRanking).filter(
-                TournamentRanking.tournament_id == tournament_id,
-                TournamentRanking.user_id == participant.user_id
-            ).first()
+            if participant.user_id is None:
+                continue  # Team entries have no per-user ranking row
             
-            if ranking:
-                ranking.rank = rank
-                ranking.total_pnl = participant.total_pnl
-                ranking.roi = participant.roi
-                ranking.total_trades = participant.total_trades
-                ranking.win_rate = participant.win_rate
-                ranking.current_balance = participant.current_balance
+            row = {
+                "rank": rank,
+                "total_pnl": participant.total_pnl,
+                "roi": participant.roi,
+                "total_trades": participant.total_trades,
+                "win_rate": participant.win_rate,
+                "current_balance": participant.current_balance
+            }
+            ranking_id = existing.get(participant.user_id)
+            if ranking_id is not None:
+                row["id"] = ranking_id
+                updates.append(row)
+            else:
+                row["tournament_id"] = tournament_id
+                row["user_id"] = participant.user_id
+                inserts.append(row)
+        
+        # Write all rankings as two batched statements
+        if updates:
+            self.db.bulk_update_mappings(TournamentRanking, updates)
+        if inserts:
+            self.db.bulk_insert_mappings(TournamentRanking, inserts)
         
         self.db.commit()
         logger.info(f"Updated rankings for tournament {tournament_id}")
     
-    def get_leaderboard(self, tournament_id: int, limit: int = 100) -> List[TournamentRanking]:
+    def refresh_user_performance(self):
+        """
+        Refresh the mv_user_performance materialized view.
+        
+        Uses CONCURRENTLY so top-performer reads are not blocked meanwhile.
+        """
+        try:
+            self.db.execute(text("REFRESH MATERIALIZED VIEW CONCURRENTLY mv_user_performance"))
+            self.db.commit()
+        except Exception as e:
+            self.db.rollback()
+            logger.error(f"Failed to refresh mv_user_performance: {e}")
+    
+    def get_leaderboard(self, tournament_id: int, limit: int = 100) -> List[Tuple[TournamentRanking, Optional[str]]]:
         """
         Get tournament leaderboard.
         
+        Usernames are joined in the same query rather than looked up per
+        ranking.
+        
         Args:
             tournament_id: Tournament ID
             limit: Maximum number of entries
             
         Returns:
-            List of TournamentRanking instances
+            List of (TournamentRanking, username) rows in rank order
         """
-        rankings = self.db.query(TournamentRanking).filter(
+        return self.db.query(TournamentRanking, User.username).outerjoin(
+            User, User.id == TournamentRanking.user_id
+        ).filter(
             TournamentRanking.tournament_id == tournament_id
         ).order_by(TournamentRanking.rank).limit(limit).all()
-        
-        return rankings
     
     def get_user_rank(self, tournament_id: int, user_id: int) -> Optional[TournamentRanking]:
         """
@@ -266,6 +311,30 @@ class TournamentService:
         """
         return self.db.query(Tournament).filter(Tournament.id == tournament_id).first()
     
+    def _lock_tournament(self, tournament_id: int) -> Optional[Tournament]:
+        """
+        Fetch a tournament with a row lock, without waiting on other lockers.
+        
+        Args:
+            tournament_id: Tournament ID
+            
+        Returns:
+            Locked Tournament or None if it does not exist
+            
+        Raises:
+            TournamentBusyError: If another transaction holds the row lock
+        """
+        tournament = self.db.query(Tournament).filter(
+            Tournament.id == tournament_id
+        ).with_for_update(skip_locked=True).first()
+        
+        if tournament is None:
+            exists = self.db.query(Tournament.id).filter(Tournament.id == tournament_id).first()
+            if exists:
+                raise TournamentBusyError(f"Tournament {tournament_id} is already being updated")
+        
+        return tournament
+    
     def get_user_tournaments(self, user_id: int) -> List[Tournament]:
         """
         Get tournaments user is participating in.
@@ -295,8 +364,11 @@ class TournamentService:
             
         Returns:
             True if started, False otherwise
+            
+        Raises:
+            TournamentBusyError: If the tournament is locked by another request
         """
-        tournament = self.get_tournament_by_id(tournament_id)
+        tournament = self._lock_tournament(tournament_id)
         if not tournament:
             return False
         
@@ -315,8 +387,11 @@ class TournamentService:
             
         Returns:
             True if ended, False otherwise
+            
+        Raises:
+            TournamentBusyError: If the tournament is locked by another request
         """
-        tournament = self.get_tournament_by_id(tournament_id)
+        tournament = self._lock_tournament(tournament_id)
         if not tournament:
             return False
         
@@ -327,5 +402,7 @@ class TournamentService:
         
         self.db.commit()
         
+        self.refresh_user_performance()
+        
         logger.info(f"Tournament ended: {tournament_id}")
         return True
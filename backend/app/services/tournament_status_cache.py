@@ -0,0 +1,140 @@
+"""
+In-process cache of live tournament ids kept fresh by PostgreSQL LISTEN/NOTIFY.
+
+A trigger on the tournaments table publishes every status change on the
+``tournament_status`` channel; a listener thread applies those changes to an
+in-memory set so hot read paths can skip the ``status IN (...)`` scan.
+"""
+
+import select
+import threading
+from typing import Optional, Set
+
+from psycopg2.extensions import ISOLATION_LEVEL_AUTOCOMMIT
+
+from app.db import engine, SessionLocal
+from app.models.tournament import Tournament, TournamentStatus
+from app.utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+CHANNEL = "tournament_status"
+LIVE_STATUSES = frozenset({TournamentStatus.REGISTRATION_OPEN.value, TournamentStatus.ACTIVE.value})
+
+
+class ActiveTournamentCache:
+    """Set of live (registration open or active) tournament ids."""
+
+    def __init__(self, poll_timeout: float = 5.0):
+        """
+        Initialize the cache.
+
+        Args:
+            poll_timeout: Seconds to block waiting for notifications per loop
+        """
+        self.poll_timeout = poll_timeout
+        self._ids: Set[int] = set()
+        self._lock = threading.Lock()
+        self._ready = False
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def is_ready(self) -> bool:
+        """Whether the cache is loaded and being kept in sync."""
+        return self._ready and self._thread is not None and self._thread.is_alive()
+
+    def ids(self) -> Set[int]:
+        """Return a snapshot of live tournament ids."""
+        with self._lock:
+            return set(self._ids)
+
+    def count(self) -> Optional[int]:
+        """
+        Number of live tournaments.
+
+        Returns:
+            Count, or None if the cache is not in sync and callers should query
+        """
+        if not self.is_ready:
+            return None
+        with self._lock:
+            return len(self._ids)
+
+    def start(self):
+        """Start the listener thread."""
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="tournament-status-listener", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """Stop the listener thread."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=self.poll_timeout + 1)
+        self._thread = None
+        self._ready = False
+
+    def _reload(self):
+        db = SessionLocal()
+        try:
+            ids = {
+                tournament_id for (tournament_id,) in db.query(Tournament.id).filter(Tournament.is_live == True)
+            }
+        finally:
+            db.close()
+        with self._lock:
+            self._ids = ids
+
+    def _apply(self, payload: str):
+        tournament_id, _, status = payload.partition(":")
+        tournament_id = int(tournament_id)
+        with self._lock:
+            if status in LIVE_STATUSES:
+                self._ids.add(tournament_id)
+            else:
+                self._ids.discard(tournament_id)
+
+    def _run(self):
+        while not self._stop.is_set():
+            raw = None
+            try:
+                raw = engine.raw_connection()
+                conn = raw.driver_connection
+                conn.set_isolation_level(ISOLATION_LEVEL_AUTOCOMMIT)
+                with conn.cursor() as cursor:
+                    cursor.execute(f"LISTEN {CHANNEL}")
+
+                # Load after LISTEN so no change between the two is missed
+                self._reload()
+                self._ready = True
+                logger.info(f"Active tournament cache loaded with {len(self._ids)} tournaments")
+
+                while not self._stop.is_set():
+                    if select.select([conn], [], [], self.poll_timeout) == ([], [], []):
+                        continue
+                    conn.poll()
+                    while conn.notifies:
+                        self._apply(conn.notifies.pop(0).payload)
+            except Exception as e:
+                self._ready = False
+                logger.error(f"Active tournament listener error: {e}")
+                self._stop.wait(self.poll_timeout)
+            finally:
+                if raw is not None:
+                    # Never return a LISTENing autocommit connection to the pool
+                    raw.invalidate()
+
+
+# Singleton instance
+_active_tournament_cache: Optional[ActiveTournamentCache] = None
+
+
+def get_active_tournament_cache() -> ActiveTournamentCache:
+    """Get or create the active tournament cache singleton."""
+    global _active_tournament_cache
+    if _active_tournament_cache is None:
+        _active_tournament_cache = ActiveTournamentCache()
+    return _active_tournament_cache
@@ -0,0 +1,278 @@
+"""
+Redis-backed response caching helpers.
+"""
+
+import json
+import threading
+import time
+from functools import wraps
+from typing import Any, Callable, Optional
+
+import redis
+
+from app.config import settings
+from app.utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+CACHE_PREFIX = "cache:"
+LOCK_PREFIX = "lock:"
+GENERATION_PREFIX = "gen:"
+
+# After a Redis failure, skip the cache for this many seconds rather than
+# paying the socket timeout on every request
+UNAVAILABLE_BACKOFF = 30.0
+
+_redis_client: Optional[redis.Redis] = None
+_unavailable_until = 0.0
+
+
+def get_redis() -> redis.Redis:
+    """
+    Get the shared Redis client.
+
+    Returns:
+        Redis client (connections are pooled and opened lazily)
+    """
+    global _redis_client
+    if _redis_client is None:
+        _redis_client = redis.Redis.from_url(
+            settings.REDIS_URL,
+            socket_timeout=0.5,
+            socket_connect_timeout=0.5,
+        )
+    return _redis_client
+
+
+def is_available() -> bool:
+    """Whether the cache should be tried (no recent Redis failure)."""
+    return time.monotonic() >= _unavailable_until
+
+
+def _mark_unavailable(e: Exception):
+    global _unavailable_until
+    _unavailable_until = time.monotonic() + UNAVAILABLE_BACKOFF
+    logger.warning(f"Redis unavailable, bypassing cache for {UNAVAILABLE_BACKOFF:.0f}s: {e}")
+
+
+def check_connection() -> bool:
+    """
+    Ping Redis, bypassing the cache for a while if it is unreachable.
+    
+    Returns:
+        True if Redis answered
+    """
+    try:
+        get_redis().ping()
+        return True
+    except redis.RedisError as e:
+        _mark_unavailable(e)
+        return False
+
+
+def cache_get(key: str) -> Optional[Any]:
+    """
+    Read a JSON value from the cache.
+
+    Args:
+        key: Cache key (without prefix)
+
+    Returns:
+        Cached value or None on miss or Redis error
+    """
+    if not is_available():
+        return None
+    try:
+        raw = get_redis().get(CACHE_PREFIX + key)
+    except redis.RedisError as e:
+        _mark_unavailable(e)
+        return None
+    return json.loads(raw) if raw is not None else None
+
+
+def cache_set(key: str, value: Any, ttl: int):
+    """
+    Store a JSON-serializable value in the cache.
+
+    Args:
+        key: Cache key (without prefix)
+        value: Value to store
+        ttl: Time to live in seconds
+    """
+    if not is_available():
+        return
+    try:
+        get_redis().setex(CACHE_PREFIX + key, ttl, json.dumps(value, default=str))
+    except redis.RedisError as e:
+        _mark_unavailable(e)
+
+
+def cache_get_raw(key: str) -> Optional[bytes]:
+    """
+    Read a pre-encoded value from the cache.
+    
+    Args:
+        key: Cache key (without prefix)
+        
+    Returns:
+        Stored bytes or None on miss or Redis error
+    """
+    if not is_available():
+        return None
+    try:
+        return get_redis().get(CACHE_PREFIX + key)
+    except redis.RedisError as e:
+        _mark_unavailable(e)
+        return None
+
+
+def cache_set_raw(key: str, value: bytes, ttl: int):
+    """
+    Store a pre-encoded value in the cache.
+    
+    Args:
+        key: Cache key (without prefix)
+        value: Encoded value
+        ttl: Time to live in seconds
+    """
+    if not is_available():
+        return
+    try:
+        get_redis().setex(CACHE_PREFIX + key, ttl, value)
+    except redis.RedisError as e:
+        _mark_unavailable(e)
+
+
+def invalidate(*keys: str):
+    """
+    Drop cached values.
+
+    Args:
+        keys: Cache keys (without prefix)
+    """
+    if not is_available():
+        return
+    try:
+        get_redis().delete(*(CACHE_PREFIX + key for key in keys))
+    except redis.RedisError as e:
+        _mark_unavailable(e)
+
+
+def get_generation(name: str) -> Optional[int]:
+    """
+    Read a resource's cache generation.
+    
+    Cache keys that embed the generation are invalidated all at once by
+    bump_generation, without scanning for them.
+    
+    Args:
+        name: Resource name
+        
+    Returns:
+        Current generation, or None if Redis is unavailable
+    """
+    if not is_available():
+        return None
+    try:
+        return int(get_redis().get(GENERATION_PREFIX + name) or 0)
+    except redis.RedisError as e:
+        _mark_unavailable(e)
+        return None
+
+
+def bump_generation(name: str):
+    """
+    Invalidate every cache entry keyed on a resource's generation.
+    
+    Args:
+        name: Resource name
+    """
+    try:
+        get_redis().incr(GENERATION_PREFIX + name)
+    except redis.RedisError as e:
+        logger.warning(f"Cache generation bump failed for {name}: {e}")
+
+
+def cache_response(key: str, ttl: int = 15) -> Callable:
+    """
+    Cache a sync endpoint's JSON-serializable return value in Redis.
+
+    The key is fixed, so only use this for endpoints whose response does
+    not depend on the caller or query parameters. Redis errors fall back
+    to calling the endpoint.
+
+    Args:
+        key: Cache key (without prefix)
+        ttl: Time to live in seconds
+    """
+    def decorator(func: Callable) -> Callable:
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            cached = cache_get(key)
+            if cached is not None:
+                return cached
+
+            result = func(*args, **kwargs)
+            cache_set(key, result, ttl)
+            return result
+        return wrapper
+    return decorator
+
+
+def cache_swr(key: str, fresh: int = 60, stale: int = 600) -> Callable:
+    """
+    Stale-while-revalidate cache for an expensive zero-argument function.
+    
+    Values younger than ``fresh`` seconds are returned as is. Older values
+    are still returned, but trigger one background recompute (guarded by a
+    Redis lock across workers). Values older than ``stale`` seconds expire
+    and the next caller recomputes inline. Redis errors fall back to
+    calling the function.
+    
+    The function runs outside the request, so it must open its own
+    database session.
+    
+    Args:
+        key: Cache key (without prefix)
+        fresh: Seconds a value is served without revalidating
+        stale: Seconds a value is kept at all
+    """
+    def decorator(func: Callable[[], Any]) -> Callable[[], Any]:
+        def refresh() -> Any:
+            result = func()
+            cache_set(key, {"generated_at": time.time(), "body": result}, stale)
+            return result
+        
+        def refresh_in_background():
+            try:
+                # One refresher at a time across all workers
+                if not get_redis().set(LOCK_PREFIX + key, 1, nx=True, ex=fresh):
+                    return
+            except redis.RedisError as e:
+                logger.warning(f"Cache lock failed for {key}: {e}")
+                return
+            
+            def run():
+                try:
+                    refresh()
+                except Exception as e:
+                    logger.error(f"Background refresh failed for {key}: {e}")
+                finally:
+                    try:
+                        get_redis().delete(LOCK_PREFIX + key)
+                    except redis.RedisError:
+                        pass
+            
+            threading.Thread(target=run, name=f"swr-{key}", daemon=True).start()
+        
+        @wraps(func)
+        def wrapper() -> Any:
+            cached = cache_get(key)
+            if cached is None:
+                return refresh()
+            
+            if time.time() - cached["generated_at"] > fresh:
+                refresh_in_background()
+            return cached["body"]
+        return wrapper
+    return decorator
@@ -2,10 +2,25 @@
 JWT utilities for token creation and validation.
 """
 
+import hashlib
+import threading
+import time
+from collections import OrderedDict
 from datetime import datetime, timedelta
-from typing import Optional
+from typing import Optional, Tuple
 from jose import JWTError, jwt
 from app.config import settings
+from app.utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+# Verified tokens by digest, so repeat requests skip the signature check.
+# Entries never outlive the token's own expiry.
+TOKEN_CACHE_SIZE = 10000
+TOKEN_CACHE_TTL = 60
+
+_token_cache: "OrderedDict[bytes, Tuple[int, float]]" = OrderedDict()
+_token_cache_lock = threading.Lock()
 
 
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -> str:
@@ -42,17 +57,14 @@ def decode_access_token(token: str) -> Optional[dict]:
     Returns:
         Decoded payload dictionary or None if invalid
     """
-    from app.utils.logger import setup_logger
-    logger = setup_logger(__name__)
-    
     try:
         payload = jwt.decode(token, settings.JWT_SECRET, algorithms=[settings.JWT_ALGORITHM])
         return payload
     except JWTError as e:
-        logger.error(f"❌ [JWT] Decode error: {type(e).__name__}: {str(e)}")
+        logger.error("❌ [JWT] Decode error: %s: %s", type(e).__name__, e)
         return None
     except Exception as e:
-        logger.error(f"❌ [JWT] Unexpected decode error: {e}")
+        logger.error("❌ [JWT] Unexpected decode error: %s", e)
         return None
 
 
@@ -60,17 +72,27 @@ def verify_token(token: str) -> Optional[int]:
     """
     Verify token and extract user ID.
     
+    Successful verifications are cached in process for up to
+    TOKEN_CACHE_TTL seconds (never past the token's expiry).
+    
     Args:
         token: JWT token string
         
     Returns:
         User ID if token is valid, None otherwise
     """
-    from app.utils.logger import setup_logger
-    logger = setup_logger(__name__)
+    digest = hashlib.blake2b(token.encode(), digest_size=16).digest()
+    now = time.time()
+    with _token_cache_lock:
+        entry = _token_cache.get(digest)
+        if entry is not None:
+            user_id, expires_at = entry
+            if expires_at > now:
+                _token_cache.move_to_end(digest)
+                return user_id
+            del _token_cache[digest]
     
-    logger.info(f"🔍 [JWT] Verifying token (length: {len(token)})")
-    logger.info(f"🔍 [JWT] Token preview: {token[:50]}...")
+    logger.debug("🔍 [JWT] Verifying token (length: %s)", len(token))
     
     try:
         payload = decode_access_token(token)
@@ -78,20 +100,26 @@ def verify_token(token: str) -> Optional[int]:
             logger.error("❌ [JWT] Token decode returned None")
             return None
         
-        logger.info(f"✅ [JWT] Decoded payload: {payload}")
+        logger.debug("✅ [JWT] Decoded payload: %s", payload)
         
         user_id: Optional[int] = payload.get("sub")
         if user_id is None:
-            logger.error(f"❌ [JWT] No 'sub' field in payload: {payload}")
+            logger.error("❌ [JWT] No 'sub' field in payload: %s", payload)
             return None
         
         # Convert to int if it's a string
         if isinstance(user_id, str):
-            logger.info(f"🔍 [JWT] Converting string user_id '{user_id}' to int")
+            logger.debug("🔍 [JWT] Converting string user_id '%s' to int", user_id)
             user_id = int(user_id)
         
-        logger.info(f"✅ [JWT] Token valid for user {user_id}")
+        logger.debug("✅ [JWT] Token valid for user %s", user_id)
+        
+        expires_at = min(now + TOKEN_CACHE_TTL, payload.get("exp", now + TOKEN_CACHE_TTL))
+        with _token_cache_lock:
+            _token_cache[digest] = (user_id, expires_at)
+            while len(_token_cache) > TOKEN_CACHE_SIZE:
+                _token_cache.popitem(last=False)
         return user_id
     except Exception as e:
-        logger.error(f"❌ [JWT] Token verification exception: {e}")
+        logger.error("❌ [JWT] Token verification exception: %s", e)
         return None
@@ -0,0 +1,108 @@
+"""
+Admin list endpoints: offset and keyset pagination.
+"""
+
+import json
+from datetime import datetime, timedelta, timezone
+
+from app.api.admin import get_all_users, get_audit_log
+from app.models.admin_action import AdminAction
+from app.models.user import User
+from app.services.admin_service import AdminService
+
+
+def _add_users(db, count):
+    for i in range(count):
+        db.add(User(email=f"user{i}@example.com", username=f"user{i}", password_hash="x"))
+    db.commit()
+
+
+def _add_actions(db, count, admin_user_id=1):
+    start = datetime(2025, 1, 1, tzinfo=timezone.utc)
+    for i in range(count):
+        db.add(AdminAction(
+            admin_user_id=admin_user_id,
+            action_type="UPDATE_USER",
+            target_type="USER",
+            target_id=i,
+            description=f"action {i}",
+            created_at=start + timedelta(minutes=i),
+        ))
+    db.commit()
+
+
+def _list_users(db, **params):
+    params = {"limit": 100, "offset": 0, "before_id": None, "is_active": None,
+              "is_admin": None, "search": None, **params}
+    response = get_all_users(current_user=None, db=db, **params)
+    return json.loads(response.body)
+
+
+def test_users_without_cursor_pages_by_offset(db):
+    _add_users(db, 5)
+
+    body = _list_users(db, limit=2, offset=2)
+
+    assert [user["id"] for user in body["users"]] == [3, 2]
+    assert body["total_count"] == 5
+    assert body["page"] == 2
+    assert body["next_cursor"] == 2
+
+
+def test_users_with_cursor_pages_by_id(db):
+    _add_users(db, 5)
+
+    body = _list_users(db, limit=2, before_id=3)
+
+    assert [user["id"] for user in body["users"]] == [2, 1]
+    assert body["total_count"] == 5
+
+
+def test_recent_activity_without_cursor_pages_by_offset(db):
+    _add_users(db, 1)
+    _add_actions(db, 5)
+
+    result = AdminService(db).get_recent_activity(limit=2, offset=2)
+
+    assert [item.id for item in result["activities"]] == [3, 2]
+    assert [item.username for item in result["activities"]] == ["user0", "user0"]
+    assert result["total_count"] == 5
+    assert result["next_cursor"] == 2
+
+
+def test_recent_activity_with_cursor_pages_by_id(db):
+    _add_actions(db, 5)
+
+    result = AdminService(db).get_recent_activity(limit=2, before_id=3)
+
+    assert [item.id for item in result["activities"]] == [2, 1]
+    assert [item.username for item in result["activities"]] == ["Unknown", "Unknown"]
+    assert result["total_count"] == 5
+
+
+def _list_audit_log(db, **params):
+    params = {"limit": 100, "offset": 0, "cursor": None, "action_type": None,
+              "admin_user_id": None, **params}
+    return get_audit_log(current_user=None, db=db, **params)
+
+
+def test_audit_log_without_cursor_pages_by_offset(db):
+    _add_users(db, 1)
+    _add_actions(db, 5)
+
+    result = _list_audit_log(db, limit=2, offset=2, action_type="UPDATE_USER")
+
+    assert [action.id for action in result.actions] == [3, 2]
+    assert {action.admin_username for action in result.actions} == {"user0"}
+    assert result.total_count == 5
+    assert result.next_cursor is not None
+
+
+def test_audit_log_cursor_continues_offset_page(db):
+    _add_actions(db, 5)
+
+    first = _list_audit_log(db, limit=2)
+    second = _list_audit_log(db, limit=2, cursor=first.next_cursor)
+
+    assert [action.id for action in first.actions + second.actions] == [5, 4, 3, 2]
+    assert second.total_count == 5
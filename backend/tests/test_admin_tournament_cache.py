@@ -0,0 +1,38 @@
+"""
+Admin tournament list: stale fallback when the database fails.
+"""
+
+import pytest
+from sqlalchemy.exc import OperationalError
+
+from app.api import admin
+
+
+class _FailingSession:
+    def execute(self, *args, **kwargs):
+        raise OperationalError("SELECT", {}, Exception("connection refused"))
+
+
+@pytest.fixture
+def fake_cache(monkeypatch):
+    store = {}
+    monkeypatch.setattr(admin, "get_generation", lambda name: 1)
+    monkeypatch.setattr(admin, "cache_get", store.get)
+    monkeypatch.setattr(admin, "cache_set", lambda key, value, ttl: store.__setitem__(key, value))
+    return store
+
+
+def _list_tournaments(db):
+    return admin.get_all_tournaments(status_filter=None, limit=100, offset=0, current_user=None, db=db)
+
+
+def test_serves_last_page_when_database_fails(fake_cache):
+    last_page = [{"id": 1, "name": "Weekly"}]
+    fake_cache["admin:tournaments:stale:None:100:0"] = last_page
+
+    assert _list_tournaments(_FailingSession()) == last_page
+
+
+def test_raises_without_a_stale_page(fake_cache):
+    with pytest.raises(OperationalError):
+        _list_tournaments(_FailingSession())